@@ -0,0 +1,22 @@
+# agent/src/ai/actions.py
+
+from typing import Literal, Optional
+from pydantic import BaseModel
+
+# Pydantic models for actions
+class DelegateAction(BaseModel):
+    type: Literal["delegate"] = "delegate"
+    dao_slug: str
+    token_address: str
+    amount: str
+    delegate_to: str
+
+class VoteAction(BaseModel):
+    type: Literal["vote"] = "vote"
+    dao_slug: str
+    proposal_id: str
+    vote: Literal["for", "against", "abstain"]
+
+class AgentResponse(BaseModel):
+    message: str
+    action: Optional[DelegateAction | VoteAction] = None
@@ -0,0 +1,102 @@
+# agent/src/ai/analysis_cache.py
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from ..tally.store import ResponseStore
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(*parts: str) -> str:
+    """Returns a stable SHA-256 hex digest of the given strings."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or '').encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def prompt_version(template: str) -> str:
+    """Versions a prompt template by its content, so any edit yields a new version."""
+    return content_hash(template)[:12]
+
+
+class AnalysisCache:
+    """Content-addressed cache of LLM proposal analyses.
+
+    Keys combine the proposal id, a hash of its title and description, the
+    model name and the prompt template version, so an edited proposal, a
+    different model or a changed prompt each miss only their own entries.
+    Lookups go to an in-memory LRU first and then to an optional SQLite tier
+    shared by every worker process.
+    """
+
+    def __init__(self, max_entries: int = 2048, store: Optional[ResponseStore] = None):
+        self.max_entries = max_entries
+        self.store = store
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'store_hits': 0, 'misses': 0}
+
+    @staticmethod
+    def make_key(proposal_id: str, title: str, description: str, model: str, version: str) -> str:
+        return f"impact:{proposal_id}:{content_hash(title, description)}:{model}:{version}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._counters['hits'] += 1
+                return value
+
+        stored = self.store.get(key) if self.store is not None else None
+        with self._lock:
+            if stored is None:
+                self._counters['misses'] += 1
+                return None
+            self._counters['store_hits'] += 1
+        self._remember(key, stored[0])
+        return stored[0]
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        self._remember(key, value)
+        if self.store is not None:
+            self.store.put(key, 'ImpactAnalysis', value)
+
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            size = len(self._entries)
+        lookups = sum(counters.values())
+        served = counters['hits'] + counters['store_hits']
+        return {
+            'size': size,
+            'hit_rate': served / lookups if lookups else 0.0,
+            **counters,
+        }
+
+
+_default_cache: Optional[AnalysisCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """Returns the process-wide analysis cache, persisted if ANALYSIS_CACHE_PATH is set."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            path = os.getenv('ANALYSIS_CACHE_PATH')
+            _default_cache = AnalysisCache(store=ResponseStore(path) if path else None)
+        return _default_cache
@@ -0,0 +1,138 @@
+# agent/src/ai/chat_cache.py
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+from .analysis_cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+# Words that make an answer depend on who is asking or on earlier turns
+PERSONAL_PATTERN = re.compile(
+    r"\b(i|i'm|i've|my|mine|we|our|us|it|its|it's|they|them|their|that|this|those|these|"
+    r"above|previous|earlier|again|delegat\w*|vote\w*|voting)\b|0x[0-9a-f]{6,}"
+)
+STOPWORDS = frozenset(
+    "a an the is are was were be of to in on for about and or please can could would you tell "
+    "explain describe give show what whats s who how me some info information details do does".split()
+)
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+NUMBER_PATTERN = re.compile(r"\d+")
+
+
+def normalize_query(message: str) -> str:
+    """Lowercases, strips punctuation and filler words, so rephrasings share a key."""
+    words = WORD_PATTERN.findall(message.lower())
+    return " ".join(word for word in words if word not in STOPWORDS)
+
+
+def shingles(normalized: str, size: int = 3) -> FrozenSet[str]:
+    """Character shingles of a normalized query, tolerant of small typos and plurals."""
+    text = f" {normalized} "
+    return frozenset(text[i:i + size] for i in range(max(1, len(text) - size + 1)))
+
+
+def is_cacheable(message: str) -> bool:
+    """Whether a message is an informational ask whose answer is the same for everyone."""
+    return bool(normalize_query(message)) and not PERSONAL_PATTERN.search(message.lower())
+
+
+def dao_fingerprint(dao: Dict[str, Any]) -> str:
+    """Hash of a DAO's data; cached answers about the DAO are dropped when it changes."""
+    return content_hash(json.dumps(dao, sort_keys=True, default=str))
+
+
+class ChatResponseCache:
+    """Answers to informational chat queries, keyed by normalized text.
+
+    Exact normalized matches are found by key; otherwise the closest cached
+    query about the same DAOs is accepted when its shingle similarity reaches
+    `similarity`. Every entry remembers the fingerprints of the DAOs it
+    mentions and is invalidated as soon as any of them changes.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl: float = 3600.0, similarity: float = 0.85):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity = similarity
+        self._entries: "OrderedDict[str, Tuple[str, FrozenSet[str], Dict[str, str], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'near_hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def get(self, message: str, fingerprints: Dict[str, str]) -> Optional[str]:
+        """Returns a cached answer for the message, given the current fingerprints of the DAOs it mentions."""
+        key = normalize_query(message)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            kind = 'hits'
+            if entry is None:
+                entry, key = self._closest(key, fingerprints)
+                kind = 'near_hits'
+            if entry is not None and (entry[2] != fingerprints or now - entry[3] > self.ttl):
+                del self._entries[key]
+                self._counters['invalidations'] += 1
+                entry = None
+            if entry is None:
+                self._counters['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters[kind] += 1
+            return entry[0]
+
+    def _closest(self, key: str, fingerprints: Dict[str, str]) -> Tuple[Optional[tuple], str]:
+        query = shingles(key)
+        numbers = NUMBER_PATTERN.findall(key)
+        best, best_key, best_score = None, key, self.similarity
+        for other_key, entry in self._entries.items():
+            # Near matches must be about the same DAOs and the same numbers (proposal ids, amounts)
+            if set(entry[2]) != set(fingerprints) or NUMBER_PATTERN.findall(other_key) != numbers:
+                continue
+            overlap = len(query & entry[1]) / len(query | entry[1])
+            if overlap >= best_score:
+                best, best_key, best_score = entry, other_key, overlap
+        return best, best_key
+
+    def put(self, message: str, answer: str, fingerprints: Dict[str, str]) -> None:
+        key = normalize_query(message)
+        with self._lock:
+            self._entries[key] = (answer, shingles(key), dict(fingerprints), time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            size = len(self._entries)
+        lookups = counters['hits'] + counters['near_hits'] + counters['misses']
+        return {
+            'size': size,
+            'hit_rate': (counters['hits'] + counters['near_hits']) / lookups if lookups else 0.0,
+            **counters,
+        }
+
+
+_chat_caches: Dict[str, ChatResponseCache] = {}
+_chat_caches_lock = threading.Lock()
+
+
+def get_chat_cache(namespace: str = 'default') -> ChatResponseCache:
+    """Returns the process-wide chat response cache of a namespace.
+
+    Agents with different models or prompts use their own namespace, so one
+    never serves the other's answers.
+    """
+    with _chat_caches_lock:
+        cache = _chat_caches.get(namespace)
+        if cache is None:
+            cache = _chat_caches[namespace] = ChatResponseCache(
+                max_entries=int(os.getenv('CHAT_CACHE_MAX_ENTRIES', '512')),
+                ttl=float(os.getenv('CHAT_CACHE_TTL', '3600'))
+            )
+        return cache
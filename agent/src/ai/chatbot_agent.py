@@ -1,49 +1,45 @@
 # agent/src/ai/chatbot_agent.py
 
+import asyncio
 import os
-import sys
-from pathlib import Path
-from typing import Dict, List, Optional, Literal
-from pydantic import BaseModel
-from dotenv import load_dotenv
-from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.prebuilt import create_react_agent
-
-# Import CDP Agentkit Langchain Extension
-from cdp_langchain.agent_toolkits import CdpToolkit
-from cdp_langchain.utils import CdpAgentkitWrapper
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+from langchain_core.messages import AIMessageChunk, HumanMessage
+
+from ..tally.catalog import get_organization_catalog
+from ..tally.token_index import parse_token_id
+from .actions import AgentResponse, DelegateAction, VoteAction
+from .conversations import ConversationStore
+from .intents import IntentParser, ParsedIntent
+from .chat_cache import ChatResponseCache, dao_fingerprint, get_chat_cache, is_cacheable
 
 import logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Pydantic models for actions
-class DelegateAction(BaseModel):
-    type: Literal["delegate"] = "delegate"
-    dao_slug: str
-    token_address: str
-    amount: str
-    delegate_to: str
-
-class VoteAction(BaseModel):
-    type: Literal["vote"] = "vote"
-    dao_slug: str
-    proposal_id: str
-    vote: Literal["for", "against", "abstain"]
+# Response cache namespace of this agent's model and prompt
+CHAT_CACHE_NAMESPACE = "dao_agent"
 
-class AgentResponse(BaseModel):
-    message: str
-    action: Optional[DelegateAction | VoteAction] = None
+# Strong references to background compactions so they are not garbage collected mid-flight
+_background_tasks: Set[asyncio.Task] = set()
 
 class DAOAgent:
     """Agent for DAO interactions and transaction preparation."""
     
-    def __init__(self):
-        """Initialize the DAO Agent."""
+    def __init__(self, conversations: Optional[ConversationStore] = None,
+                 response_cache: Optional[ChatResponseCache] = None):
+        """Initialize the DAO Agent.
+
+        Args:
+            conversations: Optional per-address history store, defaults to one configured from the environment
+            response_cache: Optional cache of informational answers, defaults to this agent's process-wide one
+        """
         logger.info("Initializing DAO Agent...")
-        
+
+        # Imported here so modules that only need the response models stay light
+        from langchain_openai import ChatOpenAI
+        from langgraph.prebuilt import create_react_agent
+        from cdp_langchain.agent_toolkits import CdpToolkit
+        from cdp_langchain.utils import CdpAgentkitWrapper
+
         # Initialize LLM
         self.llm = ChatOpenAI(model="gpt-4")
         
@@ -56,6 +52,7 @@ class DAOAgent:
         self.DAO_INFO = {
             "seamless-protocol": {
                 "name": "Seamless Protocol",
+                "symbol": "SEAM",
                 "token_address": "0x1C7a460413dD4e964f96D8dFC56E7223cE88CD85",
                 "description": "DeFi lending protocol on Base"
             },
@@ -66,20 +63,29 @@ class DAOAgent:
             },
             "gloom": {
                 "name": "Gloom",
+                "symbol": "GLOOM",
                 "token_address": "0xbb5D04c40Fa063FAF213c4E0B8086655164269Ef",
                 "description": "Gaming platform"
             }
         }
 
-        # Memory for conversation context
-        self.memory = MemorySaver()
-        self.config = {"configurable": {"thread_id": "Base DAO Assistant"}}
+        # Live organization data, with DAO_INFO as the fallback
+        self.catalog = get_organization_catalog()
+        self._parser: Optional[IntentParser] = None
+        self._parser_generation: Optional[float] = None
+        self.response_cache = response_cache if response_cache is not None else get_chat_cache(CHAT_CACHE_NAMESPACE)
+
+        # Bounded conversation history, one thread per wallet address
+        self.conversations = conversations if conversations is not None else ConversationStore(
+            max_threads=int(os.getenv('CHAT_MAX_THREADS', '1000')),
+            ttl=float(os.getenv('CHAT_THREAD_TTL', '3600')),
+            max_messages=int(os.getenv('CHAT_MAX_HISTORY', '20'))
+        )
 
         # Create ReAct Agent
         self.agent_executor = create_react_agent(
             self.llm,
             tools=self.tools,
-            checkpointer=self.memory,
             state_modifier="""You are a knowledgeable DAO assistant that helps users interact with Base ecosystem DAOs, particularly:
             - Seamless Protocol (DeFi lending)
             - Internet Token DAO
@@ -103,70 +109,234 @@ class DAOAgent:
 
         logger.info("DAO Agent initialized successfully")
 
-    async def chat(self, message: str) -> AgentResponse:
-        """Process a chat message and generate appropriate response and actions."""
-        try:
-            # First, analyze if this is an action request
-            analysis_prompt = f"""
-            Analyze this user request and determine if it requires an on-chain action:
-
-            User message: {message}
-
-            If it requires an action, specify:
-            1. Action type (delegate/vote)
-            2. DAO involved
-            3. Required parameters (amounts, addresses, etc)
-
-            Return in this format:
-            ACTION_REQUIRED: yes/no
-            ACTION_TYPE: delegate/vote/none
-            DAO_SLUG: dao-name or none
-            PARAMETERS: key-value pairs or none
-            """
-
-            # Get initial analysis
-            analysis = self.llm.invoke([HumanMessage(content=analysis_prompt)])
-            analysis_lines = analysis.content.strip().split('\n')
-            analysis_dict = dict(line.split(': ') for line in analysis_lines)
-
-            if analysis_dict['ACTION_REQUIRED'] == 'yes':
-                # Handle delegation request
-                if analysis_dict['ACTION_TYPE'] == 'delegate':
-                    dao_slug = analysis_dict['DAO_SLUG']
-                    if dao_slug in self.DAO_INFO:
-                        dao = self.DAO_INFO[dao_slug]
-                        
+    def _intent_parser(self) -> IntentParser:
+        """Parser over DAO_INFO and the catalog, rebuilt only when the catalog refreshes."""
+        generation = self.catalog.loaded_at
+        if self._parser is None or self._parser_generation != generation:
+            daos = {org['slug']: {"name": org.get('name', '')} for org in self.catalog.organizations()}
+            daos.update(self.DAO_INFO)
+            self._parser = IntentParser(daos)
+            self._parser_generation = generation
+        return self._parser
+
+    def _build_action(self, intent: ParsedIntent) -> Optional[AgentResponse]:
+        """Turns a fully parsed intent into a prepared transaction."""
+        dao = self.get_dao_info(intent.dao_slug)
+        if not dao:
+            return None
+
+        if intent.kind == 'vote':
+            return AgentResponse(
+                message=f"I'll help you vote {intent.vote} on proposal {intent.proposal_id} in {dao['name']}. This will require signing a transaction through your wallet.",
+                action=VoteAction(dao_slug=intent.dao_slug, proposal_id=intent.proposal_id, vote=intent.vote)
+            )
+
+        action = DelegateAction(
+            dao_slug=intent.dao_slug,
+            token_address=dao['token_address'],
+            amount=intent.amount,
+            delegate_to=intent.delegate_to or dao['token_address']  # Default to self-delegation
+        )
+        return AgentResponse(
+            message=f"I'll help you delegate {intent.amount} tokens to {dao['name']}. This will require signing a transaction through your wallet. The delegation will use the token contract at {dao['token_address']}.",
+            action=action
+        )
+
+    @staticmethod
+    def _parse_analysis(text: str) -> Dict[str, str]:
+        """Reads the KEY: value lines of the analysis reply, ignoring anything else."""
+        fields = {}
+        for line in text.strip().split('\n'):
+            key, sep, value = line.partition(':')
+            if sep:
+                fields[key.strip().upper()] = value.strip().lower()
+        return fields
+
+    async def _prepare_action(self, message: str) -> Optional[AgentResponse]:
+        """Returns a response with a prepared transaction if the message asks for one.
+
+        Common phrasings are parsed locally; the LLM is only asked when the
+        message mentions an action the parser could not pin down.
+        """
+        intent = self._intent_parser().parse(message)
+        if intent.kind is None and not intent.ambiguous:
+            return None
+        if not intent.ambiguous:
+            response = self._build_action(intent)
+            if response is not None:
+                return response
+
+        # First, analyze if this is an action request
+        analysis_prompt = f"""
+        Analyze this user request and determine if it requires an on-chain action:
+
+        User message: {message}
+
+        If it requires an action, specify:
+        1. Action type (delegate/vote)
+        2. DAO involved
+        3. Required parameters (amounts, addresses, etc)
+
+        Return in this format:
+        ACTION_REQUIRED: yes/no
+        ACTION_TYPE: delegate/vote/none
+        DAO_SLUG: dao-name or none
+        PARAMETERS: key-value pairs or none
+        """
+
+        # Get initial analysis
+        analysis = await self.llm.ainvoke([HumanMessage(content=analysis_prompt)])
+        analysis_dict = self._parse_analysis(analysis.content)
+
+        if analysis_dict.get('ACTION_REQUIRED') == 'yes':
+            # Handle delegation request
+            if analysis_dict.get('ACTION_TYPE') == 'delegate':
+                dao_slug = analysis_dict.get('DAO_SLUG', '')
+                dao = self.get_dao_info(dao_slug)
+                if dao:
+                    amount = intent.amount
+                    if amount is None:
                         # Extract amount from message
                         amount_context = f"""
                         Extract the token amount from: {message}
                         Return just the number, or 'all' if the user wants to delegate all tokens.
                         """
-                        amount_response = self.llm.invoke([HumanMessage(content=amount_context)])
+                        amount_response = await self.llm.ainvoke([HumanMessage(content=amount_context)])
                         amount = amount_response.content.strip()
 
-                        action = DelegateAction(
-                            dao_slug=dao_slug,
-                            token_address=dao['token_address'],
-                            amount=amount,
-                            delegate_to=dao['token_address']  # Default to self-delegation
-                        )
+                    return self._build_action(ParsedIntent(
+                        kind='delegate',
+                        dao_slug=dao_slug,
+                        amount=amount,
+                        delegate_to=intent.delegate_to
+                    ))
+        return None
+
+    async def _summarize(self, prompt: str) -> str:
+        response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+        return response.content
 
-                        return AgentResponse(
-                            message=f"I'll help you delegate {amount} tokens to {dao['name']}. This will require signing a transaction through your wallet. The delegation will use the token contract at {dao['token_address']}.",
-                            action=action
-                        )
+    async def _remember(self, address: Optional[str], message: str, reply: str) -> None:
+        """Records a turn in the caller's thread and compacts it in the background if it grew too long.
+
+        Summarizing is an LLM round-trip, so it never delays the reply.
+        """
+        self.conversations.record(address, message, reply)
+        task = asyncio.ensure_future(self.conversations.compact(address, self._summarize))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    def _fingerprints(self, message: str) -> Dict[str, str]:
+        """Current data fingerprints of the DAOs a message mentions."""
+        return {
+            slug: dao_fingerprint(self.catalog.get_by_slug(slug) or self.DAO_INFO.get(slug, {}))
+            for slug in self._intent_parser().find_daos(message.lower())
+        }
+
+    def _turn_messages(self, address: Optional[str], message: str) -> List:
+        return self.conversations.get(address).context() + [HumanMessage(content=message)]
+
+    def _shareable(self, address: Optional[str], fingerprints: Optional[Dict[str, str]]) -> bool:
+        """Whether a reply generated now may be cached for everyone: a thread with
+        history or a summary feeds private context into the reply."""
+        return fingerprints is not None and not self.conversations.get(address).context()
+
+    async def chat(self, message: str, address: Optional[str] = None) -> AgentResponse:
+        """Process a chat message and generate appropriate response and actions.
+
+        Args:
+            message: The user's message
+            address: The user's wallet address, which selects their conversation thread
+        """
+        try:
+            action_response = await self._prepare_action(message)
+            if action_response is not None:
+                await self._remember(address, message, action_response.message)
+                return action_response
+
+            # Informational asks that anyone could make are answered from the cache
+            fingerprints = self._fingerprints(message) if is_cacheable(message) else None
+            cached = self.response_cache.get(message, fingerprints) if fingerprints is not None else None
+            if cached is not None:
+                await self._remember(address, message, cached)
+                return AgentResponse(message=cached)
 
             # For non-action requests, get a normal response
+            shareable = self._shareable(address, fingerprints)
             response = await self.agent_executor.ainvoke(
-                {"messages": [HumanMessage(content=message)]}
+                {"messages": self._turn_messages(address, message)}
             )
             
-            return AgentResponse(message=response['output'])
+            reply = response['messages'][-1].content
+            if shareable:
+                self.response_cache.put(message, reply, fingerprints)
+            await self._remember(address, message, reply)
+            return AgentResponse(message=reply)
 
         except Exception as e:
             logger.error(f"Error in chat: {e}")
             return AgentResponse(message=f"I encountered an error: {str(e)}")
 
+    async def astream_chat(self, message: str, address: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a chat reply as frames while it is generated.
+
+        Yields {"type": "token"} frames carrying text as the model produces
+        it, an {"type": "action"} frame when a transaction was prepared, and
+        a final {"type": "done"} frame with the complete message.
+        """
+        try:
+            action_response = await self._prepare_action(message)
+            if action_response is not None:
+                yield {"type": "token", "data": action_response.message}
+                yield {"type": "action", "data": action_response.action.dict()}
+                yield {"type": "done", "data": {"message": action_response.message}}
+                await self._remember(address, message, action_response.message)
+                return
+
+            fingerprints = self._fingerprints(message) if is_cacheable(message) else None
+            cached = self.response_cache.get(message, fingerprints) if fingerprints is not None else None
+            if cached is not None:
+                yield {"type": "token", "data": cached}
+                yield {"type": "done", "data": {"message": cached}}
+                await self._remember(address, message, cached)
+                return
+
+            shareable = self._shareable(address, fingerprints)
+            parts = []
+            async for chunk, metadata in self.agent_executor.astream(
+                {"messages": self._turn_messages(address, message)},
+                stream_mode="messages"
+            ):
+                # Only forward the model's own text, not tool calls or tool output
+                if metadata.get("langgraph_node") != "agent" or not isinstance(chunk, AIMessageChunk):
+                    continue
+                if isinstance(chunk.content, str) and chunk.content:
+                    parts.append(chunk.content)
+                    yield {"type": "token", "data": chunk.content}
+
+            reply = "".join(parts)
+            if shareable:
+                self.response_cache.put(message, reply, fingerprints)
+            yield {"type": "done", "data": {"message": reply}}
+            await self._remember(address, message, reply)
+
+        except Exception as e:
+            logger.error(f"Error in streaming chat: {e}")
+            yield {"type": "error", "data": {"message": f"I encountered an error: {str(e)}"}}
+
     def get_dao_info(self, dao_slug: str) -> Optional[Dict]:
-        """Get information about a specific DAO."""
-        return self.DAO_INFO.get(dao_slug)
\ No newline at end of file
+        """Get information about a specific DAO, preferring the organization catalog."""
+        known = self.DAO_INFO.get(dao_slug)
+        org = self.catalog.get_by_slug(dao_slug)
+        if org is None:
+            return known
+
+        token = parse_token_id((org.get('tokenIds') or [''])[0])
+        token_address = token[1] if token else (known or {}).get('token_address')
+        if not token_address:
+            return known
+        return {
+            "name": org['name'],
+            "token_address": token_address,
+            "description": (org.get('metadata') or {}).get('description') or (known or {}).get('description', '')
+        }
\ No newline at end of file
@@ -0,0 +1,140 @@
+# agent/src/ai/conversations.py
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PROMPT_TEMPLATE = """Update the running summary of a conversation between a user and a DAO assistant.
+Keep facts the assistant will need later: DAOs, proposals, token amounts, addresses and the user's goals.
+Answer with the new summary only, in at most 120 words.
+
+Current summary:
+{summary}
+
+New messages:
+{transcript}"""
+
+
+class ConversationThread:
+    """One user's bounded history: a rolling summary plus the most recent messages."""
+
+    def __init__(self):
+        self.summary = ""
+        self.messages: List[BaseMessage] = []
+        self.last_used = time.monotonic()
+        self.compacting = False
+
+    def context(self) -> List[BaseMessage]:
+        """Messages to prepend to the next turn."""
+        if not self.summary:
+            return list(self.messages)
+        return [SystemMessage(content=f"Summary of the earlier conversation: {self.summary}")] + self.messages
+
+
+class ConversationStore:
+    """Per-address conversation threads, bounded in count, lifetime and length.
+
+    Threads are evicted least-recently-used once `max_threads` is reached and
+    dropped after `ttl` seconds idle. When a thread grows past `max_messages`,
+    everything but the last `keep_recent` messages is folded into its summary,
+    so the prompt stays the same size however long the conversation runs.
+    """
+
+    def __init__(self, max_threads: int = 1000, ttl: float = 3600.0,
+                 max_messages: int = 20, keep_recent: int = 6):
+        self.max_threads = max_threads
+        self.ttl = ttl
+        self.max_messages = max_messages
+        self.keep_recent = keep_recent
+        self._threads: "OrderedDict[str, ConversationThread]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'evictions': 0, 'expirations': 0, 'summaries': 0}
+
+    @staticmethod
+    def _key(address: Optional[str]) -> str:
+        return (address or 'anonymous').strip().lower()
+
+    def get(self, address: Optional[str]) -> ConversationThread:
+        """Returns the caller's thread, creating it and evicting idle ones as needed."""
+        key = self._key(address)
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            thread = self._threads.get(key)
+            if thread is None:
+                thread = ConversationThread()
+                self._threads[key] = thread
+                while len(self._threads) > self.max_threads:
+                    self._threads.popitem(last=False)
+                    self._counters['evictions'] += 1
+            self._threads.move_to_end(key)
+            thread.last_used = now
+            return thread
+
+    def _expire(self, now: float) -> None:
+        # Oldest first, so stop at the first thread still in use
+        while self._threads:
+            key, thread = next(iter(self._threads.items()))
+            if now - thread.last_used <= self.ttl:
+                break
+            del self._threads[key]
+            self._counters['expirations'] += 1
+
+    def record(self, address: Optional[str], user_message: str, reply: str) -> ConversationThread:
+        """Appends one completed turn to the caller's thread."""
+        thread = self.get(address)
+        with self._lock:
+            thread.messages.extend([HumanMessage(content=user_message), AIMessage(content=reply)])
+        return thread
+
+    async def compact(self, address: Optional[str], summarize: Callable[[str], Awaitable[str]]) -> bool:
+        """Folds older messages into the summary once the thread is too long; returns whether it did."""
+        thread = self.get(address)
+        with self._lock:
+            # One compaction per thread at a time, so two cannot fold the same messages
+            if thread.compacting or len(thread.messages) <= self.max_messages:
+                return False
+            thread.compacting = True
+            cut = len(thread.messages) - self.keep_recent
+            older = thread.messages[:cut]
+
+        transcript = "\n".join(
+            f"{'User' if isinstance(message, HumanMessage) else 'Assistant'}: {message.content}"
+            for message in older
+        )
+        try:
+            summary = await summarize(SUMMARY_PROMPT_TEMPLATE.format(summary=thread.summary or "(none)", transcript=transcript))
+        except Exception as e:
+            logger.error(f"Error summarizing conversation: {str(e)}")
+            # Keep the prompt bounded even without a summary
+            summary = thread.summary
+        except BaseException:
+            with self._lock:
+                thread.compacting = False
+            raise
+
+        with self._lock:
+            thread.summary = summary.strip()
+            # Only drop what was summarized, by identity; turns recorded meanwhile stay
+            summarized = {id(message) for message in older}
+            thread.messages = [message for message in thread.messages if id(message) not in summarized]
+            thread.compacting = False
+            self._counters['summaries'] += 1
+        return True
+
+    def clear(self, address: Optional[str]) -> None:
+        with self._lock:
+            self._threads.pop(self._key(address), None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'threads': len(self._threads),
+                'messages': sum(len(thread.messages) for thread in self._threads.values()),
+                **self._counters,
+            }
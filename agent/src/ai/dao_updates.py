@@ -1,17 +1,59 @@
-from typing import Dict, List, Optional, Literal, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Literal, Any, AsyncIterator, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime, timezone
+import asyncio
+import json
 import logging
 import os
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage
-from langchain_core.language_models.chat_models import BaseChatModel
 from ..tally.client import TallyClient
+from ..tally.catalog import OrganizationCatalog, get_organization_catalog
+from .analysis_cache import AnalysisCache, get_analysis_cache, prompt_version
+from .proposal_sync import ProposalDelta, ProposalSync, get_proposal_sync
+from .deadlines import DeadlineScheduler, get_deadline_scheduler
+
+if TYPE_CHECKING:
+    from langchain_core.language_models.chat_models import BaseChatModel
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+IMPACT_PROMPT_TEMPLATE = """Analyze this governance proposal and determine its impact. Format your response EXACTLY as shown below:
+
+    Proposal Title: {title}
+    Description: {description}
+
+    Your analysis must follow this EXACT format:
+    Summary: [Write a brief summary of potential impact]
+    Areas: [List affected areas, comma-separated]
+    Risk: [ONLY use: low, medium, or high]
+
+    Example format:
+    Summary: This proposal updates the fee structure
+    Areas: fees, treasury, governance
+    Risk: medium"""
+
+# Changes whenever the template is edited, invalidating only analyses made with the old prompt
+IMPACT_PROMPT_VERSION = prompt_version(IMPACT_PROMPT_TEMPLATE)
+
+BATCH_IMPACT_PROMPT_TEMPLATE = """Analyze each of these governance proposals and determine its impact.
+
+{proposals}
+
+Respond with ONLY a JSON array containing one object per proposal, in this exact shape:
+[{{"id": "<proposal id>", "summary": "<brief summary of potential impact>", "affected_areas": ["<area>", "..."], "risk_level": "low" | "medium" | "high"}}]"""
+
+BATCH_PROPOSAL_TEMPLATE = """Proposal ID: {id}
+Title: {title}
+Description: {description}
+"""
+
+BATCH_IMPACT_PROMPT_VERSION = prompt_version(BATCH_IMPACT_PROMPT_TEMPLATE + BATCH_PROPOSAL_TEMPLATE)
+
+# Rough characters-per-token ratio used to keep batch prompts within budget
+CHARS_PER_TOKEN = 4
+
+# Summaries produced when an analysis could not be completed; such proposals are retried on the next sync
+FAILED_IMPACT_SUMMARIES = ("Could not analyze impact", "Error analyzing proposal")
+
 class TreasuryChange(BaseModel):
     """Model for treasury changes."""
     amount: str
@@ -58,8 +100,27 @@ class DaoUpdate(BaseModel):
 class DaoUpdatesAgent:
     """Agent for analyzing and generating DAO updates with AI-powered insights."""
     
-    def __init__(self, tally_api_key: str, llm: Optional[BaseChatModel] = None):
-        """Initialize the DAO Updates Agent."""
+    def __init__(self, tally_api_key: str, llm: Optional["BaseChatModel"] = None,
+                 max_concurrency: int = 5, llm_timeout: float = 60.0,
+                 analysis_cache: Optional[AnalysisCache] = None,
+                 batch_mode: bool = False, batch_token_budget: int = 6000, max_batch_size: int = 10,
+                 proposal_sync: Optional[ProposalSync] = None, catalog: Optional[OrganizationCatalog] = None,
+                 deadlines: Optional[DeadlineScheduler] = None):
+        """Initialize the DAO Updates Agent.
+
+        Args:
+            tally_api_key: The API key for Tally
+            llm: Optional pre-configured LLM for testing
+            max_concurrency: Most proposal analyses in flight at once per DAO
+            llm_timeout: Seconds before a single analysis is abandoned
+            analysis_cache: Optional analysis cache, defaults to the process-wide one
+            batch_mode: Analyze several proposals per LLM call instead of one each
+            batch_token_budget: Approximate prompt token budget of one batch
+            max_batch_size: Most proposals packed into one batch
+            proposal_sync: Optional incremental sync state, defaults to the process-wide one
+            catalog: Optional organization catalog, defaults to the process-wide one
+            deadlines: Optional voting deadline scheduler fed with every fetch, defaults to the process-wide one
+        """
         logger.info("Initializing DAO Updates Agent")
         
         # Initialize LLM
@@ -69,7 +130,9 @@ class DaoUpdatesAgent:
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY environment variable is required")
-                
+
+            # Imported here so serving cached feeds never loads langchain_openai
+            from langchain_openai import ChatOpenAI
             self.llm = ChatOpenAI(
                 api_key=api_key,
                 model="gpt-4",
@@ -80,11 +143,22 @@ class DaoUpdatesAgent:
         logger.info("Initializing Tally Client")
         os.environ['TALLY_API_KEY'] = tally_api_key
         self.tally_client = TallyClient()
-        
+
+        self.max_concurrency = max_concurrency
+        self.llm_timeout = llm_timeout
+        self.analysis_cache = analysis_cache if analysis_cache is not None else get_analysis_cache()
+        self.batch_mode = batch_mode
+        self.batch_token_budget = batch_token_budget
+        self.max_batch_size = max_batch_size
+        self.proposal_sync = proposal_sync if proposal_sync is not None else get_proposal_sync()
+        self.catalog = catalog if catalog is not None else get_organization_catalog()
+        self.deadlines = deadlines if deadlines is not None else get_deadline_scheduler()
+
         logger.info("DAO Updates Agent initialized successfully")
 
     def _invoke_llm(self, context: str) -> str:
         """Helper function to invoke LLM safely."""
+        from langchain_core.messages import HumanMessage
         try:
             response = self.llm.invoke([HumanMessage(content=context)])
             return response.content.strip() if response and hasattr(response, "content") else "Error: No response from AI"
@@ -92,67 +166,128 @@ class DaoUpdatesAgent:
             logger.error(f"LLM invocation error: {str(e)}")
             return "Error: Failed to generate AI response"
 
-    def _analyze_proposal_impact(self, proposal_data: Dict) -> ImpactAnalysis:
-        """Use LLM to analyze proposal impact."""
+    async def _ainvoke_llm(self, context: str) -> str:
+        """Non-blocking counterpart of _invoke_llm with a per-call timeout."""
+        from langchain_core.messages import HumanMessage
         try:
-            title = proposal_data.get('metadata', {}).get('title', 'Unknown Proposal')
-            description = proposal_data.get('metadata', {}).get('description', 'No description available.')
+            response = await asyncio.wait_for(
+                self.llm.ainvoke([HumanMessage(content=context)]),
+                timeout=self.llm_timeout
+            )
+            return response.content.strip() if response and hasattr(response, "content") else "Error: No response from AI"
+        except asyncio.TimeoutError:
+            logger.error(f"LLM invocation timed out after {self.llm_timeout}s")
+            return "Error: AI response timed out"
+        except Exception as e:
+            logger.error(f"LLM invocation error: {str(e)}")
+            return "Error: Failed to generate AI response"
 
-            if not title.strip() or not description.strip():
-                return ImpactAnalysis(
-                    summary="No valid proposal data available",
-                    affected_areas=["Unknown"],
-                    risk_level="medium"
-                )
+    def _build_impact_prompt(self, proposal_data: Dict) -> Optional[str]:
+        """Builds the impact analysis prompt, or None when the proposal has no usable text."""
+        title = proposal_data.get('metadata', {}).get('title', 'Unknown Proposal')
+        description = proposal_data.get('metadata', {}).get('description', 'No description available.')
 
-            context = f"""Analyze this governance proposal and determine its impact. Format your response EXACTLY as shown below:
+        if not title.strip() or not description.strip():
+            return None
 
-    Proposal Title: {title}
-    Description: {description}
+        return IMPACT_PROMPT_TEMPLATE.format(title=title, description=description)
 
-    Your analysis must follow this EXACT format:
-    Summary: [Write a brief summary of potential impact]
-    Areas: [List affected areas, comma-separated]
-    Risk: [ONLY use: low, medium, or high]
+    def _parse_impact(self, response: str) -> ImpactAnalysis:
+        """Parses the Summary/Areas/Risk lines of an impact analysis response."""
+        # More robust parsing
+        summary = ""
+        areas = []
+        risk = "medium"  # default risk level
 
-    Example format:
-    Summary: This proposal updates the fee structure
-    Areas: fees, treasury, governance
-    Risk: medium"""
+        # Parse each line
+        for line in response.split('\n'):
+            line = line.strip()
+            if line.lower().startswith('summary:'):
+                summary = line[8:].strip()
+            elif line.lower().startswith('areas:'):
+                areas_str = line[6:].strip()
+                areas = [area.strip() for area in areas_str.split(',') if area.strip()]
+            elif line.lower().startswith('risk:'):
+                risk_value = line[5:].strip().lower()
+                if risk_value in ['low', 'medium', 'high']:
+                    risk = risk_value
+
+        # Validate and provide defaults if needed
+        if not summary:
+            summary = "Could not analyze impact"
+        if not areas:
+            areas = ["Unknown"]
+        if risk not in ['low', 'medium', 'high']:
+            risk = "medium"
+
+        return ImpactAnalysis(
+            summary=summary,
+            affected_areas=areas,
+            risk_level=risk
+        )
+
+    def _model_name(self) -> str:
+        return getattr(self.llm, 'model_name', None) or getattr(self.llm, 'model', None) or type(self.llm).__name__
+
+    def _impact_cache_key(self, proposal_data: Dict, version: str = IMPACT_PROMPT_VERSION) -> str:
+        metadata = proposal_data.get('metadata', {})
+        return AnalysisCache.make_key(
+            str(proposal_data.get('id', '')),
+            metadata.get('title', ''),
+            metadata.get('description', ''),
+            self._model_name(),
+            version
+        )
 
-            response = self._invoke_llm(context)
-            
-            # More robust parsing
-            summary = ""
-            areas = []
-            risk = "medium"  # default risk level
-
-            # Parse each line
-            for line in response.split('\n'):
-                line = line.strip()
-                if line.lower().startswith('summary:'):
-                    summary = line[8:].strip()
-                elif line.lower().startswith('areas:'):
-                    areas_str = line[6:].strip()
-                    areas = [area.strip() for area in areas_str.split(',') if area.strip()]
-                elif line.lower().startswith('risk:'):
-                    risk_value = line[5:].strip().lower()
-                    if risk_value in ['low', 'medium', 'high']:
-                        risk = risk_value
-
-            # Validate and provide defaults if needed
-            if not summary:
-                summary = "Could not analyze impact"
-            if not areas:
-                areas = ["Unknown"]
-            if risk not in ['low', 'medium', 'high']:
-                risk = "medium"
+    def _cached_impact(self, key: str) -> Optional[ImpactAnalysis]:
+        cached = self.analysis_cache.get(key)
+        return ImpactAnalysis(**cached) if cached is not None else None
 
+    def _store_impact(self, key: str, response: str) -> ImpactAnalysis:
+        """Parses an LLM response, caching it only if the call succeeded and yielded a summary."""
+        impact = self._parse_impact(response)
+        if not response.startswith("Error:") and impact.summary not in FAILED_IMPACT_SUMMARIES:
+            self.analysis_cache.put(key, impact.dict())
+        return impact
+
+    def _analyze_proposal_impact(self, proposal_data: Dict) -> ImpactAnalysis:
+        """Use LLM to analyze proposal impact."""
+        try:
+            context = self._build_impact_prompt(proposal_data)
+            if context is None:
+                return ImpactAnalysis(
+                    summary="No valid proposal data available",
+                    affected_areas=["Unknown"],
+                    risk_level="medium"
+                )
+            key = self._impact_cache_key(proposal_data)
+            cached = self._cached_impact(key)
+            if cached is not None:
+                return cached
+            return self._store_impact(key, self._invoke_llm(context))
+        except Exception as e:
+            logger.error(f"Error analyzing proposal impact: {str(e)}")
             return ImpactAnalysis(
-                summary=summary,
-                affected_areas=areas,
-                risk_level=risk
+                summary="Error analyzing proposal",
+                affected_areas=["Unknown"],
+                risk_level="medium"
             )
+
+    async def _aanalyze_proposal_impact(self, proposal_data: Dict) -> ImpactAnalysis:
+        """Use LLM to analyze proposal impact without blocking the event loop."""
+        try:
+            context = self._build_impact_prompt(proposal_data)
+            if context is None:
+                return ImpactAnalysis(
+                    summary="No valid proposal data available",
+                    affected_areas=["Unknown"],
+                    risk_level="medium"
+                )
+            key = self._impact_cache_key(proposal_data)
+            cached = self._cached_impact(key)
+            if cached is not None:
+                return cached
+            return self._store_impact(key, await self._ainvoke_llm(context))
         except Exception as e:
             logger.error(f"Error analyzing proposal impact: {str(e)}")
             return ImpactAnalysis(
@@ -161,47 +296,273 @@ class DaoUpdatesAgent:
                 risk_level="medium"
             )
 
-    async def get_dao_updates(self, dao_slug: str, user_holdings: Optional[Dict] = None) -> List[DaoUpdate]:
-        """Get AI-curated updates for a DAO."""
+    async def _analyze_proposals(self, proposals: List[Dict]) -> List[ImpactAnalysis]:
+        """Analyzes proposals concurrently, at most max_concurrency at a time.
+
+        Results are returned in the same order as the proposals.
+        """
+        if self.batch_mode:
+            return await self._analyze_proposals_batched(proposals)
+
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def analyze(proposal: Dict) -> ImpactAnalysis:
+            async with semaphore:
+                return await self._aanalyze_proposal_impact(proposal)
+
+        return await asyncio.gather(*(analyze(proposal) for proposal in proposals))
+
+    def _render_batch_item(self, proposal: Dict) -> str:
+        metadata = proposal.get('metadata', {})
+        # Cap any single description so one long proposal cannot crowd out the rest
+        max_chars = self.batch_token_budget * CHARS_PER_TOKEN // 2
+        return BATCH_PROPOSAL_TEMPLATE.format(
+            id=proposal.get('id', ''),
+            title=metadata.get('title', ''),
+            description=(metadata.get('description') or '')[:max_chars]
+        )
+
+    def _pack_batches(self, proposals: List[Dict]) -> List[List[Dict]]:
+        """Groups proposals into batches that fit the token budget and size cap."""
+        budget_chars = self.batch_token_budget * CHARS_PER_TOKEN - len(BATCH_IMPACT_PROMPT_TEMPLATE)
+        batches: List[List[Dict]] = []
+        current: List[Dict] = []
+        used = 0
+        for proposal in proposals:
+            size = len(self._render_batch_item(proposal))
+            if current and (used + size > budget_chars or len(current) >= self.max_batch_size):
+                batches.append(current)
+                current, used = [], 0
+            current.append(proposal)
+            used += size
+        if current:
+            batches.append(current)
+        return batches
+
+    def _parse_batch_response(self, response: str) -> Dict[str, ImpactAnalysis]:
+        """Parses a JSON array of analyses, keeping only items that validate."""
+        start, end = response.find('['), response.rfind(']')
+        if start == -1 or end <= start:
+            return {}
         try:
-            logger.info(f"Getting updates for DAO: {dao_slug}")
-            updates: List[DaoUpdate] = []
+            items = json.loads(response[start:end + 1])
+        except ValueError:
+            logger.warning("Batch analysis response was not valid JSON")
+            return {}
+
+        analyses: Dict[str, ImpactAnalysis] = {}
+        for item in items if isinstance(items, list) else []:
+            try:
+                analysis = ImpactAnalysis(
+                    summary=item['summary'],
+                    affected_areas=item['affected_areas'],
+                    risk_level=item['risk_level']
+                )
+            except Exception:
+                continue
+            if analysis.summary.strip() and analysis.affected_areas:
+                analyses[str(item.get('id'))] = analysis
+        return analyses
+
+    async def _analyze_batch(self, batch: List[Dict]) -> Dict[str, ImpactAnalysis]:
+        """Analyzes one batch with a single structured LLM call."""
+        context = BATCH_IMPACT_PROMPT_TEMPLATE.format(
+            proposals="\n".join(self._render_batch_item(proposal) for proposal in batch)
+        )
+        response = await self._ainvoke_llm(context)
+        if response.startswith("Error:"):
+            return {}
+        analyses = self._parse_batch_response(response)
+        for proposal in batch:
+            analysis = analyses.get(str(proposal.get('id')))
+            if analysis is not None:
+                self.analysis_cache.put(self._impact_cache_key(proposal, BATCH_IMPACT_PROMPT_VERSION), analysis.dict())
+        return analyses
+
+    async def _analyze_proposals_batched(self, proposals: List[Dict]) -> List[ImpactAnalysis]:
+        """Batch mode: packs uncached proposals into a few JSON-returning LLM calls.
+
+        Proposals missing from a batch response or failing validation fall
+        back to the per-proposal prompt.
+        """
+        results: List[Optional[ImpactAnalysis]] = [None] * len(proposals)
+        pending: List[int] = []
+        for index, proposal in enumerate(proposals):
+            if self._build_impact_prompt(proposal) is None:
+                pending.append(index)  # The per-proposal path supplies the default
+                continue
+            cached = self._cached_impact(self._impact_cache_key(proposal, BATCH_IMPACT_PROMPT_VERSION))
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append(index)
+
+        batchable = [proposals[i] for i in pending if self._build_impact_prompt(proposals[i]) is not None]
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def run(batch: List[Dict]) -> Dict[str, ImpactAnalysis]:
+            async with semaphore:
+                return await self._analyze_batch(batch)
 
-            dao_data = self.tally_client.get_organization(dao_slug)
+        analyses: Dict[str, ImpactAnalysis] = {}
+        for batch_result in await asyncio.gather(*(run(batch) for batch in self._pack_batches(batchable))):
+            analyses.update(batch_result)
+
+        fallbacks = []
+        for index in pending:
+            analysis = analyses.get(str(proposals[index].get('id')))
+            if analysis is not None:
+                results[index] = analysis
+            else:
+                fallbacks.append(index)
+
+        if fallbacks:
+            logger.info(f"Falling back to per-proposal analysis for {len(fallbacks)} proposals")
+
+            async def fallback(index: int) -> None:
+                async with semaphore:
+                    results[index] = await self._aanalyze_proposal_impact(proposals[index])
+
+            await asyncio.gather(*(fallback(index) for index in fallbacks))
+
+        return results
+
+    def _build_proposal_update(self, dao_slug: str, org_data: Dict, proposal: Dict, impact: ImpactAnalysis) -> DaoUpdate:
+        """Turns one analyzed proposal into a DaoUpdate."""
+        # Generate timestamp with explicit UTC timezone
+        timestamp = datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
+
+        return DaoUpdate(
+            id=f"prop_{proposal['id']}",
+            dao_slug=dao_slug,
+            dao_name=org_data['name'],
+            title=f"Proposal: {proposal['metadata'].get('title', 'Unknown Proposal')}",
+            description=impact.summary,
+            priority='urgent' if impact.risk_level == 'high' else 'important',
+            category='proposal',
+            timestamp=timestamp,
+            metadata={
+                'proposal_id': proposal['id'],
+                'impact_analysis': impact.dict(),
+                'vote_stats': proposal.get('voteStats', [])
+            },
+            actions=[UpdateAction(type='link', label='View Proposal', url=f"https://www.tally.xyz/gov/{dao_slug}/proposal/{proposal['id']}")]
+        )
+
+    async def _fetch_proposals(self, dao_slug: str) -> Optional[Tuple[Dict, List[Dict]]]:
+        """Fetches a DAO's organization data and proposals, or None if either cannot be loaded."""
+        org_data = self.catalog.get_by_slug(dao_slug)
+        if org_data is None:
+            # Not in the catalog (other chain or not loaded yet), ask Tally directly
+            dao_data = await self.tally_client.aio.get_organization(dao_slug)
             if not dao_data or 'data' not in dao_data:
                 logger.error(f"Failed to fetch data for DAO: {dao_slug}")
-                return []
-
+                return None
             org_data = dao_data['data']['organization']
-            proposals = self.tally_client.get_proposals(org_data['id'], include_active=False)
-
-            if proposals and 'data' in proposals and 'proposals' in proposals['data']:
-                for proposal in proposals['data']['proposals']['nodes']:
-                    impact = self._analyze_proposal_impact(proposal)
-
-                    # Generate timestamp with explicit UTC timezone
-                    timestamp = datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
-
-                    updates.append(DaoUpdate(
-                        id=f"prop_{proposal['id']}",
-                        dao_slug=dao_slug,
-                        dao_name=org_data['name'],
-                        title=f"Proposal: {proposal['metadata'].get('title', 'Unknown Proposal')}",
-                        description=impact.summary,
-                        priority='urgent' if impact.risk_level == 'high' else 'important',
-                        category='proposal',
-                        timestamp=timestamp,
-                        metadata={
-                            'proposal_id': proposal['id'],
-                            'impact_analysis': impact.dict(),
-                            'vote_stats': proposal.get('voteStats', [])
-                        },
-                        actions=[UpdateAction(type='link', label='View Proposal', url=f"https://www.tally.xyz/gov/{dao_slug}/proposal/{proposal['id']}")]
-                    ))
+
+        proposals = await self.tally_client.aio.get_proposals(org_data['id'], include_active=False)
+
+        if not proposals or 'data' not in proposals or 'proposals' not in proposals['data']:
+            # Not the same as a DAO without proposals; callers must keep their last known state
+            logger.error(f"Failed to fetch proposals for DAO: {dao_slug}")
+            return None
+        nodes = proposals['data']['proposals']['nodes']
+        self.deadlines.sync(dao_slug, nodes, dao_name=org_data.get('name', ''))
+        return org_data, nodes
+
+    async def iter_dao_updates(self, dao_slug: str, user_holdings: Optional[Dict] = None) -> AsyncIterator[DaoUpdate]:
+        """Yield a DAO's updates one by one as their analyses complete.
+
+        Unlike get_dao_updates, updates arrive in completion order and errors
+        propagate to the caller. Closing the iterator cancels pending analyses.
+        """
+        logger.info(f"Streaming updates for DAO: {dao_slug}")
+        fetched = await self._fetch_proposals(dao_slug)
+        if fetched is None:
+            return
+        org_data, proposal_nodes = fetched
+
+        if self.batch_mode:
+            impacts = await self._analyze_proposals(proposal_nodes)
+            for proposal, impact in zip(proposal_nodes, impacts):
+                yield self._build_proposal_update(dao_slug, org_data, proposal, impact)
+            return
+
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def analyze(proposal: Dict) -> Tuple[Dict, ImpactAnalysis]:
+            async with semaphore:
+                return proposal, await self._aanalyze_proposal_impact(proposal)
+
+        tasks = [asyncio.ensure_future(analyze(proposal)) for proposal in proposal_nodes]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                proposal, impact = await next_done
+                yield self._build_proposal_update(dao_slug, org_data, proposal, impact)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_dao_updates(self, dao_slug: str, user_holdings: Optional[Dict] = None) -> Optional[List[DaoUpdate]]:
+        """Get AI-curated updates for a DAO, or None if its data cannot be loaded."""
+        try:
+            logger.info(f"Getting updates for DAO: {dao_slug}")
+            updates: List[DaoUpdate] = []
+
+            fetched = await self._fetch_proposals(dao_slug)
+            if fetched is None:
+                return None
+            org_data, proposal_nodes = fetched
+
+            impacts = await self._analyze_proposals(proposal_nodes)
+            for proposal, impact in zip(proposal_nodes, impacts):
+                updates.append(self._build_proposal_update(dao_slug, org_data, proposal, impact))
 
             logger.info(f"Generated {len(updates)} updates for DAO: {dao_slug}")
             return sorted(updates, key=lambda x: {'urgent': 0, 'important': 1, 'fyi': 2}[x.priority], reverse=True)
 
         except Exception as e:
             logger.error(f"Error getting DAO updates: {str(e)}")
-            return []
+            return None
+
+    async def sync_dao_updates(self, dao_slug: str,
+                               previous: List[DaoUpdate]) -> Optional[Tuple[List[DaoUpdate], ProposalDelta]]:
+        """Incrementally refresh a DAO's updates against its last-seen proposal state.
+
+        Only new proposals, status transitions, edited metadata and vote
+        movements above the sync threshold are re-analyzed; updates for the
+        remaining proposals are carried over from `previous`. Returns the
+        merged updates and the delta, or None if the DAO cannot be loaded.
+        """
+        logger.info(f"Syncing updates for DAO: {dao_slug}")
+        fetched = await self._fetch_proposals(dao_slug)
+        if fetched is None:
+            return None
+        org_data, proposal_nodes = fetched
+
+        delta = self.proposal_sync.diff(dao_slug, proposal_nodes)
+        previous_by_id = {str(update.metadata.get('proposal_id')): update for update in previous}
+        to_analyze = set(delta.changed_ids)
+        # Unchanged proposals missing from the previous feed still need an update
+        to_analyze.update(proposal_id for proposal_id in delta.unchanged if proposal_id not in previous_by_id)
+
+        changed = [proposal for proposal in proposal_nodes if str(proposal.get('id')) in to_analyze]
+        impacts = await self._analyze_proposals(changed)
+        rebuilt = {}
+        analyzed = []
+        for proposal, impact in zip(changed, impacts):
+            rebuilt[str(proposal['id'])] = self._build_proposal_update(dao_slug, org_data, proposal, impact)
+            if impact.summary not in FAILED_IMPACT_SUMMARIES:
+                analyzed.append(proposal)
+
+        updates = []
+        for proposal in proposal_nodes:
+            proposal_id = str(proposal.get('id'))
+            update = rebuilt.get(proposal_id) or previous_by_id.get(proposal_id)
+            if update is not None:
+                updates.append(update)
+
+        self.proposal_sync.commit(dao_slug, analyzed, removed=delta.removed)
+        logger.info(f"Synced DAO {dao_slug}: {len(changed)} of {len(proposal_nodes)} proposals re-analyzed, "
+                    f"{len(delta.removed)} removed")
+        return sorted(updates, key=lambda x: {'urgent': 0, 'important': 1, 'fyi': 2}[x.priority], reverse=True), delta
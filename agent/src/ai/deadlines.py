@@ -0,0 +1,306 @@
+# agent/src/ai/deadlines.py
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Set, Tuple
+from pydantic import BaseModel
+from ..tally.store import ResponseStore
+
+logger = logging.getLogger(__name__)
+
+DEADLINE_PREFIX = "deadline:"
+
+# Proposal statuses whose voting window has not closed yet
+OPEN_STATUSES = ('pending', 'active', 'extended')
+
+
+class DeadlineEvent(BaseModel):
+    """A voting start or end threshold of one proposal."""
+    key: str
+    dao_slug: str
+    dao_name: str = ''
+    proposal_id: str
+    title: str
+    kind: Literal['voting_starts', 'voting_ends']
+    lead: float  # seconds before the deadline the event fires
+    deadline: float  # unix time voting starts or ends
+    fire_at: float
+    fired: bool = False
+
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """Unix time of a Tally timestamp (ISO 8601) or of a Block/BlocklessTimestamp object holding one."""
+    if isinstance(value, dict):
+        value = value.get('timestamp')
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class DeadlineScheduler:
+    """Fires events as tracked proposals approach their voting start and end.
+
+    Pending events sit in a min-heap ordered by fire time, so scheduling and
+    cancelling cost O(log n) and finding due events never scans the tracked
+    proposals. Cancelled or rescheduled heap entries are dropped lazily when
+    they surface. Events are persisted in a ResponseStore when one is given,
+    so pending and already-fired events survive restarts.
+    """
+
+    def __init__(self, store: Optional[ResponseStore] = None,
+                 start_leads: Sequence[float] = (0.0,), end_leads: Sequence[float] = (86400.0, 3600.0),
+                 tolerance: float = 300.0, max_sleep: float = 60.0):
+        """Initialize the scheduler.
+
+        Args:
+            store: Optional persistent tier for scheduled and fired events
+            start_leads: Seconds before voting starts to fire an event, 0 meaning when it opens
+            end_leads: Seconds before voting ends to fire an event, e.g. 86400 for "closes within 24h"
+            tolerance: Deadline moves smaller than this (block time estimates drift) keep the existing event
+            max_sleep: Longest the background loop waits between checks
+        """
+        self.store = store
+        self.leads = {'voting_starts': sorted(start_leads, reverse=True),
+                      'voting_ends': sorted(end_leads, reverse=True)}
+        self.tolerance = tolerance
+        self.max_sleep = max_sleep
+        self._heap: List[Tuple[float, int, str]] = []
+        self._events: Dict[str, DeadlineEvent] = {}
+        self._seq: Dict[str, int] = {}
+        self._by_proposal: Dict[str, Set[str]] = {}
+        self._by_dao: Dict[str, Set[str]] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._counters = {'scheduled': 0, 'cancelled': 0, 'fired': 0, 'expired': 0}
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        if store is not None:
+            for _, stored in store.scan(DEADLINE_PREFIX):
+                self._track(DeadlineEvent(**stored))
+            logger.info(f"Loaded {len(self._events)} proposal deadline events")
+
+    def _track(self, event: DeadlineEvent) -> None:
+        self._events[event.key] = event
+        self._by_proposal.setdefault(event.proposal_id, set()).add(event.key)
+        self._by_dao.setdefault(event.dao_slug, set()).add(event.proposal_id)
+        if not event.fired:
+            seq = next(self._counter)
+            self._seq[event.key] = seq
+            heapq.heappush(self._heap, (event.fire_at, seq, event.key))
+
+    def _forget(self, key: str) -> None:
+        event = self._events.pop(key)
+        self._seq.pop(key, None)
+        keys = self._by_proposal.get(event.proposal_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_proposal[event.proposal_id]
+                self._by_dao.get(event.dao_slug, set()).discard(event.proposal_id)
+        if self.store is not None:
+            self.store.delete(f"{DEADLINE_PREFIX}{key}")
+        # Drop dead heap entries once they outnumber the live ones
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._seq):
+            self._heap = [entry for entry in self._heap if self._seq.get(entry[2]) == entry[1]]
+            heapq.heapify(self._heap)
+
+    def _save(self, event: DeadlineEvent) -> None:
+        if self.store is not None:
+            self.store.put(f"{DEADLINE_PREFIX}{event.key}", 'DeadlineEvent', event.dict())
+
+    def _candidates(self, dao_slug: str, dao_name: str, proposal: Dict, now: float) -> List[DeadlineEvent]:
+        proposal_id = str(proposal.get('id'))
+        title = (proposal.get('metadata') or {}).get('title') or f"Proposal {proposal_id}"
+        status = str(proposal.get('status') or '').lower()
+        deadlines = {'voting_ends': parse_timestamp(proposal.get('end'))}
+        if status == 'pending':
+            deadlines['voting_starts'] = parse_timestamp(proposal.get('start'))
+
+        events = []
+        for kind, deadline in deadlines.items():
+            if deadline is None or deadline <= now:
+                continue
+            overdue = [lead for lead in self.leads[kind] if deadline - lead <= now]
+            for lead in self.leads[kind]:
+                events.append(DeadlineEvent(
+                    key=f"{proposal_id}:{kind}:{int(lead)}", dao_slug=dao_slug, dao_name=dao_name, proposal_id=proposal_id,
+                    title=title, kind=kind, lead=lead, deadline=deadline, fire_at=deadline - lead,
+                    # Of the thresholds already crossed when first seen, only the tightest fires
+                    fired=bool(overdue) and lead != min(overdue) and lead in overdue
+                ))
+        return events
+
+    def sync(self, dao_slug: str, proposals: List[Dict], dao_name: str = '', now: Optional[float] = None) -> None:
+        """Schedules the deadlines of a DAO's open proposals and cancels the rest.
+
+        Proposals whose deadlines did not move leave the heap untouched.
+        """
+        now = time.time() if now is None else now
+        earliest = None
+        with self._lock:
+            seen = set()
+            for proposal in proposals:
+                proposal_id = str(proposal.get('id'))
+                seen.add(proposal_id)
+                status = str(proposal.get('status') or '').lower()
+                wanted = {event.key: event for event in self._candidates(dao_slug, dao_name, proposal, now)} \
+                    if status in OPEN_STATUSES else {}
+                for key in list(self._by_proposal.get(proposal_id, ())):
+                    if key not in wanted:
+                        self._forget(key)
+                        self._counters['cancelled'] += 1
+                for key, event in wanted.items():
+                    current = self._events.get(key)
+                    if current is not None and abs(current.deadline - event.deadline) < self.tolerance:
+                        continue
+                    if current is not None:
+                        self._forget(key)
+                    self._track(event)
+                    self._save(event)
+                    if not event.fired:
+                        self._counters['scheduled'] += 1
+                        earliest = event.fire_at if earliest is None else min(earliest, event.fire_at)
+            for proposal_id in list(self._by_dao.get(dao_slug, ())):
+                if proposal_id not in seen:
+                    self._cancel(proposal_id)
+        if earliest is not None:
+            self._wake()
+
+    def cancel(self, proposal_id: str) -> int:
+        """Drops every event of a proposal; returns how many were dropped."""
+        with self._lock:
+            return self._cancel(str(proposal_id))
+
+    def _cancel(self, proposal_id: str) -> int:
+        keys = list(self._by_proposal.get(proposal_id, ()))
+        for key in keys:
+            self._forget(key)
+        self._counters['cancelled'] += len(keys)
+        return len(keys)
+
+    def pop_due(self, now: Optional[float] = None) -> List[DeadlineEvent]:
+        """Marks every event whose fire time has passed as fired and returns them in order.
+
+        Events whose deadline has passed too (after a restart or a stalled
+        loop) are dropped without being returned; those firing at the deadline
+        itself get `tolerance` seconds of grace.
+        """
+        now = time.time() if now is None else now
+        due = []
+        expired = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, seq, key = heapq.heappop(self._heap)
+                if self._seq.get(key) != seq:
+                    continue
+                del self._seq[key]
+                event = self._events[key]
+                event.fired = True
+                grace = self.tolerance if event.lead <= 0 else 0.0
+                if event.deadline + grace <= now:
+                    expired.append(event)
+                    continue
+                self._save(event)
+                due.append(event)
+            # Fired events are kept only to stop re-syncs from firing them again, which past deadlines cannot
+            for event in expired + due:
+                if event.deadline <= now:
+                    self._forget(event.key)
+            self._counters['fired'] += len(due)
+            self._counters['expired'] += len(expired)
+        return due
+
+    def next_fire_at(self) -> Optional[float]:
+        with self._lock:
+            while self._heap and self._seq.get(self._heap[0][2]) != self._heap[0][1]:
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def _wake(self) -> None:
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _run(self, on_fire: Callable[[List[DeadlineEvent]], Any]) -> None:
+        while True:
+            events = self.pop_due()
+            if events:
+                logger.info(f"Firing {len(events)} proposal deadline events")
+                try:
+                    result = on_fire(events)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.error(f"Deadline event handler failed: {str(e)}")
+            next_at = self.next_fire_at()
+            timeout = self.max_sleep if next_at is None else min(self.max_sleep, max(0.0, next_at - time.time()))
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self, on_fire: Callable[[List[DeadlineEvent]], Any]) -> None:
+        """Fires due events in the background, passing each batch to on_fire."""
+        if self._task is None or self._task.done():
+            logger.info("Starting proposal deadline scheduler")
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run(on_fire))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._loop = None
+            self._wakeup = None
+
+    def stats(self) -> Dict[str, Any]:
+        next_at = self.next_fire_at()
+        with self._lock:
+            return {
+                'pending': len(self._seq),
+                'tracked_proposals': len(self._by_proposal),
+                'next_in_seconds': round(next_at - time.time(), 1) if next_at is not None else None,
+                **self._counters,
+            }
+
+
+_default_scheduler: Optional[DeadlineScheduler] = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_deadline_scheduler() -> DeadlineScheduler:
+    """Returns the process-wide scheduler, persisted if DEADLINES_PATH is set.
+
+    DEADLINE_END_ALERT_HOURS lists the hours before voting closes to alert at (default "24,1").
+    """
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            path = os.getenv('DEADLINES_PATH')
+            hours = os.getenv('DEADLINE_END_ALERT_HOURS', '24,1')
+            _default_scheduler = DeadlineScheduler(
+                store=ResponseStore(path) if path else None,
+                end_leads=[float(hour) * 3600 for hour in hours.split(',') if hour.strip()]
+            )
+        return _default_scheduler
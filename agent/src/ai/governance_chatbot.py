@@ -1,24 +1,31 @@
+import asyncio
 import os
 import logging
-from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
-from cdp_langchain.agent_toolkits import CdpToolkit
-from cdp_langchain.utils import CdpAgentkitWrapper
-from langgraph.prebuilt import create_react_agent
+from typing import AsyncIterator, Optional
+from agent.src.tally.catalog import get_organization_catalog
 from agent.src.tally.client import TallyClient
+from agent.src.ai.chat_cache import dao_fingerprint, get_chat_cache, is_cacheable
+from agent.src.ai.intents import IntentParser
+from agent.src.tally.session import run_sync
 
-# ✅ Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# ✅ Load environment variables
-load_dotenv()
-
 class GovernanceChatbot:
-    def __init__(self):
-        """Initialize chatbot with AI model, CDP AgentKit, and Tally API Client."""
+    def __init__(self, max_retries: int = 5, backoff: float = 1.0):
+        """Initialize chatbot with AI model, CDP AgentKit, and the organization catalog.
+
+        Args:
+            max_retries: Attempts at an agent run before giving up
+            backoff: Seconds before the first retry, doubled after each failure
+        """
         logger.info("Initializing Governance Chatbot...")
 
+        # ✅ Load the model and CDP stacks only when a chatbot is built
+        from langchain_openai import ChatOpenAI
+        from cdp_langchain.agent_toolkits import CdpToolkit
+        from cdp_langchain.utils import CdpAgentkitWrapper
+        from langgraph.prebuilt import create_react_agent
+
         # ✅ Choose a cost-effective model
         self.llm = ChatOpenAI(model="gpt-3.5-turbo")  # ✅ More efficient than GPT-4
 
@@ -42,8 +49,17 @@ class GovernanceChatbot:
         cdp_toolkit = CdpToolkit.from_cdp_agentkit_wrapper(self.cdp)
         tools = cdp_toolkit.get_tools()
 
-        # ✅ Initialize Tally API Client
+        # ✅ DAO details come from the shared, background-refreshed catalog,
+        # with the cached Tally client for DAOs outside it (other chains)
+        self.catalog = get_organization_catalog()
         self.tally_client = TallyClient()
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+        # ✅ Reuse answers to repeated informational questions
+        self.response_cache = get_chat_cache("governance_chatbot")
+        self._parser = None
+        self._parser_generation = None
 
         # ✅ Customize the AI state
         state_modifier = """
@@ -56,81 +72,108 @@ class GovernanceChatbot:
         # ✅ Create AI Agent
         self.agent_executor = create_react_agent(self.llm, tools, state_modifier=state_modifier)
 
-    def chat(self, user_input: str) -> str:
-        """Processes user input and returns a response with retries and error handling."""
-        
-        # ✅ Handle DAO Queries using Tally API (with delay)
-        if user_input.lower().startswith("dao "):
-            dao_slug = user_input.split(" ", 1)[1]
-            retries = 5
-            delay = 2.0  # Start with a 2-second delay
-
-            for attempt in range(retries):
-                try:
-                    dao_data = self.tally_client.get_organization(dao_slug)
-
-                    if dao_data and "data" in dao_data and "organization" in dao_data["data"]:
-                        dao = dao_data["data"]["organization"]
-                        return f"\nDAO Name: {dao['name']}\nDescription: {dao['metadata']['description']}"
-                    else:
-                        return "DAO not found or invalid response from API."
-
-                except Exception as e:
-                    logger.error(f"Tally API Error: {str(e)}. Retrying in {delay:.1f} seconds...")
-                    time.sleep(delay)
-                    delay *= 2  # Exponential backoff
+    def _fingerprints(self, user_input: str) -> dict:
+        """Current data fingerprints of the catalog DAOs a message mentions."""
+        if self._parser is None or self._parser_generation != self.catalog.loaded_at:
+            self._parser = IntentParser({org['slug']: {"name": org.get('name', '')} for org in self.catalog.organizations()})
+            self._parser_generation = self.catalog.loaded_at
+        return {slug: dao_fingerprint(self.catalog.get_by_slug(slug)) for slug in self._parser.find_daos(user_input.lower())}
+
+    async def _fetch_organization(self, dao_slug: str) -> Optional[dict]:
+        """Looks up a DAO the catalog does not hold (other chains, or not loaded yet) through the cached client."""
+        try:
+            dao_data = await self.tally_client.aio.get_organization(dao_slug)
+        except Exception as e:
+            logger.error(f"Failed to fetch data for DAO {dao_slug}: {str(e)}")
+            return None
+        if not dao_data or not (dao_data.get('data') or {}).get('organization'):
+            return None
+        return dao_data['data']['organization']
+
+    async def astream(self, user_input: str) -> AsyncIterator[str]:
+        """Yields the agent and tool messages of a reply as each one completes.
+
+        Failed runs are retried with non-blocking exponential backoff as long
+        as nothing has been sent yet.
+        """
 
-            return "Error fetching DAO data. Please try again later."
+        # ✅ Handle DAO Queries from the shared organization catalog, asking Tally only on a miss
+        if user_input.lower().startswith("dao "):
+            dao_slug = user_input.split(" ", 1)[1].strip()
+            loaded = await self.catalog.ensure_loaded()
+            dao = self.catalog.get_by_slug(dao_slug) if loaded else None
+            if dao is None:
+                dao = await self._fetch_organization(dao_slug)
+            if dao is None:
+                yield "DAO not found or invalid response from API." if loaded else "Error fetching DAO data. Please try again later."
+                return
+            yield f"\nDAO Name: {dao['name']}\nDescription: {(dao.get('metadata') or {}).get('description', '')}"
+            return
+
+        # ✅ Serve repeated informational questions from the response cache
+        fingerprints = self._fingerprints(user_input) if is_cacheable(user_input) else None
+        if fingerprints is not None:
+            cached = self.response_cache.get(user_input, fingerprints)
+            if cached is not None:
+                yield cached
+                return
 
         # ✅ Handle General AI Queries with Exponential Backoff
-        retries = 5
-        delay = 1.0  # Start with 1-second delay
-
-        for attempt in range(retries):
+        delay = self.backoff
+        for attempt in range(self.max_retries):
+            messages = []
             try:
-                events = list(self.agent_executor.stream({"messages": [("user", user_input)]}))
-
-                # ✅ Log the response structure for debugging
-                logger.info(f"AI Response: {events}")
-
-                if not events:
-                    return "No response received from AI."
-
-                # ✅ Extract messages safely
-                messages = []
-                for event in events:
-                    if isinstance(event, dict):
-                        # Extract AI response from 'agent' key
-                        if "agent" in event and "messages" in event["agent"]:
-                            for msg in event["agent"]["messages"]:
-                                if hasattr(msg, "content"):
-                                    messages.append(msg.content)
-
-                        # Extract tool messages if available
-                        elif "tools" in event and "messages" in event["tools"]:
-                            for tool_msg in event["tools"]["messages"]:
-                                if hasattr(tool_msg, "content"):
-                                    messages.append(tool_msg.content)
-
+                async for event in self.agent_executor.astream({"messages": [("user", user_input)]}, stream_mode="updates"):
+                    logger.debug(f"Agent step: {list(event) if isinstance(event, dict) else type(event).__name__}")
+                    if not isinstance(event, dict):
+                        continue
+                    # Agent replies arrive under 'agent', tool results under 'tools'
+                    for node in ("agent", "tools"):
+                        for msg in (event.get(node) or {}).get("messages", []):
+                            if getattr(msg, "content", None):
+                                messages.append(msg.content)
+                                yield msg.content
+            except Exception as e:
                 if messages:
-                    return "\n".join(messages)
-                else:
-                    return "Response format unexpected. Check logs for details."
+                    # Part of the reply is already out; it cannot be retried
+                    logger.error(f"Chatbot Error after partial reply: {str(e)}")
+                    yield "There was an issue processing your request. Please try again later."
+                    return
+                if attempt + 1 < self.max_retries:
+                    logger.error(f"Chatbot Error: {str(e)}. Retrying in {delay:.1f} seconds...")
+                    await asyncio.sleep(delay)
+                    delay *= 2  # Exponential backoff
+                continue
 
-            except Exception as e:
-                logger.error(f"Chatbot Error: {str(e)}. Retrying in {delay:.1f} seconds...")
-                time.sleep(delay)
-                delay *= 2  # Exponential backoff
+            if not messages:
+                yield "No response received from AI."
+            elif fingerprints is not None:
+                self.response_cache.put(user_input, "\n".join(messages), fingerprints)
+            return
+
+        yield "There was an issue processing your request. Please try again later."
 
-        return "There was an issue processing your request. Please try again later."
+    async def achat(self, user_input: str) -> str:
+        """Returns the complete reply to a message."""
+        return "\n".join([part async for part in self.astream(user_input)])
+
+    def chat(self, user_input: str) -> str:
+        """Blocking counterpart of achat for synchronous callers."""
+        return run_sync(self.achat(user_input))
 
 
 # ✅ Run chatbot interactively for testing
 if __name__ == "__main__":
-    bot = GovernanceChatbot()
-    while True:
-        user_input = input("\nUser: ")
-        if user_input.lower() == "exit":
-            break
-        response = bot.chat(user_input)
-        print(response)
+    from agent.src.config import configure
+    configure()
+
+    async def main():
+        bot = GovernanceChatbot()
+        while True:
+            user_input = input("\nUser: ")
+            if user_input.lower() == "exit":
+                break
+            async for part in bot.astream(user_input):
+                print(part, flush=True)
+
+    asyncio.run(main())
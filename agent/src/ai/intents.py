@@ -0,0 +1,115 @@
+# agent/src/ai/intents.py
+
+import re
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel
+
+ADDRESS_PATTERN = re.compile(r'\b0x[0-9a-fA-F]{40}\b')
+AMOUNT_PATTERN = re.compile(r'(?<![\w.#])(\d[\d,]*(?:\.\d+)?)(?![\w.])')
+ALL_PATTERN = re.compile(r'\b(all|everything|entire|max)\b')
+PROPOSAL_PATTERN = re.compile(r'\bproposal\s*(?:id\s*)?(?:#|no\.?\s*|number\s*)?(\d+)\b|#(\d+)\b')
+DELEGATE_PATTERN = re.compile(r'\bdelegat(?:e|ing)\b')
+VOTE_PATTERN = re.compile(r'\bvot(?:e|ing)\b')
+# Questions and hypotheticals ask about an action rather than request one
+QUESTION_PATTERN = re.compile(r'\?|\b(?:who|what|how|why|when|which|should|would|could|if)\b')
+DELEGATE_TARGET_PATTERN = re.compile(r'\bto\s+(\S+)')
+
+# Trailing words people drop when naming a DAO ("Seamless" for "Seamless Protocol")
+GENERIC_NAME_SUFFIXES = ('protocol', 'dao', 'finance', 'network')
+
+VOTE_CHOICES = [
+    (re.compile(r'\babstain'), 'abstain'),
+    (re.compile(r'\bvot(?:e|ing)\s+(?:to\s+)?(?:against|no)\b|\bagainst\b'), 'against'),
+    (re.compile(r'\bvot(?:e|ing)\s+(?:to\s+)?(?:for|yes|in favou?r)\b|\bin favou?r\b|\bsupport\b'), 'for'),
+]
+
+
+class ParsedIntent(BaseModel):
+    """What the rule-based parser understood from a chat message.
+
+    `kind` is None for informational messages. `ambiguous` is set when the
+    message mentions an action but a required field could not be pinned down,
+    or when it is phrased as a question or hypothetical.
+    """
+    kind: Optional[Literal['delegate', 'vote']] = None
+    dao_slug: Optional[str] = None
+    amount: Optional[str] = None
+    delegate_to: Optional[str] = None
+    proposal_id: Optional[str] = None
+    vote: Optional[Literal['for', 'against', 'abstain']] = None
+    ambiguous: bool = False
+
+
+class IntentParser:
+    """Recognizes common delegate and vote phrasings without a model call.
+
+    Handles messages like "delegate 100 SEAM to 0x…" or "vote for proposal
+    123 in gloom". DAOs are recognized by slug, name or token symbol.
+    """
+
+    def __init__(self, daos: Dict[str, Dict[str, str]]):
+        """Initialize the parser.
+
+        Args:
+            daos: DAO details by slug, each with a name and optionally a token symbol
+        """
+        self._aliases: List[tuple] = []
+        for slug, info in daos.items():
+            name = info.get('name', '').lower()
+            aliases = {slug, slug.replace('-', ' '), name, info.get('symbol', '').lower()}
+            short_name, _, suffix = name.rpartition(' ')
+            if short_name and suffix in GENERIC_NAME_SUFFIXES:
+                aliases.add(short_name)
+            for alias in aliases:
+                if alias:
+                    self._aliases.append((re.compile(rf'(?<![\w-]){re.escape(alias)}(?![\w-])'), slug))
+
+    def find_daos(self, text: str) -> List[str]:
+        """Slugs of the DAOs a lowercased message mentions."""
+        return list(dict.fromkeys(slug for pattern, slug in self._aliases if pattern.search(text)))
+
+    def parse(self, message: str) -> ParsedIntent:
+        text = message.lower()
+        wants_delegate = bool(DELEGATE_PATTERN.search(text))
+        wants_vote = bool(VOTE_PATTERN.search(text))
+        if not wants_delegate and not wants_vote:
+            return ParsedIntent()
+        if wants_delegate and wants_vote:
+            return ParsedIntent(ambiguous=True)
+
+        # Never turn a question into a ready-to-sign transaction; the LLM path decides
+        asks = bool(QUESTION_PATTERN.search(text))
+        daos = self.find_daos(text)
+        dao_slug = daos[0] if len(daos) == 1 else None
+
+        if wants_delegate:
+            addresses = ADDRESS_PATTERN.findall(message)
+            # "to vitalik.eth" names a delegate we cannot resolve; don't fall back to self-delegation
+            target = DELEGATE_TARGET_PATTERN.search(text, DELEGATE_PATTERN.search(text).end())
+            unresolved_target = target is not None and not ADDRESS_PATTERN.fullmatch(target.group(1).rstrip('.,;!'))
+            amounts = AMOUNT_PATTERN.findall(ADDRESS_PATTERN.sub(' ', message))
+            if ALL_PATTERN.search(text):
+                amount = 'all'
+            elif len(amounts) == 1:
+                amount = amounts[0].replace(',', '')
+            else:
+                amount = None
+            return ParsedIntent(
+                kind='delegate',
+                dao_slug=dao_slug,
+                amount=amount,
+                delegate_to=addresses[0] if len(addresses) == 1 else None,
+                ambiguous=asks or unresolved_target or dao_slug is None or amount is None or len(addresses) > 1
+            )
+
+        proposals = {a or b for a, b in PROPOSAL_PATTERN.findall(text)}
+        choices = {choice for pattern, choice in VOTE_CHOICES if pattern.search(text)}
+        proposal_id = proposals.pop() if len(proposals) == 1 else None
+        vote = choices.pop() if len(choices) == 1 else None
+        return ParsedIntent(
+            kind='vote',
+            dao_slug=dao_slug,
+            proposal_id=proposal_id,
+            vote=vote,
+            ambiguous=asks or dao_slug is None or proposal_id is None or vote is None
+        )
@@ -0,0 +1,86 @@
+# agent/src/ai/lazy_agent.py
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class LazyAgent(Generic[T]):
+    """Process-scoped agent built on first use instead of at import time.
+
+    Construction runs in a worker thread so the event loop keeps serving
+    requests (and /health) meanwhile; concurrent first callers share one
+    build. A failed build is remembered for /ready and retried on next use.
+    """
+
+    def __init__(self, factory: Callable[[], T], name: str = 'agent'):
+        self.factory = factory
+        self.name = name
+        self._instance: Optional[T] = None
+        self._error: Optional[str] = None
+        self._init_seconds: Optional[float] = None
+        self._lock = threading.Lock()
+        self._building: Optional[asyncio.Future] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._instance is not None
+
+    def _build(self) -> T:
+        with self._lock:
+            if self._instance is not None:
+                return self._instance
+            logger.info(f"Initializing {self.name}...")
+            started = time.monotonic()
+            try:
+                instance = self.factory()
+            except Exception as e:
+                self._error = str(e)
+                logger.error(f"Failed to initialize {self.name}: {str(e)}")
+                raise
+            self._init_seconds = time.monotonic() - started
+            self._instance = instance
+            self._error = None
+            logger.info(f"{self.name} ready after {self._init_seconds:.2f}s")
+            return instance
+
+    def get(self) -> T:
+        """Returns the agent, building it in the calling thread if needed."""
+        return self._instance if self._instance is not None else self._build()
+
+    async def aget(self) -> T:
+        """Returns the agent, building it in a worker thread if needed."""
+        if self._instance is not None:
+            return self._instance
+        if self._building is None or self._building.done():
+            self._building = asyncio.ensure_future(asyncio.to_thread(self._build))
+        return await asyncio.shield(self._building)
+
+    def warmup(self) -> None:
+        """Starts building the agent in the background without waiting for it."""
+        if self._instance is None and (self._building is None or self._building.done()):
+            self._building = asyncio.ensure_future(asyncio.to_thread(self._build))
+            # The error is recorded for /ready; do not report it as unretrieved
+            self._building.add_done_callback(lambda future: future.cancelled() or future.exception())
+
+    def status(self) -> Dict[str, Any]:
+        if self._instance is not None:
+            state = 'ready'
+        elif self._building is not None and not self._building.done():
+            state = 'starting'
+        elif self._error is not None:
+            state = 'error'
+        else:
+            state = 'idle'
+        return {
+            'agent': self.name,
+            'status': state,
+            'init_seconds': round(self._init_seconds, 3) if self._init_seconds is not None else None,
+            'error': self._error,
+        }
@@ -0,0 +1,464 @@
+# agent/src/ai/notifications.py
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Literal, Optional, Set, Tuple
+from urllib.parse import urlsplit
+import httpx
+from pydantic import BaseModel, Field
+from ..tally.rate_limit import parse_retry_after
+from ..tally.store import ResponseStore
+from .dao_updates import DaoUpdate, UpdateAction
+from .deadlines import DeadlineEvent
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIPTION_PREFIX = "notify:sub:"
+PUBLISHED_PREFIX = "notify:seen:"
+ANY = "*"
+
+# Hosts subscribers may point webhooks at; the server POSTs to them, so nothing internal
+DISCORD_WEBHOOK_HOSTS = ('discord.com', 'discordapp.com', 'canary.discord.com', 'ptb.discord.com')
+# How long a signed subscribe/unsubscribe message stays valid
+OWNERSHIP_PROOF_MAX_AGE = 300
+
+# Discord embed colours per priority tier
+PRIORITY_COLORS = {'urgent': 0xE74C3C, 'important': 0xF1C40F, 'fyi': 0x3498DB}
+
+
+class NotifyOn(BaseModel):
+    urgent: bool = True
+    important: bool = True
+    fyi: bool = False
+
+
+class NotificationPreferences(BaseModel):
+    """What a subscriber wants to hear about; field names match the frontend."""
+    discordWebhookUrl: Optional[str] = None
+    notifyOn: NotifyOn = Field(default_factory=NotifyOn)
+    daos: Optional[List[str]] = None  # None means every DAO
+    categories: Optional[List[Literal['proposal', 'treasury', 'governance', 'social']]] = None  # None means every category
+
+
+class Subscription(BaseModel):
+    address: str
+    preferences: NotificationPreferences
+
+
+def format_embed(update: DaoUpdate) -> Dict[str, Any]:
+    """Renders an update as a Discord embed."""
+    embed = {
+        "title": f"[{update.priority.upper()}] {update.dao_name}: {update.title}"[:256],
+        "description": update.description[:4096],
+        "color": PRIORITY_COLORS.get(update.priority, 0),
+        "timestamp": update.timestamp,
+        "footer": {"text": f"{update.category} · {update.dao_slug}"},
+    }
+    link = next((action.url for action in update.actions or [] if action.type == 'link'), None)
+    if link:
+        embed["url"] = link
+    return embed
+
+
+def embed_size(embed: Dict[str, Any]) -> int:
+    """Characters of an embed that count towards Discord's per-message limit."""
+    size = len(embed.get("title") or "") + len(embed.get("description") or "")
+    size += len((embed.get("footer") or {}).get("text") or "") + len((embed.get("author") or {}).get("name") or "")
+    for field in embed.get("fields") or []:
+        size += len(field.get("name") or "") + len(field.get("value") or "")
+    return size
+
+
+def deadline_update(event: DeadlineEvent) -> DaoUpdate:
+    """Turns a fired voting deadline into an urgent update."""
+    hours = round(event.lead / 3600)
+    when = datetime.fromtimestamp(event.deadline, tz=timezone.utc).isoformat()
+    if event.kind == 'voting_starts':
+        title = f"Voting opens: {event.title}" if hours == 0 else f"Voting opens within {hours}h: {event.title}"
+        description = f"Voting on \"{event.title}\" opens at {when}."
+    else:
+        title = f"Voting closes within {hours}h: {event.title}" if hours else f"Voting closes now: {event.title}"
+        description = f"Voting on \"{event.title}\" closes at {when}. Cast your vote before it ends."
+    return DaoUpdate(
+        id=f"deadline_{event.key}",
+        dao_slug=event.dao_slug,
+        dao_name=event.dao_name or event.dao_slug,
+        title=title,
+        description=description,
+        priority='urgent',
+        category='proposal',
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        metadata={'proposal_id': event.proposal_id, 'deadline': when, 'kind': event.kind},
+        actions=[UpdateAction(type='link', label='Vote', url=f"https://www.tally.xyz/gov/{event.dao_slug}/proposal/{event.proposal_id}")]
+    )
+
+
+def validate_webhook_url(url: Optional[str], allowed_hosts=DISCORD_WEBHOOK_HOSTS) -> Optional[str]:
+    """Returns why a webhook URL may not be used, or None if it is an https URL on an allowed host."""
+    if not url:
+        return "A webhook URL is required"
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return "The webhook URL is malformed"
+    if parts.scheme != 'https':
+        return "The webhook URL must use https"
+    if parts.username or parts.password or port not in (None, 443):
+        return "The webhook URL may not carry credentials or a custom port"
+    if (parts.hostname or '').lower() not in allowed_hosts:
+        return f"Webhooks must point at one of: {', '.join(allowed_hosts)}"
+    return None
+
+
+def ownership_message(action: str, address: str, timestamp: int) -> str:
+    """The text a wallet signs (EIP-191 personal_sign) to prove it may change its subscription."""
+    return f"Tabula notifications: {action} {address.lower()} at {timestamp}"
+
+
+def verify_ownership(action: str, address: str, timestamp: int, signature: str,
+                     max_age: float = OWNERSHIP_PROOF_MAX_AGE) -> bool:
+    """Checks that `signature` signs the ownership message for this action by `address` and is recent."""
+    if abs(time.time() - timestamp) > max_age:
+        return False
+    from eth_account import Account
+    from eth_account.messages import encode_defunct
+
+    try:
+        signer = Account.recover_message(encode_defunct(text=ownership_message(action, address, timestamp)),
+                                         signature=signature)
+    except Exception as e:
+        logger.warning(f"Invalid ownership signature for {address}: {str(e)}")
+        return False
+    return signer.lower() == address.lower()
+
+
+def redact(url: str) -> str:
+    """Webhook URLs embed their secret token; log only the host."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}/…"
+
+
+class SubscriptionIndex:
+    """Inverted index from (DAO, category, priority) to subscriber addresses.
+
+    A subscription without a DAO or category filter is filed under "*" for
+    that field, so matching an update reads four buckets however many
+    subscribers there are.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[str, str, str], Set[str]] = defaultdict(set)
+
+    @staticmethod
+    def keys(preferences: NotificationPreferences) -> List[Tuple[str, str, str]]:
+        priorities = [priority for priority, enabled in preferences.notifyOn.dict().items() if enabled]
+        return [
+            (dao_slug, category, priority)
+            for dao_slug in preferences.daos or [ANY]
+            for category in preferences.categories or [ANY]
+            for priority in priorities
+        ]
+
+    def add(self, address: str, preferences: NotificationPreferences) -> None:
+        for key in self.keys(preferences):
+            self._buckets[key].add(address)
+
+    def remove(self, address: str, preferences: NotificationPreferences) -> None:
+        for key in self.keys(preferences):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(address)
+                if not bucket:
+                    del self._buckets[key]
+
+    def match(self, dao_slug: str, category: str, priority: str) -> Set[str]:
+        matched: Set[str] = set()
+        for key in ((dao_slug, category, priority), (dao_slug, ANY, priority),
+                    (ANY, category, priority), (ANY, ANY, priority)):
+            matched |= self._buckets.get(key, set())
+        return matched
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class WebhookDispatcher:
+    """Delivers notifications to webhook endpoints through a bounded pool of workers.
+
+    Items queue per endpoint and go out in batches of up to `batch_size`
+    items and `max_chars` embed characters (Discord accepts 10 embeds and
+    6000 characters per message), so a burst of updates costs one
+    request per endpoint instead of one per update. An endpoint is served by
+    at most one worker at a time, which keeps its messages in order. Failed
+    posts are retried with exponential backoff, honouring Retry-After.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], httpx.AsyncClient]] = None,
+                 max_workers: int = 4, batch_size: int = 10, max_chars: int = 6000, max_pending: int = 100,
+                 retries: int = 3, backoff: float = 1.0, timeout: float = 10.0):
+        """Initialize the dispatcher.
+
+        Args:
+            session_factory: Builds the HTTP client used for delivery, defaults to an httpx.AsyncClient
+            max_workers: Most endpoints posted to at once
+            batch_size: Most items sent in one request
+            max_chars: Most embed characters sent in one request (Discord rejects messages over 6000)
+            max_pending: Most items queued per endpoint; the oldest are dropped beyond it
+            retries: Extra attempts after a 429, a 5xx or a connection error
+            backoff: Seconds before the first retry, doubled after each one
+            timeout: Seconds before a single post is abandoned
+        """
+        self.session_factory = session_factory or (lambda: httpx.AsyncClient(timeout=timeout))
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.max_chars = max_chars
+        self.max_pending = max_pending
+        self.retries = retries
+        self.backoff = backoff
+        self._pending: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._scheduled: Set[str] = set()
+        self._ready: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._session: Optional[httpx.AsyncClient] = None
+        self._counters = {'queued': 0, 'delivered': 0, 'batches': 0, 'retries': 0, 'failed': 0, 'dropped': 0}
+
+    def enqueue(self, url: str, item: Dict[str, Any]) -> None:
+        """Queues one item for an endpoint; delivery starts once the dispatcher runs."""
+        pending = self._pending.setdefault(url, deque())
+        if len(pending) >= self.max_pending:
+            pending.popleft()
+            self._counters['dropped'] += 1
+        pending.append(item)
+        self._counters['queued'] += 1
+        self._schedule(url)
+
+    def _schedule(self, url: str) -> None:
+        if self._ready is not None and url not in self._scheduled:
+            self._scheduled.add(url)
+            self._ready.put_nowait(url)
+
+    async def _work(self) -> None:
+        while True:
+            url = await self._ready.get()
+            try:
+                batch = self._next_batch(self._pending.get(url) or deque())
+                if batch:
+                    await self._deliver(url, batch)
+            except Exception as e:
+                logger.error(f"Webhook worker error for {redact(url)}: {str(e)}")
+            finally:
+                self._scheduled.discard(url)
+                if self._pending.get(url):
+                    self._schedule(url)
+                else:
+                    self._pending.pop(url, None)
+                self._ready.task_done()
+
+    def _next_batch(self, pending: Deque[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Takes queued items up to the batch size and character budget, always at least one."""
+        batch: List[Dict[str, Any]] = []
+        used = 0
+        while pending and len(batch) < self.batch_size:
+            size = embed_size(pending[0])
+            if batch and used + size > self.max_chars:
+                break
+            batch.append(pending.popleft())
+            used += size
+        return batch
+
+    async def _deliver(self, url: str, batch: List[Dict[str, Any]]) -> bool:
+        payload = {"content": f"{len(batch)} new DAO update{'s' if len(batch) != 1 else ''}", "embeds": batch}
+        delay = self.backoff
+        for attempt in range(self.retries + 1):
+            try:
+                response = await self._session.post(url, json=payload)
+                if response.status_code < 300:
+                    self._counters['delivered'] += len(batch)
+                    self._counters['batches'] += 1
+                    return True
+                if response.status_code != 429 and response.status_code < 500:
+                    logger.error(f"Webhook {redact(url)} rejected {len(batch)} notifications: HTTP {response.status_code}")
+                    break
+                wait = parse_retry_after(response.headers.get('Retry-After'))
+                wait = delay if wait is None else wait
+                logger.warning(f"Webhook {redact(url)} returned HTTP {response.status_code}")
+            except httpx.HTTPError as e:
+                wait = delay
+                logger.warning(f"Webhook {redact(url)} unreachable: {str(e)}")
+            if attempt < self.retries:
+                self._counters['retries'] += 1
+                await asyncio.sleep(wait)
+                delay *= 2  # Exponential backoff
+        self._counters['failed'] += len(batch)
+        return False
+
+    async def drain(self) -> None:
+        """Waits until everything queued so far has been delivered or given up on."""
+        if self._ready is not None:
+            await self._ready.join()
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        logger.info(f"Starting webhook dispatcher with {self.max_workers} workers")
+        self._ready = asyncio.Queue()
+        self._session = self.session_factory()
+        self._workers = [asyncio.ensure_future(self._work()) for _ in range(max(1, self.max_workers))]
+        for url in list(self._pending):
+            self._schedule(url)
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._ready = None
+        self._scheduled.clear()
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'endpoints_pending': len(self._pending),
+            'items_pending': sum(len(pending) for pending in self._pending.values()),
+            **self._counters,
+        }
+
+
+class NotificationService:
+    """Subscriptions, matching of new updates to subscribers, and their delivery.
+
+    Subscriptions are kept in memory with an inverted index and, when a
+    ResponseStore is given, on disk so they survive restarts. Only updates a
+    DAO's feed did not contain before are sent; the first feed seen for a DAO
+    is taken as the baseline.
+    """
+
+    def __init__(self, store: Optional[ResponseStore] = None, dispatcher: Optional[WebhookDispatcher] = None):
+        """Initialize the service.
+
+        Args:
+            store: Optional persistent tier for subscriptions and published update ids
+            dispatcher: Optional webhook dispatcher, defaults to one with default settings
+        """
+        self.store = store
+        self.dispatcher = dispatcher or WebhookDispatcher()
+        self._subscriptions: Dict[str, Subscription] = {}
+        self._index = SubscriptionIndex()
+        self._published: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        if store is not None:
+            for _, stored in store.scan(SUBSCRIPTION_PREFIX):
+                subscription = Subscription(**stored)
+                self._subscriptions[subscription.address] = subscription
+                self._index.add(subscription.address, subscription.preferences)
+            logger.info(f"Loaded {len(self._subscriptions)} notification subscriptions")
+
+    def subscribe(self, subscription: Subscription) -> Subscription:
+        """Adds or replaces the subscription of an address."""
+        subscription = Subscription(address=subscription.address.lower(), preferences=subscription.preferences)
+        with self._lock:
+            previous = self._subscriptions.get(subscription.address)
+            if previous is not None:
+                self._index.remove(previous.address, previous.preferences)
+            self._subscriptions[subscription.address] = subscription
+            self._index.add(subscription.address, subscription.preferences)
+        if self.store is not None:
+            self.store.put(f"{SUBSCRIPTION_PREFIX}{subscription.address}", "NotificationSubscription", subscription.dict())
+        return subscription
+
+    def unsubscribe(self, address: str) -> bool:
+        """Removes an address's subscription; returns False if it had none."""
+        address = address.lower()
+        with self._lock:
+            previous = self._subscriptions.pop(address, None)
+            if previous is not None:
+                self._index.remove(address, previous.preferences)
+        if previous is not None and self.store is not None:
+            self.store.delete(f"{SUBSCRIPTION_PREFIX}{address}")
+        return previous is not None
+
+    def get(self, address: str) -> Optional[Subscription]:
+        return self._subscriptions.get(address.lower())
+
+    def match(self, update: DaoUpdate) -> List[Subscription]:
+        """Subscriptions that want this update, found through the index."""
+        with self._lock:
+            addresses = self._index.match(update.dao_slug, update.category, update.priority)
+            return [self._subscriptions[address] for address in addresses]
+
+    def _previously_published(self, dao_slug: str) -> Optional[Set[str]]:
+        with self._lock:
+            published = self._published.get(dao_slug)
+        if published is None and self.store is not None:
+            stored = self.store.get(f"{PUBLISHED_PREFIX}{dao_slug}")
+            if stored is not None:
+                published = set(stored[0])
+        return published
+
+    def publish(self, dao_slug: str, updates: List[DaoUpdate]) -> int:
+        """Queues delivery of the updates new to a DAO's feed; returns how many deliveries were queued."""
+        if not updates:
+            # An empty feed is more likely a failed refresh than a DAO without proposals
+            return 0
+        previous = self._previously_published(dao_slug)
+        current = {update.id for update in updates}
+        # Only ever grow the seen ids, so an update dropping out of a feed is not re-sent when it returns
+        seen = current if previous is None else previous | current
+        with self._lock:
+            self._published[dao_slug] = seen
+        if self.store is not None:
+            self.store.put(f"{PUBLISHED_PREFIX}{dao_slug}", "PublishedUpdates", sorted(seen))
+        if previous is None:
+            logger.info(f"Recorded notification baseline of {len(current)} updates for DAO {dao_slug}")
+            return 0
+
+        return self.deliver([update for update in updates if update.id not in previous])
+
+    def deliver(self, updates: List[DaoUpdate]) -> int:
+        """Queues delivery of updates to every matching subscriber; returns how many deliveries were queued."""
+        queued = 0
+        for update in updates:
+            urls = {sub.preferences.discordWebhookUrl for sub in self.match(update) if sub.preferences.discordWebhookUrl}
+            if not urls:
+                continue
+            embed = format_embed(update)
+            for url in urls:
+                self.dispatcher.enqueue(url, embed)
+            queued += len(urls)
+        if queued:
+            logger.info(f"Queued {queued} notifications for {len(updates)} updates")
+        return queued
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            subscribers = len(self._subscriptions)
+            buckets = len(self._index)
+        return {'subscribers': subscribers, 'index_buckets': buckets, 'webhooks': self.dispatcher.stats()}
+
+
+_default_service: Optional[NotificationService] = None
+_default_service_lock = threading.Lock()
+
+
+def get_notification_service() -> NotificationService:
+    """Returns the process-wide notification service, persisted if NOTIFICATIONS_PATH is set."""
+    global _default_service
+    with _default_service_lock:
+        if _default_service is None:
+            path = os.getenv('NOTIFICATIONS_PATH')
+            _default_service = NotificationService(
+                store=ResponseStore(path) if path else None,
+                dispatcher=WebhookDispatcher(
+                    max_workers=int(os.getenv('NOTIFY_WEBHOOK_WORKERS', '4')),
+                    retries=int(os.getenv('NOTIFY_WEBHOOK_RETRIES', '3'))
+                )
+            )
+        return _default_service
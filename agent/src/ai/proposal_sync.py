@@ -0,0 +1,155 @@
+# agent/src/ai/proposal_sync.py
+
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+from ..tally.store import ResponseStore
+from .analysis_cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+
+def proposal_state(proposal: Dict) -> Dict[str, Any]:
+    """Reduces a Tally proposal to the fields incremental sync compares."""
+    metadata = proposal.get('metadata') or {}
+    return {
+        'status': proposal.get('status'),
+        'votes': {
+            str(stat.get('type')): _as_number(stat.get('votesCount'))
+            for stat in proposal.get('voteStats') or []
+        },
+        'metadata_hash': content_hash(metadata.get('title', ''), metadata.get('description', '')),
+    }
+
+
+def _as_number(value: Any) -> float:
+    # votesCount is a token amount in wei, sent as a string
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def vote_movement(previous: Dict[str, float], current: Dict[str, float]) -> float:
+    """Fraction of the previous vote total that moved between two voteStats snapshots."""
+    moved = sum(abs(current.get(vote_type, 0.0) - previous.get(vote_type, 0.0))
+                for vote_type in set(previous) | set(current))
+    total = sum(previous.values())
+    if total <= 0:
+        return 1.0 if moved > 0 else 0.0
+    return moved / total
+
+
+class ProposalDelta(BaseModel):
+    """What changed in a DAO's proposals since the last sync."""
+    new: List[str] = Field(default_factory=list)
+    status_changed: List[str] = Field(default_factory=list)
+    votes_moved: List[str] = Field(default_factory=list)
+    metadata_changed: List[str] = Field(default_factory=list)
+    removed: List[str] = Field(default_factory=list)
+    unchanged: List[str] = Field(default_factory=list)
+
+    @property
+    def changed_ids(self) -> List[str]:
+        """Proposal ids that need re-analysis, in first-seen order."""
+        return list(dict.fromkeys(self.new + self.status_changed + self.votes_moved + self.metadata_changed))
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.changed_ids or self.removed)
+
+
+class ProposalSync:
+    """Last-seen proposal state per DAO, used to compute sync deltas.
+
+    State is kept in memory and, when a ResponseStore is given, on disk so a
+    restart does not force every proposal back through analysis.
+    """
+
+    def __init__(self, store: Optional[ResponseStore] = None, vote_threshold: float = 0.05):
+        """Initialize the sync state.
+
+        Args:
+            store: Optional persistent tier for the per-DAO state
+            vote_threshold: Fraction of the vote total that must move to count as a change
+        """
+        self.store = store
+        self.vote_threshold = vote_threshold
+        self._states: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, dao_slug: str) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            state = self._states.get(dao_slug)
+        if state is None:
+            stored = self.store.get(f"sync:{dao_slug}") if self.store is not None else None
+            state = stored[0] if stored is not None else {}
+            with self._lock:
+                state = self._states.setdefault(dao_slug, state)
+        return state
+
+    def diff(self, dao_slug: str, proposals: List[Dict]) -> ProposalDelta:
+        """Compares freshly fetched proposals against the last committed state."""
+        previous = self._load(dao_slug)
+        delta = ProposalDelta()
+        seen = set()
+        for proposal in proposals:
+            proposal_id = str(proposal.get('id'))
+            seen.add(proposal_id)
+            old = previous.get(proposal_id)
+            new = proposal_state(proposal)
+            if old is None:
+                delta.new.append(proposal_id)
+                continue
+            changed = False
+            if old['status'] != new['status']:
+                delta.status_changed.append(proposal_id)
+                changed = True
+            if old['metadata_hash'] != new['metadata_hash']:
+                delta.metadata_changed.append(proposal_id)
+                changed = True
+            if vote_movement(old['votes'], new['votes']) >= self.vote_threshold:
+                delta.votes_moved.append(proposal_id)
+                changed = True
+            if not changed:
+                delta.unchanged.append(proposal_id)
+        delta.removed = [proposal_id for proposal_id in previous if proposal_id not in seen]
+        return delta
+
+    def commit(self, dao_slug: str, proposals: List[Dict], removed: Optional[List[str]] = None) -> None:
+        """Records proposals as seen; call once their updates have been built."""
+        state = dict(self._load(dao_slug))
+        for proposal in proposals:
+            state[str(proposal.get('id'))] = proposal_state(proposal)
+        for proposal_id in removed or []:
+            state.pop(proposal_id, None)
+        with self._lock:
+            self._states[dao_slug] = state
+        if self.store is not None:
+            self.store.put(f"sync:{dao_slug}", 'ProposalSyncState', state)
+
+    def reset(self, dao_slug: str) -> None:
+        """Forgets a DAO's state so its next sync treats every proposal as new."""
+        with self._lock:
+            self._states[dao_slug] = {}
+        if self.store is not None:
+            self.store.put(f"sync:{dao_slug}", 'ProposalSyncState', {})
+
+
+_default_sync: Optional[ProposalSync] = None
+_default_sync_lock = threading.Lock()
+
+
+def get_proposal_sync() -> ProposalSync:
+    """Returns the process-wide sync state, persisted if PROPOSAL_SYNC_PATH is set."""
+    global _default_sync
+    with _default_sync_lock:
+        if _default_sync is None:
+            path = os.getenv('PROPOSAL_SYNC_PATH')
+            _default_sync = ProposalSync(
+                store=ResponseStore(path) if path else None,
+                vote_threshold=float(os.getenv('PROPOSAL_SYNC_VOTE_THRESHOLD', '0.05'))
+            )
+        return _default_sync
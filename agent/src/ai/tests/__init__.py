@@ -0,0 +1 @@
+# agent/src/ai/tests/__init__.py
@@ -0,0 +1,210 @@
+# agent/src/ai/tests/test_chat_agent.py
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from langchain_core.messages import AIMessage, AIMessageChunk
+from .. import chatbot_agent
+from ..chatbot_agent import DAOAgent
+from ..conversations import ConversationStore
+from ..chat_cache import ChatResponseCache, get_chat_cache
+from ...tally.catalog import OrganizationCatalog
+
+NO_ACTION = "ACTION_REQUIRED: no\nACTION_TYPE: none\nDAO_SLUG: none\nPARAMETERS: none"
+
+
+class FakeChatLLM:
+    """Answers the action analysis prompt; only the async API is available."""
+
+    def __init__(self, analysis: str = NO_ACTION, amount: str = "100", delay: float = 0.05):
+        self.analysis = analysis
+        self.amount = amount
+        self.delay = delay
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        prompt = messages[0].content
+        if "running summary" in prompt:
+            return SimpleNamespace(content=f"summary of {prompt.count('User:')} user messages")
+        return SimpleNamespace(content=self.amount if "Extract the token amount" in prompt else self.analysis)
+
+
+class FakeExecutor:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.inputs = []
+
+    async def ainvoke(self, inputs, config=None):
+        self.inputs.append(inputs["messages"])
+        return {"messages": [AIMessage(content="".join(self.chunks))]}
+
+    async def astream(self, inputs, config=None, stream_mode=None):
+        yield AIMessageChunk(content="", tool_call_chunks=[]), {"langgraph_node": "agent"}
+        yield AIMessage(content="tool output"), {"langgraph_node": "tools"}
+        for chunk in self.chunks:
+            await asyncio.sleep(0)
+            yield AIMessageChunk(content=chunk), {"langgraph_node": "agent"}
+
+
+def make_chat_agent(llm, chunks=("Gloom ", "is a ", "gaming DAO."), conversations=None) -> DAOAgent:
+    """Builds a DAOAgent around fakes, skipping the CDP wallet setup in __init__."""
+    agent = DAOAgent.__new__(DAOAgent)
+    agent.llm = llm
+    agent.agent_executor = FakeExecutor(list(chunks))
+    agent.catalog = OrganizationCatalog()
+    agent._parser = None
+    agent.response_cache = ChatResponseCache()
+    agent.conversations = conversations or ConversationStore()
+    agent.DAO_INFO = {
+        "seamless-protocol": {"name": "Seamless Protocol", "symbol": "SEAM",
+                              "token_address": "0x1C7a460413dD4e964f96D8dFC56E7223cE88CD85", "description": "DeFi lending protocol on Base"},
+        "gloom": {"name": "Gloom", "symbol": "GLOOM",
+                  "token_address": "0xbb5D04c40Fa063FAF213c4E0B8086655164269Ef", "description": "Gaming platform"}
+    }
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_concurrent_chats_do_not_block_each_other():
+    agent = make_chat_agent(FakeChatLLM(delay=0.1))
+
+    start = asyncio.get_running_loop().time()
+    responses = await asyncio.gather(*(agent.chat("what is gloom?") for _ in range(5)))
+    elapsed = asyncio.get_running_loop().time() - start
+
+    assert all(response.message == "Gloom is a gaming DAO." for response in responses)
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_stream_forwards_only_model_tokens():
+    agent = make_chat_agent(FakeChatLLM(delay=0))
+
+    frames = [frame async for frame in agent.astream_chat("what is gloom?")]
+
+    assert [frame["data"] for frame in frames if frame["type"] == "token"] == ["Gloom ", "is a ", "gaming DAO."]
+    assert frames[-1] == {"type": "done", "data": {"message": "Gloom is a gaming DAO."}}
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_prepared_action():
+    analysis = "ACTION_REQUIRED: yes\nACTION_TYPE: delegate\nDAO_SLUG: gloom\nPARAMETERS: amount=100"
+    agent = make_chat_agent(FakeChatLLM(analysis=analysis, delay=0))
+
+    frames = [frame async for frame in agent.astream_chat("delegate 100 gloom")]
+
+    assert [frame["type"] for frame in frames] == ["token", "action", "done"]
+    assert frames[1]["data"]["token_address"] == "0xbb5D04c40Fa063FAF213c4E0B8086655164269Ef"
+    assert frames[1]["data"]["amount"] == "100"
+
+
+@pytest.mark.asyncio
+async def test_history_is_kept_per_address():
+    agent = make_chat_agent(FakeChatLLM(delay=0))
+
+    await agent.chat("what is gloom?", address="0xAAA")
+    await agent.chat("and its token?", address="0xaaa")
+    await agent.chat("hello", address="0xBBB")
+
+    second, third = agent.agent_executor.inputs[1], agent.agent_executor.inputs[2]
+    assert [m.content for m in second] == ["what is gloom?", "Gloom is a gaming DAO.", "and its token?"]
+    assert [m.content for m in third] == ["hello"]
+
+
+@pytest.mark.asyncio
+async def test_long_conversations_are_summarized():
+    conversations = ConversationStore(max_messages=4, keep_recent=2)
+    agent = make_chat_agent(FakeChatLLM(delay=0), conversations=conversations)
+
+    for i in range(5):
+        await agent.chat(f"question {i}", address="0xAAA")
+        # Compaction runs in the background; let it finish before the next turn
+        await asyncio.gather(*chatbot_agent._background_tasks)
+
+    thread = conversations.get("0xAAA")
+    # Every turn past the cap folds all but the last turn into the summary
+    assert len(thread.messages) <= 4
+    assert thread.summary.startswith("summary of")
+    prompt = agent.agent_executor.inputs[-1]
+    assert prompt[0].content.startswith("Summary of the earlier conversation")
+    assert len(prompt) <= 6
+    assert conversations.stats()["summaries"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_common_actions_need_no_model_call():
+    llm = FakeChatLLM(delay=0)
+    agent = make_chat_agent(llm)
+
+    delegate = await agent.chat("delegate 1,000 SEAM to 0x746bb7beFD31D9052BB8EbA7D5dD74C9aCf54C6d")
+    vote = await agent.chat("vote for proposal 123 in gloom")
+
+    assert llm.calls == 0
+    assert delegate.action.dao_slug == "seamless-protocol"
+    assert delegate.action.amount == "1000"
+    assert delegate.action.delegate_to == "0x746bb7beFD31D9052BB8EbA7D5dD74C9aCf54C6d"
+    assert (vote.action.dao_slug, vote.action.proposal_id, vote.action.vote) == ("gloom", "123", "for")
+
+
+@pytest.mark.asyncio
+async def test_ambiguous_requests_fall_back_to_the_model():
+    analysis = "Sure, here it is:\nACTION_REQUIRED: yes\nACTION_TYPE: delegate\nDAO_SLUG: gloom\nPARAMETERS: amount: 5"
+    llm = FakeChatLLM(analysis=analysis, amount="5", delay=0)
+    agent = make_chat_agent(llm)
+
+    response = await agent.chat("please delegate some of my tokens to the gaming dao")
+
+    assert llm.calls == 2
+    assert response.action.dao_slug == "gloom" and response.action.amount == "5"
+
+
+@pytest.mark.asyncio
+async def test_informational_answers_are_cached_until_the_dao_changes():
+    agent = make_chat_agent(FakeChatLLM(delay=0))
+
+    await agent.chat("What is Gloom?", address="0xAAA")
+    cached = await agent.chat("what's gloom", address="0xBBB")
+    assert cached.message == "Gloom is a gaming DAO."
+    assert len(agent.agent_executor.inputs) == 1
+
+    agent.DAO_INFO["gloom"]["description"] = "Gaming platform on Base"
+    await agent.chat("what is gloom?", address="0xBBB")
+    assert len(agent.agent_executor.inputs) == 2
+
+    stats = agent.response_cache.stats()
+    assert stats["hits"] == 1 and stats["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_replies_shaped_by_history_are_not_shared():
+    agent = make_chat_agent(FakeChatLLM(delay=0))
+
+    await agent.chat("hello", address="0xAAA")
+    await agent.chat("what is gloom?", address="0xAAA")
+    await agent.chat("what is gloom?", address="0xBBB")
+
+    # The first answer saw 0xAAA's earlier turn, so 0xBBB gets a fresh one
+    assert len(agent.agent_executor.inputs) == 3
+    assert agent.response_cache.stats()["hits"] == 0
+
+
+def test_agents_use_separate_cache_namespaces():
+    assert get_chat_cache("dao_agent") is get_chat_cache("dao_agent")
+    assert get_chat_cache("dao_agent") is not get_chat_cache("governance_chatbot")
+
+
+@pytest.mark.asyncio
+async def test_compaction_does_not_delay_the_reply():
+    conversations = ConversationStore(max_messages=2, keep_recent=2)
+    agent = make_chat_agent(FakeChatLLM(delay=0.2), conversations=conversations)
+    await agent.chat("question 0", address="0xAAA")
+
+    start = asyncio.get_running_loop().time()
+    await agent.chat("question 1", address="0xAAA")
+    assert asyncio.get_running_loop().time() - start < 0.15
+    assert chatbot_agent._background_tasks
+
+    await asyncio.gather(*chatbot_agent._background_tasks)
+    assert conversations.stats()["summaries"] == 1
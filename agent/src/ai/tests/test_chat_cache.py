@@ -0,0 +1,33 @@
+# agent/src/ai/tests/test_chat_cache.py
+
+from ..chat_cache import ChatResponseCache, is_cacheable, normalize_query
+
+
+def test_rephrasings_share_a_key():
+    assert normalize_query("What is Seamless Protocol?") == normalize_query("what's  seamless protocol")
+
+
+def test_personal_and_action_queries_are_not_cached():
+    assert is_cacheable("tell me about gloom")
+    assert not is_cacheable("how many tokens do I hold?")
+    assert not is_cacheable("delegate 100 SEAM")
+    assert not is_cacheable("what about its treasury?")
+
+
+def test_near_duplicates_hit_but_different_numbers_do_not():
+    cache = ChatResponseCache()
+    cache.put("summary of gloom proposals", "answer", {"gloom": "v1"})
+    cache.put("status of proposal 12", "twelve", {})
+
+    assert cache.get("summary of gloom proposal", {"gloom": "v1"}) == "answer"
+    assert cache.get("status of proposal 13", {}) is None
+    assert cache.stats()["near_hits"] == 1
+
+
+def test_changed_dao_data_invalidates():
+    cache = ChatResponseCache()
+    cache.put("dao gloom", "answer", {"gloom": "v1"})
+
+    assert cache.get("dao gloom", {"gloom": "v2"}) is None
+    assert cache.get("dao gloom", {"gloom": "v1"}) is None
+    assert cache.stats()["invalidations"] == 1
@@ -0,0 +1,52 @@
+# agent/src/ai/tests/test_conversations.py
+
+import asyncio
+import time
+import pytest
+from ..conversations import ConversationStore
+
+
+def test_least_recently_used_thread_is_evicted():
+    store = ConversationStore(max_threads=2)
+    store.record("0xA", "hi", "hello")
+    store.record("0xB", "hi", "hello")
+    store.get("0xa")
+    store.get("0xC")
+
+    assert store.get("0xA").messages
+    assert not store.get("0xB").messages
+    assert store.stats()["evictions"] >= 1
+
+
+def test_idle_threads_expire():
+    store = ConversationStore(ttl=0.01)
+    store.record("0xA", "hi", "hello")
+    time.sleep(0.02)
+
+    assert not store.get("0xA").messages
+    assert store.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_overlapping_compactions_keep_unsummarized_messages():
+    store = ConversationStore(max_messages=4, keep_recent=2)
+    for turn in range(3):
+        store.record("0xA", f"q{turn}", f"a{turn}")
+    release = asyncio.Event()
+    prompts = []
+
+    async def summarize(prompt):
+        prompts.append(prompt)
+        await release.wait()
+        return "summary"
+
+    first = asyncio.ensure_future(store.compact("0xA", summarize))
+    await asyncio.sleep(0)
+    store.record("0xA", "q3", "a3")
+    assert await store.compact("0xA", summarize) is False
+    release.set()
+    assert await first is True
+
+    assert len(prompts) == 1
+    assert [message.content for message in store.get("0xA").messages] == ["q2", "a2", "q3", "a3"]
+    assert store.get("0xA").summary == "summary"
@@ -0,0 +1,143 @@
+# agent/src/ai/tests/test_deadlines.py
+
+import asyncio
+import time
+import pytest
+from ..deadlines import DeadlineScheduler, parse_timestamp
+from ..notifications import deadline_update
+from ...tally.store import ResponseStore
+
+HOUR = 3600.0
+NOW = 1_700_000_000.0
+
+
+def proposal(proposal_id, end_in=None, start_in=None, status="active"):
+    node = {"id": proposal_id, "status": status, "metadata": {"title": f"Proposal {proposal_id}"}}
+    if end_in is not None:
+        node["end"] = {"timestamp": NOW + end_in}
+    if start_in is not None:
+        node["start"] = {"timestamp": NOW + start_in}
+    return node
+
+
+def fired(scheduler, at):
+    return [(event.proposal_id, event.kind, int(event.lead / HOUR)) for event in scheduler.pop_due(NOW + at)]
+
+
+def test_parse_timestamp():
+    assert parse_timestamp({"timestamp": "2023-11-14T22:13:20Z"}) == NOW
+    assert parse_timestamp("2023-11-14T22:13:20") == NOW
+    assert parse_timestamp({"timestamp": None}) is None
+    assert parse_timestamp("not a date") is None
+
+
+def test_events_fire_in_deadline_order():
+    scheduler = DeadlineScheduler(end_leads=[24 * HOUR, HOUR])
+    scheduler.sync("gloom", [proposal("1", end_in=48 * HOUR), proposal("2", end_in=30 * HOUR),
+                             proposal("3", start_in=2 * HOUR, end_in=100 * HOUR, status="pending")], now=NOW)
+
+    assert fired(scheduler, 1 * HOUR) == []
+    assert fired(scheduler, 2 * HOUR) == [("3", "voting_starts", 0)]
+    assert fired(scheduler, 6 * HOUR) == [("2", "voting_ends", 24)]
+    assert fired(scheduler, 25 * HOUR) == [("1", "voting_ends", 24)]
+    assert fired(scheduler, 29.5 * HOUR) == [("2", "voting_ends", 1)]
+    assert fired(scheduler, 47.5 * HOUR) == [("1", "voting_ends", 1)]
+    assert fired(scheduler, 99.5 * HOUR) == [("3", "voting_ends", 24), ("3", "voting_ends", 1)]
+    assert scheduler.next_fire_at() is None
+
+
+def test_only_the_tightest_crossed_threshold_fires_for_new_proposals():
+    scheduler = DeadlineScheduler(end_leads=[24 * HOUR, HOUR])
+    scheduler.sync("gloom", [proposal("1", end_in=0.5 * HOUR), proposal("2", end_in=-1 * HOUR)], now=NOW)
+
+    assert fired(scheduler, 0) == [("1", "voting_ends", 1)]
+    assert scheduler.stats()["pending"] == 0
+
+
+def test_resync_does_not_refire_or_duplicate():
+    scheduler = DeadlineScheduler(end_leads=[24 * HOUR])
+    scheduler.sync("gloom", [proposal("1", end_in=10 * HOUR)], now=NOW)
+    assert fired(scheduler, 0) == [("1", "voting_ends", 24)]
+
+    # Block time estimates drift a little between fetches
+    drifted = proposal("1", end_in=10 * HOUR + 60)
+    scheduler.sync("gloom", [drifted], now=NOW + 60)
+    scheduler.sync("gloom", [drifted], now=NOW + 120)
+    assert fired(scheduler, 2 * HOUR) == []
+
+
+def test_extension_reschedules_and_closing_cancels():
+    scheduler = DeadlineScheduler(end_leads=[24 * HOUR])
+    scheduler.sync("gloom", [proposal("1", end_in=30 * HOUR), proposal("2", end_in=30 * HOUR)], now=NOW)
+
+    scheduler.sync("gloom", [proposal("1", end_in=60 * HOUR, status="extended"),
+                             proposal("2", end_in=30 * HOUR, status="canceled")], now=NOW)
+    assert fired(scheduler, 10 * HOUR) == []
+    assert fired(scheduler, 36 * HOUR) == [("1", "voting_ends", 24)]
+
+    scheduler.sync("gloom", [proposal("3", end_in=30 * HOUR)], now=NOW)
+    assert scheduler.stats()["tracked_proposals"] == 1
+    assert scheduler.cancel("3") == 1
+    assert scheduler.next_fire_at() is None
+
+
+def test_cancelled_entries_do_not_accumulate():
+    scheduler = DeadlineScheduler(end_leads=[HOUR])
+    for round_ in range(50):
+        scheduler.sync("gloom", [proposal(str(i), end_in=(10 + round_) * HOUR) for i in range(20)], now=NOW)
+
+    assert scheduler.stats()["pending"] == 20
+    assert len(scheduler._heap) <= 2 * 20 + 64
+
+
+def test_pending_and_fired_events_survive_restart(tmp_path):
+    path = str(tmp_path / "deadlines.db")
+    first = DeadlineScheduler(store=ResponseStore(path), end_leads=[24 * HOUR, HOUR])
+    first.sync("gloom", [proposal("1", end_in=10 * HOUR)], now=NOW)
+    assert fired(first, 0) == [("1", "voting_ends", 24)]
+
+    second = DeadlineScheduler(store=ResponseStore(path), end_leads=[24 * HOUR, HOUR])
+    second.sync("gloom", [proposal("1", end_in=10 * HOUR)], now=NOW + 60)
+    assert fired(second, 1 * HOUR) == []
+    assert fired(second, 9 * HOUR) == [("1", "voting_ends", 1)]
+
+
+def test_restored_events_past_their_deadline_do_not_fire(tmp_path):
+    path = str(tmp_path / "deadlines.db")
+    first = DeadlineScheduler(store=ResponseStore(path), end_leads=[24 * HOUR, HOUR])
+    first.sync("gloom", [proposal("1", end_in=30 * HOUR), proposal("2", end_in=50 * HOUR)], now=NOW)
+
+    # Down from before the first alert until after proposal 1 closed
+    second = DeadlineScheduler(store=ResponseStore(path), end_leads=[24 * HOUR, HOUR])
+    assert fired(second, 31 * HOUR) == [("2", "voting_ends", 24)]
+    assert second.stats()["expired"] == 2
+    assert second.stats()["tracked_proposals"] == 1
+    assert ResponseStore(path).scan("deadline:1:") == []
+
+
+@pytest.mark.asyncio
+async def test_background_loop_wakes_for_new_deadlines():
+    scheduler = DeadlineScheduler(end_leads=[0], max_sleep=30)
+    received = []
+    scheduler.start(on_fire=received.extend)
+    await asyncio.sleep(0.01)
+
+    scheduler.sync("gloom", [{"id": "1", "status": "active", "end": {"timestamp": time.time() + 0.1}}])
+    for _ in range(50):
+        if received:
+            break
+        await asyncio.sleep(0.02)
+    await scheduler.stop()
+
+    assert [event.proposal_id for event in received] == ["1"]
+
+
+def test_deadline_update_is_urgent():
+    scheduler = DeadlineScheduler(end_leads=[24 * HOUR])
+    scheduler.sync("gloom", [proposal("7", end_in=5 * HOUR)], dao_name="Gloom", now=NOW)
+    update = deadline_update(scheduler.pop_due(NOW)[0])
+
+    assert update.priority == "urgent"
+    assert update.title == "Voting closes within 24h: Proposal 7"
+    assert update.dao_name == "Gloom"
+    assert update.actions[0].url.endswith("/gov/gloom/proposal/7")
@@ -0,0 +1,170 @@
+# agent/src/ai/tests/test_governance_chatbot.py
+
+import asyncio
+from types import SimpleNamespace
+import pytest
+from langchain_core.messages import AIMessage, ToolMessage
+from ..governance_chatbot import GovernanceChatbot
+from ..chat_cache import ChatResponseCache
+from ...tally.catalog import OrganizationCatalog
+
+GLOOM = {"id": "1", "slug": "gloom", "name": "Gloom", "chainIds": ["eip155:8453"],
+         "metadata": {"description": "Gaming platform"}}
+
+
+class FakeClient:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = 0
+
+    async def iter_organizations(self, chain_id):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("Tally unavailable")
+        yield GLOOM
+
+
+class FakeTally:
+    """Stands in for the cached TallyClient's organization lookup."""
+
+    def __init__(self, organizations=(), fail=False):
+        self.organizations = {org["slug"]: org for org in organizations}
+        self.fail = fail
+        self.calls = 0
+
+    async def get_organization(self, slug):
+        self.calls += 1
+        if self.fail or slug not in self.organizations:
+            return None
+        return {"data": {"organization": self.organizations[slug]}}
+
+
+class FakeExecutor:
+    """Yields one update per ReAct step; fails the first `failures` runs before any output."""
+
+    def __init__(self, steps, failures=0, fail_after=None):
+        self.steps = steps
+        self.failures = failures
+        self.fail_after = fail_after
+        self.runs = 0
+        self.sent = []
+
+    async def astream(self, inputs, stream_mode=None):
+        assert stream_mode == "updates"
+        self.runs += 1
+        if self.runs <= self.failures:
+            raise RuntimeError("rate limited")
+        for i, step in enumerate(self.steps):
+            if i == self.fail_after:
+                raise RuntimeError("connection reset")
+            await asyncio.sleep(0)
+            self.sent.append(step)
+            yield step
+
+
+STEPS = [
+    {"agent": {"messages": [AIMessage(content="")]}},
+    {"tools": {"messages": [ToolMessage(content="balance: 10 GLOOM", tool_call_id="1")]}},
+    {"agent": {"messages": [AIMessage(content="Gloom is a gaming DAO.")]}},
+]
+
+
+def make_chatbot(executor, client=None, tally=None, backoff=0.01) -> GovernanceChatbot:
+    """Builds a GovernanceChatbot around fakes, skipping the CDP wallet setup in __init__."""
+    bot = GovernanceChatbot.__new__(GovernanceChatbot)
+    bot.agent_executor = executor
+    bot.catalog = OrganizationCatalog(client_factory=lambda: client or FakeClient())
+    bot.tally_client = SimpleNamespace(aio=tally or FakeTally())
+    bot.response_cache = ChatResponseCache()
+    bot._parser = None
+    bot._parser_generation = None
+    bot.max_retries = 3
+    bot.backoff = backoff
+    return bot
+
+
+@pytest.mark.asyncio
+async def test_streams_each_message_as_it_arrives():
+    executor = FakeExecutor(STEPS)
+    bot = make_chatbot(executor)
+
+    seen = []
+    async for part in bot.astream("what is gloom?"):
+        seen.append((part, len(executor.sent)))
+
+    assert seen == [("balance: 10 GLOOM", 2), ("Gloom is a gaming DAO.", 3)]
+    assert await bot.achat("what is gloom?") == "balance: 10 GLOOM\nGloom is a gaming DAO."
+    assert executor.runs == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_with_backoff_without_blocking_the_loop():
+    executor = FakeExecutor(STEPS, failures=2)
+    bot = make_chatbot(executor, backoff=0.05)
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    reply = await bot.achat("explain quorum")
+    task.cancel()
+
+    assert reply.endswith("Gloom is a gaming DAO.")
+    assert executor.runs == 3
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_partial_reply_is_not_retried():
+    executor = FakeExecutor(STEPS, fail_after=2)
+    bot = make_chatbot(executor)
+
+    parts = [part async for part in bot.astream("explain quorum")]
+
+    assert parts[0] == "balance: 10 GLOOM"
+    assert "issue processing your request" in parts[-1]
+    assert executor.runs == 1
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries():
+    bot = make_chatbot(FakeExecutor(STEPS, failures=5))
+
+    assert "issue processing your request" in await bot.achat("explain quorum")
+    assert bot.agent_executor.runs == 3
+
+
+@pytest.mark.asyncio
+async def test_dao_shortcut_reads_the_catalog():
+    client = FakeClient()
+    bot = make_chatbot(FakeExecutor(STEPS), client=client)
+
+    assert await bot.achat("dao gloom") == "\nDAO Name: Gloom\nDescription: Gaming platform"
+    assert "not found" in await bot.achat("dao unknown")
+    assert client.calls == 1
+    assert bot.agent_executor.runs == 0
+
+
+@pytest.mark.asyncio
+async def test_dao_shortcut_fails_fast_when_tally_is_down():
+    bot = make_chatbot(FakeExecutor(STEPS), client=FakeClient(fail=True))
+
+    assert "Error fetching DAO data" in await bot.achat("dao gloom")
+
+
+@pytest.mark.asyncio
+async def test_dao_shortcut_falls_back_to_tally_on_catalog_miss():
+    optimism = {"id": "2", "slug": "optimism", "name": "Optimism", "chainIds": ["eip155:10"], "metadata": None}
+    tally = FakeTally([optimism])
+    bot = make_chatbot(FakeExecutor(STEPS), tally=tally)
+
+    assert await bot.achat("dao gloom") == "\nDAO Name: Gloom\nDescription: Gaming platform"
+    assert tally.calls == 0
+    assert await bot.achat("dao optimism") == "\nDAO Name: Optimism\nDescription: "
+    assert "not found" in await bot.achat("dao unknown")
+    assert tally.calls == 2
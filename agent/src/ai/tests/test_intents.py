@@ -0,0 +1,63 @@
+# agent/src/ai/tests/test_intents.py
+
+import pytest
+from ..intents import IntentParser
+
+DAOS = {
+    "seamless-protocol": {"name": "Seamless Protocol", "symbol": "SEAM"},
+    "internet-token-dao": {"name": "Internet Token DAO"},
+    "gloom": {"name": "Gloom", "symbol": "GLOOM"},
+}
+ADDRESS = "0x746bb7beFD31D9052BB8EbA7D5dD74C9aCf54C6d"
+
+parser = IntentParser(DAOS)
+
+
+@pytest.mark.parametrize("message, expected", [
+    (f"delegate 100 SEAM to {ADDRESS}", ("seamless-protocol", "100", ADDRESS)),
+    ("Delegate all my Gloom tokens", ("gloom", "all", None)),
+    ("delegate 2,500.5 tokens in internet token dao", ("internet-token-dao", "2500.5", None)),
+])
+def test_delegate_phrasings(message, expected):
+    intent = parser.parse(message)
+    assert intent.kind == "delegate" and not intent.ambiguous
+    assert (intent.dao_slug, intent.amount, intent.delegate_to) == expected
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("vote for proposal 123 in gloom", ("gloom", "123", "for")),
+    ("Vote against proposal #42 on Seamless", ("seamless-protocol", "42", "against")),
+    ("I want to abstain on gloom proposal 7 — vote abstain", ("gloom", "7", "abstain")),
+])
+def test_vote_phrasings(message, expected):
+    intent = parser.parse(message)
+    assert intent.kind == "vote" and not intent.ambiguous
+    assert (intent.dao_slug, intent.proposal_id, intent.vote) == expected
+
+
+@pytest.mark.parametrize("message", [
+    "delegate 100 tokens",               # no DAO
+    "delegate SEAM and GLOOM",           # two DAOs, no amount
+    "vote on proposal 5 in gloom",       # no choice
+    "vote for gloom",                    # no proposal
+    "delegate 100 SEAM to vitalik.eth",  # target is not an address
+])
+def test_incomplete_requests_are_ambiguous(message):
+    assert parser.parse(message).ambiguous
+
+
+def test_informational_messages_are_not_actions():
+    intent = parser.parse("what is Seamless Protocol?")
+    assert intent.kind is None and not intent.ambiguous
+
+
+
+@pytest.mark.parametrize("message", [
+    "how did people vote for proposal 12 in gloom?",
+    "who should I vote for on proposal 12 in gloom?",
+    "what happens if I vote against proposal 7 in seamless?",
+    "should I delegate 100 SEAM or keep them?",
+    "how many delegates does seamless have? I want to delegate 50",
+])
+def test_questions_never_become_actions(message):
+    assert parser.parse(message).ambiguous
@@ -0,0 +1,57 @@
+# agent/src/ai/tests/test_lazy_agent.py
+
+import asyncio
+import time
+import pytest
+from ..lazy_agent import LazyAgent
+
+
+def slow_factory(delay: float = 0.1):
+    calls = []
+
+    def build():
+        calls.append(1)
+        time.sleep(delay)
+        return object()
+    return build, calls
+
+
+@pytest.mark.asyncio
+async def test_build_runs_once_off_the_event_loop():
+    factory, calls = slow_factory()
+    agent = LazyAgent(factory)
+
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while not agent.ready:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    first, second, _ = await asyncio.gather(agent.aget(), agent.aget(), heartbeat())
+
+    assert first is second
+    assert len(calls) == 1
+    # The loop kept running while the factory slept
+    assert ticks >= 5
+    assert agent.status()["status"] == "ready"
+
+
+@pytest.mark.asyncio
+async def test_failed_build_is_reported_and_retried():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ValueError("OPENAI_API_KEY environment variable is required")
+        return "agent"
+
+    agent = LazyAgent(flaky)
+    agent.warmup()
+    await asyncio.sleep(0.05)
+    assert agent.status()["status"] == "error"
+
+    assert await agent.aget() == "agent"
+    assert agent.status()["error"] is None
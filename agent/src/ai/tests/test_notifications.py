@@ -0,0 +1,201 @@
+# agent/src/ai/tests/test_notifications.py
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from ..dao_updates import DaoUpdate
+from ..notifications import (
+    NotificationPreferences, NotificationService, NotifyOn, Subscription, SubscriptionIndex, WebhookDispatcher,
+    embed_size, format_embed
+)
+from ...tally.store import ResponseStore
+
+
+class Sink:
+    """Local HTTP server standing in for Discord webhooks."""
+
+    def __init__(self):
+        self.requests = []
+        self.responses = []  # status codes to answer with before falling back to 204
+        self.delay = 0.0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with sink._lock:
+                    sink.active += 1
+                    sink.max_active = max(sink.max_active, sink.active)
+                    status = sink.responses.pop(0) if sink.responses else 204
+                time.sleep(sink.delay)
+                with sink._lock:
+                    sink.active -= 1
+                    if status < 300:
+                        sink.requests.append((self.path, body))
+                self.send_response(status)
+                if status == 429:
+                    self.send_header('Retry-After', '0')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def sink():
+    sink = Sink()
+    yield sink
+    sink.server.shutdown()
+
+
+def make_update(update_id, dao_slug="gloom", priority="urgent", category="proposal") -> DaoUpdate:
+    return DaoUpdate(id=update_id, dao_slug=dao_slug, dao_name=dao_slug.title(), title=f"Update {update_id}",
+                     description="Summary", priority=priority, category=category,
+                     timestamp="2025-01-01T00:00:00+00:00")
+
+
+def subscription(address, url, daos=None, categories=None, **notify_on) -> Subscription:
+    return Subscription(address=address, preferences=NotificationPreferences(
+        discordWebhookUrl=url, daos=daos, categories=categories, notifyOn=NotifyOn(**notify_on)))
+
+
+def test_index_matches_filters_and_wildcards():
+    index = SubscriptionIndex()
+    everything = NotificationPreferences(notifyOn=NotifyOn(fyi=True))
+    gloom_urgent = NotificationPreferences(daos=["gloom"], notifyOn=NotifyOn(important=False))
+    treasury = NotificationPreferences(categories=["treasury"])
+    index.add("a", everything)
+    index.add("b", gloom_urgent)
+    index.add("c", treasury)
+
+    assert index.match("gloom", "proposal", "urgent") == {"a", "b"}
+    assert index.match("gloom", "proposal", "important") == {"a"}
+    assert index.match("aave", "treasury", "important") == {"a", "c"}
+    assert index.match("aave", "treasury", "fyi") == {"a"}
+
+    index.remove("a", everything)
+    assert index.match("aave", "treasury", "fyi") == set()
+
+
+def test_publish_sends_only_new_updates(sink):
+    dispatcher = WebhookDispatcher()
+    service = NotificationService(dispatcher=dispatcher)
+    service.subscribe(subscription("0xAbC", f"{sink.url}/a", daos=["gloom"]))
+
+    assert service.publish("gloom", [make_update("1")]) == 0  # baseline
+    assert service.publish("gloom", [make_update("1"), make_update("2"), make_update("3", priority="fyi")]) == 1
+    assert service.publish("aave", [make_update("9", dao_slug="aave")]) == 0
+    assert dispatcher.stats()["items_pending"] == 1
+    assert service.get("0xabc") is not None
+
+
+def test_empty_feed_does_not_reset_the_baseline(sink):
+    dispatcher = WebhookDispatcher()
+    service = NotificationService(dispatcher=dispatcher)
+    service.subscribe(subscription("0xa", f"{sink.url}/a"))
+    updates = [make_update(str(i)) for i in range(3)]
+
+    assert service.publish("gloom", []) == 0
+    assert service.publish("gloom", updates) == 0  # baseline
+    assert service.publish("gloom", []) == 0
+    assert service.publish("gloom", updates[:1]) == 0
+    assert service.publish("gloom", updates) == 0
+    assert dispatcher.stats()["queued"] == 0
+
+
+def test_subscriptions_and_baseline_survive_restart(tmp_path):
+    path = str(tmp_path / "notify.db")
+    first = NotificationService(store=ResponseStore(path))
+    first.subscribe(subscription("0xa", "https://example.com/a"))
+    first.subscribe(subscription("0xb", "https://example.com/b"))
+    first.unsubscribe("0xb")
+    first.publish("gloom", [make_update("1")])
+
+    second = NotificationService(store=ResponseStore(path))
+    assert [sub.address for sub in second.match(make_update("2"))] == ["0xa"]
+    assert second.publish("gloom", [make_update("1"), make_update("2")]) == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_batches_per_endpoint(sink):
+    dispatcher = WebhookDispatcher(batch_size=10)
+    for i in range(25):
+        dispatcher.enqueue(f"{sink.url}/a", {"title": str(i)})
+    dispatcher.enqueue(f"{sink.url}/b", {"title": "b"})
+    dispatcher.start()
+    await dispatcher.drain()
+    await dispatcher.stop()
+
+    sizes = sorted(len(body["embeds"]) for path, body in sink.requests if path == "/a")
+    assert sizes == [5, 10, 10]
+    assert [body["embeds"] for path, body in sink.requests if path == "/b"] == [[{"title": "b"}]]
+    assert [e["title"] for path, body in sink.requests if path == "/a" for e in body["embeds"]] == [str(i) for i in range(25)]
+    assert dispatcher.stats()["delivered"] == 26
+
+
+@pytest.mark.asyncio
+async def test_batches_stay_under_discords_character_limit(sink):
+    dispatcher = WebhookDispatcher()
+    for i in range(10):
+        update = make_update(str(i))
+        update.description = "x" * 5000
+        dispatcher.enqueue(f"{sink.url}/a", format_embed(update))
+    dispatcher.start()
+    await dispatcher.drain()
+    await dispatcher.stop()
+
+    assert len(sink.requests) == 10
+    assert all(sum(embed_size(embed) for embed in body["embeds"]) <= 6000 for _, body in sink.requests)
+    assert dispatcher.stats()["delivered"] == 10
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_pool_is_bounded(sink):
+    sink.delay = 0.05
+    dispatcher = WebhookDispatcher(max_workers=2)
+    for i in range(6):
+        dispatcher.enqueue(f"{sink.url}/{i}", {"title": str(i)})
+    dispatcher.start()
+    await dispatcher.drain()
+    await dispatcher.stop()
+
+    assert len(sink.requests) == 6
+    assert sink.max_active == 2
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_retries_transient_failures(sink):
+    sink.responses = [500, 429]
+    dispatcher = WebhookDispatcher(retries=3, backoff=0.01)
+    dispatcher.enqueue(f"{sink.url}/a", {"title": "x"})
+    dispatcher.start()
+    await dispatcher.drain()
+    await dispatcher.stop()
+
+    assert len(sink.requests) == 1
+    assert dispatcher.stats()["retries"] == 2
+    assert dispatcher.stats()["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_gives_up_on_rejection(sink):
+    sink.responses = [404]
+    dispatcher = WebhookDispatcher(retries=3, backoff=0.01)
+    dispatcher.enqueue(f"{sink.url}/a", {"title": "x"})
+    dispatcher.start()
+    await dispatcher.drain()
+    await dispatcher.stop()
+
+    assert sink.requests == []
+    assert dispatcher.stats()["retries"] == 0
+    assert dispatcher.stats()["failed"] == 1
@@ -0,0 +1,101 @@
+# agent/src/ai/tests/test_proposal_sync.py
+
+import pytest
+from ..proposal_sync import ProposalSync
+from ..update_feed import UpdateFeedStore, UpdateFeedWorker
+from ...tally.store import ResponseStore
+from .test_updates_agent import FakeLLM, make_agent
+
+
+def votes(for_votes: int, against: int = 0):
+    return [{"type": "for", "votesCount": str(for_votes)}, {"type": "against", "votesCount": str(against)}]
+
+
+def proposal(proposal_id: str, status: str = "active", for_votes: int = 100, title: str = None):
+    return {
+        "id": proposal_id,
+        "status": status,
+        "metadata": {"title": title or f"P{proposal_id}", "description": "Change things"},
+        "voteStats": votes(for_votes)
+    }
+
+
+def test_delta_detects_new_status_vote_and_metadata_changes():
+    sync = ProposalSync(vote_threshold=0.1)
+    sync.commit("gloom", [proposal("1"), proposal("2"), proposal("3"), proposal("4"), proposal("5")])
+
+    delta = sync.diff("gloom", [
+        proposal("1"),
+        proposal("2", status="executed"),
+        proposal("3", for_votes=105),  # below the threshold
+        proposal("4", for_votes=150),
+        proposal("5", title="Edited"),
+        proposal("6"),
+    ])
+
+    assert delta.new == ["6"]
+    assert delta.status_changed == ["2"]
+    assert delta.votes_moved == ["4"]
+    assert delta.metadata_changed == ["5"]
+    assert delta.unchanged == ["1", "3"]
+    assert delta.changed_ids == ["6", "2", "4", "5"]
+
+
+def test_state_survives_restart(tmp_path):
+    path = str(tmp_path / "sync.db")
+    ProposalSync(store=ResponseStore(path)).commit("gloom", [proposal("1")])
+
+    delta = ProposalSync(store=ResponseStore(path)).diff("gloom", [])
+
+    assert delta.removed == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_sync_only_analyzes_changed_proposals():
+    llm = FakeLLM(delay=0)
+    agent = make_agent(llm, proposal_count=0)
+    agent.tally_client.aio.proposals = [proposal(str(i)) for i in range(5)]
+
+    updates, delta = await agent.sync_dao_updates("gloom", [])
+    assert len(updates) == 5 and len(delta.new) == 5
+    assert llm.calls == 5
+
+    agent.tally_client.aio.proposals[1] = proposal("1", title="Edited")
+    agent.tally_client.aio.proposals[2] = proposal("2", status="executed")
+    agent.tally_client.aio.proposals.append(proposal("5"))
+    updates, delta = await agent.sync_dao_updates("gloom", updates)
+
+    assert delta.changed_ids == ["5", "2", "1"]
+    # Edited and new proposals need the LLM; the status change reuses the cached analysis
+    assert llm.calls == 7
+    assert len(updates) == 6
+    assert next(u for u in updates if u.id == "prop_1").description == "impact of Edited"
+
+
+@pytest.mark.asyncio
+async def test_failed_proposals_fetch_keeps_sync_state():
+    llm = FakeLLM(delay=0)
+    agent = make_agent(llm, proposal_count=3)
+    updates, _ = await agent.sync_dao_updates("gloom", [])
+
+    agent.tally_client.aio.proposals_down = True
+    assert await agent.sync_dao_updates("gloom", updates) is None
+
+    agent.tally_client.aio.proposals_down = False
+    _, delta = await agent.sync_dao_updates("gloom", updates)
+    assert not delta.has_changes
+    assert llm.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_worker_skips_unchanged_daos():
+    llm = FakeLLM(delay=0)
+    agent = make_agent(llm, proposal_count=3)
+    feed_store = UpdateFeedStore()
+    feed_store.track(["gloom"])
+    worker = UpdateFeedWorker(lambda: agent, feed_store, incremental=True)
+
+    assert await worker.refresh_once() == {"gloom": "ok"}
+    assert await worker.refresh_once() == {"gloom": "unchanged"}
+    assert llm.calls == 3
+    assert len(feed_store.get("gloom", max_age=60)[0]) == 3
@@ -0,0 +1,196 @@
+# agent/src/ai/tests/test_updates_agent.py
+
+import asyncio
+import json
+import time
+import pytest
+from types import SimpleNamespace
+from ..analysis_cache import AnalysisCache
+from ..dao_updates import DaoUpdatesAgent
+from ..proposal_sync import ProposalSync
+from ..deadlines import DeadlineScheduler
+from ...tally.catalog import OrganizationCatalog
+from ...tally.store import ResponseStore
+
+
+class FakeLLM:
+    """Chat model stub answering in the Summary/Areas/Risk format after a delay."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        title = messages[0].content.split("Proposal Title: ")[1].split("\n")[0]
+        return SimpleNamespace(content=f"Summary: impact of {title}\nAreas: treasury\nRisk: low")
+
+
+class FakeTally:
+    def __init__(self, proposal_count: int):
+        self.proposals = [
+            {"id": str(i), "status": "active", "metadata": {"title": f"P{i}", "description": "Change things"}}
+            for i in range(proposal_count)
+        ]
+        self.proposals_down = False
+
+    async def get_organization(self, slug):
+        return {"data": {"organization": {"id": "1", "name": "Gloom"}}}
+
+    async def get_proposals(self, org_id, include_active=True):
+        if self.proposals_down:
+            return None
+        return {"data": {"proposals": {"nodes": self.proposals}}}
+
+
+def make_agent(llm, proposal_count: int, **kwargs) -> DaoUpdatesAgent:
+    kwargs.setdefault("analysis_cache", AnalysisCache())
+    kwargs.setdefault("proposal_sync", ProposalSync())
+    kwargs.setdefault("catalog", OrganizationCatalog())
+    kwargs.setdefault("deadlines", DeadlineScheduler())
+    agent = DaoUpdatesAgent(tally_api_key="test-key", llm=llm, **kwargs)
+    agent.tally_client = SimpleNamespace(aio=FakeTally(proposal_count))
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_analyses_run_concurrently_and_keep_order():
+    llm = FakeLLM(delay=0.05)
+    agent = make_agent(llm, proposal_count=12, max_concurrency=4)
+
+    start = time.monotonic()
+    impacts = await agent._analyze_proposals(agent.tally_client.aio.proposals)
+    elapsed = time.monotonic() - start
+
+    assert [impact.summary for impact in impacts] == [f"impact of P{i}" for i in range(12)]
+    assert llm.max_in_flight == 4
+    # Three waves of four instead of twelve sequential calls
+    assert elapsed < 0.4
+
+
+@pytest.mark.asyncio
+async def test_slow_analysis_times_out_without_failing_the_feed():
+    agent = make_agent(FakeLLM(delay=1.0), proposal_count=2, llm_timeout=0.05)
+
+    updates = await agent.get_dao_updates("gloom")
+
+    assert len(updates) == 2
+    assert all(update.description == "Could not analyze impact" for update in updates)
+
+
+@pytest.mark.asyncio
+async def test_repeat_feed_loads_make_no_llm_calls(tmp_path):
+    store = ResponseStore(str(tmp_path / "analyses.db"))
+    llm = FakeLLM(delay=0)
+    agent = make_agent(llm, proposal_count=3, analysis_cache=AnalysisCache(store=store))
+
+    await agent.get_dao_updates("gloom")
+    await agent.get_dao_updates("gloom")
+    assert llm.calls == 3
+
+    # A new process with an empty memory tier is served from the persistent tier
+    restarted_llm = FakeLLM(delay=0)
+    restarted = make_agent(restarted_llm, proposal_count=3, analysis_cache=AnalysisCache(store=store))
+    await restarted.get_dao_updates("gloom")
+    assert restarted_llm.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_edited_proposal_is_reanalyzed_alone():
+    llm = FakeLLM(delay=0)
+    agent = make_agent(llm, proposal_count=3)
+    await agent.get_dao_updates("gloom")
+
+    agent.tally_client.aio.proposals[1]["metadata"]["description"] = "Edited description"
+    await agent.get_dao_updates("gloom")
+
+    assert llm.calls == 4
+
+
+class FakeBatchLLM(FakeLLM):
+    """Answers batch prompts with a JSON array, dropping P1 and mangling P2."""
+
+    def __init__(self):
+        super().__init__(delay=0)
+        self.batch_calls = 0
+
+    async def ainvoke(self, messages):
+        content = messages[0].content
+        if "JSON array" not in content:
+            return await super().ainvoke(messages)
+        self.batch_calls += 1
+        ids = [line.split(": ")[1] for line in content.splitlines() if line.startswith("Proposal ID: ")]
+        items = []
+        for proposal_id in ids:
+            if proposal_id == "1":
+                continue
+            risk = "catastrophic" if proposal_id == "2" else "high"
+            items.append({"id": proposal_id, "summary": f"batched {proposal_id}",
+                          "affected_areas": ["fees"], "risk_level": risk})
+        return SimpleNamespace(content="Here you go:\n" + json.dumps(items))
+
+
+@pytest.mark.asyncio
+async def test_unparseable_analysis_is_retried_next_sync():
+    llm = FakeLLM(delay=0)
+    replies = iter(["I cannot help with that", "Summary: fixed\nAreas: treasury\nRisk: low"])
+
+    async def ainvoke(messages):
+        llm.calls += 1
+        return SimpleNamespace(content=next(replies))
+
+    llm.ainvoke = ainvoke
+    agent = make_agent(llm, proposal_count=1)
+
+    updates, _ = await agent.sync_dao_updates("gloom", [])
+    assert updates[0].description == "Could not analyze impact"
+    updates, delta = await agent.sync_dao_updates("gloom", updates)
+
+    assert delta.changed_ids == ["0"]
+    assert llm.calls == 2
+    assert updates[0].description == "fixed"
+
+
+@pytest.mark.asyncio
+async def test_batch_mode_packs_proposals_and_falls_back_per_item():
+    llm = FakeBatchLLM()
+    agent = make_agent(llm, proposal_count=7, batch_mode=True, max_batch_size=4)
+
+    impacts = await agent._analyze_proposals(agent.tally_client.aio.proposals)
+
+    assert llm.batch_calls == 2
+    assert [impact.summary for impact in impacts] == [
+        "batched 0", "impact of P1", "impact of P2", "batched 3", "batched 4", "batched 5", "batched 6"
+    ]
+    # Two batches plus two per-proposal fallbacks
+    assert llm.calls == 2
+
+
+def test_batches_respect_token_budget():
+    agent = make_agent(FakeLLM(), proposal_count=0, batch_mode=True, batch_token_budget=300)
+    proposals = [{"id": str(i), "metadata": {"title": "T", "description": "x" * 300}} for i in range(6)]
+
+    batches = agent._pack_batches(proposals)
+
+    assert sum(len(batch) for batch in batches) == 6
+    assert all(len(batch) <= 2 for batch in batches)
+
+
+@pytest.mark.asyncio
+async def test_fetched_proposals_feed_the_deadline_scheduler():
+    deadlines = DeadlineScheduler(end_leads=[86400])
+    agent = make_agent(FakeLLM(), proposal_count=2, deadlines=deadlines)
+    agent.tally_client.aio.proposals[0]["end"] = {"timestamp": "2099-01-01T00:00:00Z"}
+
+    await agent.get_dao_updates("gloom")
+
+    assert deadlines.stats()["pending"] == 1
+    assert deadlines.stats()["tracked_proposals"] == 1
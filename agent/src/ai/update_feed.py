@@ -0,0 +1,214 @@
+# agent/src/ai/update_feed.py
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..tally.store import ResponseStore
+from .dao_updates import DaoUpdate, DaoUpdatesAgent
+
+logger = logging.getLogger(__name__)
+
+FOLLOWED_KEY = "feed:followed"
+
+
+class UpdateFeedStore:
+    """Ready-made DaoUpdate lists per DAO, plus which DAOs users follow.
+
+    Feeds live in memory and, when a ResponseStore is given, on disk so every
+    worker process and restart can serve them.
+    """
+
+    def __init__(self, store: Optional[ResponseStore] = None):
+        self.store = store
+        self._feeds: Dict[str, Tuple[List[Dict[str, Any]], float]] = {}
+        self._followed: Dict[str, float] = {}
+        self._listeners: List[Callable[[str, List[DaoUpdate]], Any]] = []
+        self._lock = threading.Lock()
+        if store is not None:
+            stored = store.get(FOLLOWED_KEY)
+            if stored is not None:
+                self._followed.update(stored[0])
+
+    def put(self, dao_slug: str, updates: List[DaoUpdate], generated_at: Optional[float] = None) -> str:
+        """Stores a DAO's feed and returns its ISO 8601 generation time."""
+        generated_at = time.time() if generated_at is None else generated_at
+        payload = [update.dict() for update in updates]
+        with self._lock:
+            self._feeds[dao_slug] = (payload, generated_at)
+        if self.store is not None:
+            self.store.put(f"feed:{dao_slug}", "DaoUpdateFeed", payload, fetched_at=generated_at)
+        for listener in list(self._listeners):
+            try:
+                listener(dao_slug, updates)
+            except Exception as e:
+                logger.error(f"Update feed listener failed for DAO {dao_slug}: {str(e)}")
+        return _isoformat(generated_at)
+
+    def add_listener(self, listener: Callable[[str, List[DaoUpdate]], Any]) -> None:
+        """Calls listener(dao_slug, updates) whenever a DAO's feed is regenerated."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, List[DaoUpdate]], Any]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def get(self, dao_slug: str, max_age: float) -> Optional[Tuple[List[DaoUpdate], str]]:
+        """Returns (updates, generated_at) if a feed younger than max_age exists."""
+        with self._lock:
+            feed = self._feeds.get(dao_slug)
+        if feed is None and self.store is not None:
+            stored = self.store.get(f"feed:{dao_slug}")
+            if stored is not None:
+                feed = (stored[0], time.time() - stored[1])
+                with self._lock:
+                    self._feeds[dao_slug] = feed
+        if feed is None or time.time() - feed[1] > max_age:
+            return None
+        return [DaoUpdate(**update) for update in feed[0]], _isoformat(feed[1])
+
+    def touch(self, dao_slug: str) -> bool:
+        """Marks an unchanged feed as freshly generated; returns False if there is none."""
+        with self._lock:
+            feed = self._feeds.get(dao_slug)
+        if feed is None:
+            return False
+        generated_at = time.time()
+        with self._lock:
+            self._feeds[dao_slug] = (feed[0], generated_at)
+        if self.store is not None:
+            self.store.put(f"feed:{dao_slug}", "DaoUpdateFeed", feed[0], fetched_at=generated_at)
+        return True
+
+    def track(self, dao_slugs: List[str]) -> None:
+        """Records that a user asked for these DAOs."""
+        now = time.time()
+        with self._lock:
+            for dao_slug in dao_slugs:
+                self._followed[dao_slug] = now
+            followed = dict(self._followed)
+        if self.store is not None:
+            self.store.put(FOLLOWED_KEY, "FollowedDaos", followed)
+
+    def followed(self, window: float) -> List[str]:
+        """DAOs requested within the last `window` seconds, most recent first."""
+        cutoff = time.time() - window
+        with self._lock:
+            recent = [(slug, seen) for slug, seen in self._followed.items() if seen >= cutoff]
+        return [slug for slug, _ in sorted(recent, key=lambda item: item[1], reverse=True)]
+
+
+class UpdateFeedWorker:
+    """Periodically regenerates the feeds of followed DAOs in the background."""
+
+    def __init__(self, agent_factory: Callable[[], DaoUpdatesAgent], feed_store: UpdateFeedStore,
+                 interval: float = 300.0, follow_window: float = 86400.0, max_concurrency: int = 2,
+                 incremental: bool = False):
+        """Initialize the worker.
+
+        Args:
+            agent_factory: Builds the DaoUpdatesAgent used for each refresh cycle
+            feed_store: Where generated feeds are written
+            interval: Seconds between refresh cycles
+            follow_window: How recently a DAO must have been requested to be refreshed
+            max_concurrency: Most DAOs regenerated at once
+            incremental: Only re-analyze proposals that changed since the last cycle
+        """
+        self.agent_factory = agent_factory
+        self.feed_store = feed_store
+        self.interval = interval
+        self.follow_window = follow_window
+        self.max_concurrency = max_concurrency
+        self.incremental = incremental
+        self.last_cycle: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh_once(self) -> Dict[str, str]:
+        """Regenerates every followed DAO's feed once; returns a status per DAO."""
+        dao_slugs = self.feed_store.followed(self.follow_window)
+        if not dao_slugs:
+            return {}
+
+        started = time.monotonic()
+        agent = self.agent_factory()
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def refresh(dao_slug: str) -> str:
+            async with semaphore:
+                try:
+                    if self.incremental:
+                        return await sync(dao_slug)
+                    updates = await agent.get_dao_updates(dao_slug)
+                except Exception as e:
+                    logger.error(f"Error precomputing updates for DAO {dao_slug}: {str(e)}")
+                    return "error"
+            if updates is None:
+                # Keep the last good feed rather than replacing it with nothing
+                return "error"
+            self.feed_store.put(dao_slug, updates)
+            return "ok"
+
+        async def sync(dao_slug: str) -> str:
+            previous = self.feed_store.get(dao_slug, max_age=float('inf'))
+            synced = await agent.sync_dao_updates(dao_slug, previous[0] if previous else [])
+            if synced is None:
+                return "error"
+            updates, delta = synced
+            if previous is not None and not delta.has_changes:
+                self.feed_store.touch(dao_slug)
+                return "unchanged"
+            self.feed_store.put(dao_slug, updates)
+            return "ok"
+
+        statuses = await asyncio.gather(*(refresh(dao_slug) for dao_slug in dao_slugs))
+        results = dict(zip(dao_slugs, statuses))
+        self.last_cycle = {
+            "finished_at": _isoformat(time.time()),
+            "duration_ms": round((time.monotonic() - started) * 1000),
+            "daos": results
+        }
+        logger.info(f"Precomputed update feeds for {len(dao_slugs)} DAOs")
+        return results
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh_once()
+            except Exception as e:
+                logger.error(f"Update feed refresh cycle failed: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            logger.info(f"Starting update feed worker (every {self.interval}s)")
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def _isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+_default_feed_store: Optional[UpdateFeedStore] = None
+_default_feed_store_lock = threading.Lock()
+
+
+def get_feed_store() -> UpdateFeedStore:
+    """Returns the process-wide feed store, persisted if UPDATES_FEED_PATH is set."""
+    global _default_feed_store
+    with _default_feed_store_lock:
+        if _default_feed_store is None:
+            path = os.getenv('UPDATES_FEED_PATH')
+            _default_feed_store = UpdateFeedStore(store=ResponseStore(path) if path else None)
+        return _default_feed_store
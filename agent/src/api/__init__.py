@@ -1,2 +1,9 @@
 # agent/src/api/__init__.py
-from .delegation_api import app
\ No newline at end of file
+
+
+def __getattr__(name):
+    # Importing a submodule (e.g. .streaming) should not build the delegation app
+    if name == 'app':
+        from .delegation_api import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
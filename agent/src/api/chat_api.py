@@ -1,16 +1,42 @@
 # agent/src/api/chat_api.py
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 import logging
-from ..ai.chatbot_agent import DAOAgent, AgentResponse
+import os
+from contextlib import asynccontextmanager
+from ..ai.actions import AgentResponse
+from ..tally.catalog import get_organization_catalog
+from ..tally.session import aclose_session
+from ..ai.lazy_agent import LazyAgent
+from ..config import configure
+from .streaming import stream_frames
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+configure()
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+def create_agent():
+    # Imported here so the app can serve /health before langchain and CDP load
+    from ..ai.chatbot_agent import DAOAgent
+    return DAOAgent()
+
+# Agent shared by every request, built on first use or by the optional warmup
+agent = LazyAgent(create_agent, name="DAO Agent")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Keep the organization catalog the agent reads DAO details from fresh, and close the pooled Tally session on shutdown."""
+    catalog = get_organization_catalog()
+    catalog.start()
+    if os.getenv('AGENT_WARMUP', '').lower() in ('1', 'true', 'yes'):
+        agent.warmup()
+    yield
+    await catalog.stop()
+    await aclose_session()
+
+app = FastAPI(lifespan=lifespan)
 
 # Enable CORS
 app.add_middleware(
@@ -21,9 +47,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize agent
-agent = DAOAgent()
-
 class ChatRequest(BaseModel):
     message: str
     address: str  # User's wallet address
@@ -33,7 +56,8 @@ async def chat(request: ChatRequest):
     """Process chat messages and generate actions."""
     try:
         logger.info(f"Processing chat request from {request.address}")
-        response = await agent.chat(request.message)
+        dao_agent = await agent.aget()
+        response = await dao_agent.chat(request.message, address=request.address)
         
         # If there's an action, add the user's address to the context
         if response.action:
@@ -44,4 +68,39 @@ async def chat(request: ChatRequest):
         
     except Exception as e:
         logger.error(f"Error processing chat: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest, http_request: Request):
+    """Stream a chat reply token by token as NDJSON, or as Server-Sent Events when requested.
+
+    A prepared transaction arrives as an "action" frame and the complete
+    reply in the final "done" frame.
+    """
+    logger.info(f"Streaming chat request from {request.address}")
+    try:
+        dao_agent = await agent.aget()
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return stream_frames(dao_agent.astream_chat(request.message, address=request.address), http_request)
+
+
+@app.get("/api/chat/stats")
+async def chat_stats():
+    """Expose response cache and conversation counters for tuning."""
+    return {
+        "response_cache": agent.get().response_cache.stats() if agent.ready else None,
+        "conversations": agent.get().conversations.stats() if agent.ready else None
+    }
+
+@app.get("/health")
+async def health_check():
+    """Liveness: the process is up, whether or not the agent is built yet."""
+    return {"status": "healthy"}
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: 200 once the agent can serve chats; starts building it if nothing has."""
+    if agent.status()["status"] in ("idle", "error"):
+        agent.warmup()
+    return JSONResponse(agent.status(), status_code=200 if agent.ready else 503)
@@ -1,34 +1,75 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any, Literal
+from typing import List, Optional, Dict, Any, Literal, AsyncIterator
 from datetime import datetime
+import asyncio
+from contextlib import asynccontextmanager
 import logging
 import os
+import time
 from ..tally.client import TallyClient
+from ..tally.cache import get_response_cache
+from ..tally.rate_limit import get_rate_limiter
+from ..tally.singleflight import get_single_flight
+from ..tally.catalog import BASE_CHAIN_ID, get_organization_catalog
+from ..tally.session import aclose_session
 from ..ai.dao_updates import DaoUpdatesAgent, DaoUpdate
+from ..ai.update_feed import UpdateFeedWorker, get_feed_store
+from ..ai.notifications import (
+    NotificationPreferences, Subscription, deadline_update, get_notification_service, validate_webhook_url,
+    verify_ownership
+)
+from ..ai.deadlines import get_deadline_scheduler
+from .streaming import stream_frames
+from ..config import configure
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Load .env and set up logging before the settings below are read
+configure()
 logger = logging.getLogger(__name__)
 
-# Load environment variables from .env file
-from dotenv import load_dotenv
-from pathlib import Path
-
-# Get the project root directory (where .env is located)
-root_dir = Path(__file__).resolve().parent.parent.parent.parent
-env_path = root_dir / '.env'
+# Precomputed DAO update feeds: how often the worker refreshes followed DAOs (0 disables it),
+# how old a feed may be when served while the worker runs, and how long a DAO stays followed
+# after its last request
+UPDATES_PRECOMPUTE_INTERVAL = float(os.getenv('UPDATES_PRECOMPUTE_INTERVAL', '0'))
+UPDATES_FEED_MAX_AGE = float(os.getenv('UPDATES_FEED_MAX_AGE', '600'))
+UPDATES_FOLLOW_WINDOW = float(os.getenv('UPDATES_FOLLOW_WINDOW', '86400'))
+# Re-analyze only proposals that changed since the previous cycle
+UPDATES_INCREMENTAL_SYNC = os.getenv('UPDATES_INCREMENTAL_SYNC', '').lower() in ('1', 'true', 'yes')
 
-# Load environment variables from .env file
-load_dotenv(dotenv_path=env_path)
-logger.info(f"Loading environment variables from: {env_path}")
-
-# Log environment variable status (without exposing values)
-for var in ['TALLY_API_KEY', 'OPENAI_API_KEY']:
-    logger.info(f"{var} is {'set' if os.getenv(var) else 'not set'}")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Keep the organization catalog fresh, notify subscribers of new updates and
+    approaching voting deadlines, and run the update feed worker when precomputation is enabled.
+    The pooled Tally session is closed on shutdown."""
+    catalog = get_organization_catalog()
+    catalog.start()
+    notifications = get_notification_service()
+    notifications.dispatcher.start()
+    get_feed_store().add_listener(notifications.publish)
+    deadlines = get_deadline_scheduler()
+    deadlines.start(on_fire=lambda events: notifications.deliver([deadline_update(event) for event in events]))
+    feed_worker = None
+    if UPDATES_PRECOMPUTE_INTERVAL > 0:
+        feed_worker = UpdateFeedWorker(
+            agent_factory=get_updates_agent,
+            feed_store=get_feed_store(),
+            interval=UPDATES_PRECOMPUTE_INTERVAL,
+            follow_window=UPDATES_FOLLOW_WINDOW,
+            incremental=UPDATES_INCREMENTAL_SYNC
+        )
+        feed_worker.start()
+    app.state.feed_worker = feed_worker
+    yield
+    if feed_worker is not None:
+        await feed_worker.stop()
+    get_feed_store().remove_listener(notifications.publish)
+    await deadlines.stop()
+    await notifications.dispatcher.stop()
+    await catalog.stop()
+    await aclose_session()
 
-app = FastAPI(title="Tabula API", description="DAO Intelligence Hub API")
+app = FastAPI(title="Tabula API", description="DAO Intelligence Hub API", lifespan=lifespan)
 
 # Enable CORS
 app.add_middleware(
@@ -39,6 +80,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Most DAO update pipelines running at once across all requests, and how long one may take
+UPDATES_MAX_CONCURRENCY = int(os.getenv('UPDATES_MAX_CONCURRENCY', '4'))
+UPDATES_DAO_TIMEOUT = float(os.getenv('UPDATES_DAO_TIMEOUT', '90'))
+
+_updates_semaphores: Dict[int, asyncio.Semaphore] = {}
+
+def get_updates_semaphore() -> asyncio.Semaphore:
+    """Get the process-wide DAO pipeline semaphore for the running event loop."""
+    loop_id = id(asyncio.get_running_loop())
+    if loop_id not in _updates_semaphores:
+        _updates_semaphores.clear()
+        _updates_semaphores[loop_id] = asyncio.Semaphore(UPDATES_MAX_CONCURRENCY)
+    return _updates_semaphores[loop_id]
+
 class TokenHolding(BaseModel):
     token_address: str
     chain_id: str
@@ -51,8 +106,20 @@ class UpdatesRequest(BaseModel):
     dao_slugs: List[str]
     token_holdings: Optional[Dict[str, str]] = None
 
+class OwnershipProof(BaseModel):
+    """personal_sign signature of ownership_message(action, address, timestamp)."""
+    signature: str
+    timestamp: int
+
+class SubscribeRequest(OwnershipProof):
+    address: str
+    preferences: NotificationPreferences
+
+_tally_client: Optional[TallyClient] = None
+
 def get_tally_client() -> TallyClient:
-    """Get or create TallyClient instance."""
+    """Get the shared TallyClient instance, creating it on first use."""
+    global _tally_client
     tally_api_key = os.getenv('TALLY_API_KEY')
     if not tally_api_key:
         raise HTTPException(
@@ -60,14 +127,16 @@ def get_tally_client() -> TallyClient:
             detail="TALLY_API_KEY environment variable is not set"
         )
     
-    try:
-        return TallyClient()
-    except Exception as e:
-        logger.error(f"Error initializing TallyClient: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to initialize TallyClient"
-        )
+    if _tally_client is None:
+        try:
+            _tally_client = TallyClient()
+        except Exception as e:
+            logger.error(f"Error initializing TallyClient: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to initialize TallyClient"
+            )
+    return _tally_client
 
 def get_updates_agent() -> DaoUpdatesAgent:
     """Get DaoUpdatesAgent instance."""
@@ -87,7 +156,10 @@ def get_updates_agent() -> DaoUpdatesAgent:
         )
     
     try:
-        return DaoUpdatesAgent(tally_api_key=tally_api_key)
+        return DaoUpdatesAgent(
+            tally_api_key=tally_api_key,
+            batch_mode=os.getenv('DAO_UPDATES_BATCH_MODE', '').lower() in ('1', 'true', 'yes')
+        )
     except Exception as e:
         logger.error(f"Error initializing DaoUpdatesAgent: {str(e)}")
         raise HTTPException(
@@ -105,60 +177,55 @@ async def get_delegations(address: str, request: DelegationRequest):
         # Get TallyClient instance
         tally_client = get_tally_client()
         
-        # Get all Base DAOs
-        orgs = tally_client.get_organizations()
-        
-        if not orgs or 'data' not in orgs or 'organizations' not in orgs['data']:
+        # Get all Base DAOs from the shared catalog
+        catalog = get_organization_catalog()
+        if not await catalog.ensure_loaded():
             raise HTTPException(status_code=500, detail="Failed to fetch organizations")
-        
-        base_daos = []
-        for dao in orgs['data']['organizations']['nodes']:
-            # Only include Base DAOs
-            if 'eip155:8453' in dao.get('chainIds', []):
-                base_daos.append(dao)
+        base_daos = catalog.by_chain(BASE_CHAIN_ID)
         
         logger.info(f"Found {len(base_daos)} Base DAOs")
         
-        # Get active delegations
-        active_delegations = []
+        # Convert organization ids to integers
+        dao_by_org_id = {}
         for dao in base_daos:
             try:
-                # Convert organization_id to integer
-                org_id = int(dao['id'])
-                delegate_info = tally_client.get_delegate_info(address, org_id)
-                if delegate_info and delegate_info.get('data', {}).get('delegate', {}).get('delegatorsCount', 0) > 0:
-                    active_delegations.append({
-                        "dao_name": dao['name'],
-                        "dao_slug": dao['slug'],
-                        "token_amount": f"{delegate_info.get('data', {}).get('delegate', {}).get('votesCount', 0)} votes",
-                        "chain_ids": dao['chainIds'],
-                        "proposals_count": dao.get('proposalsCount', 0),
-                        "has_active_proposals": dao.get('hasActiveProposals', False)
-                    })
+                dao_by_org_id[int(dao['id'])] = dao
             except (ValueError, TypeError) as e:
                 logger.error(f"Error processing delegation for DAO {dao['slug']}: {str(e)}")
-                continue
+
+        # Get active delegations with a few batched lookups instead of one per DAO
+        delegates = await tally_client.aio.get_delegate_info_many(address, list(dao_by_org_id))
+
+        active_delegations = []
+        for org_id, dao in dao_by_org_id.items():
+            delegate_info = delegates.get(org_id)
+            if delegate_info and (delegate_info.get('delegatorsCount') or 0) > 0:
+                active_delegations.append({
+                    "dao_name": dao['name'],
+                    "dao_slug": dao['slug'],
+                    "token_amount": f"{delegate_info.get('votesCount', 0)} votes",
+                    "chain_ids": dao['chainIds'],
+                    "proposals_count": dao.get('proposalsCount', 0),
+                    "has_active_proposals": dao.get('hasActiveProposals', False)
+                })
         
-        # Get available delegations (based on token holdings)
+        # Get available delegations (based on token holdings) with exact token lookups
+        matched_slugs = {d['dao_slug'] for d in active_delegations}
         available_delegations = []
-        for dao in base_daos:
-            # Skip if already delegating
-            if any(d['dao_slug'] == dao['slug'] for d in active_delegations):
-                continue
-                
-            # Check if user holds the governance token
-            token_id = dao.get('tokenIds', [None])[0]
-            if token_id:
-                for holding in request.token_holdings:
-                    if holding.token_address.lower() in token_id.lower():
-                        available_delegations.append({
-                            "dao_name": dao['name'],
-                            "dao_slug": dao['slug'],
-                            "token_amount": f"Balance: {holding.balance}",
-                            "chain_ids": dao['chainIds'],
-                            "proposals_count": dao.get('proposalsCount', 0),
-                            "has_active_proposals": dao.get('hasActiveProposals', False)
-                        })
+        for holding in request.token_holdings:
+            for dao in catalog.by_token(holding.chain_id, holding.token_address):
+                # Skip if already delegating or already matched by another holding
+                if dao['slug'] in matched_slugs:
+                    continue
+                matched_slugs.add(dao['slug'])
+                available_delegations.append({
+                    "dao_name": dao['name'],
+                    "dao_slug": dao['slug'],
+                    "token_amount": f"Balance: {holding.balance}",
+                    "chain_ids": dao['chainIds'],
+                    "proposals_count": dao.get('proposalsCount', 0),
+                    "has_active_proposals": dao.get('hasActiveProposals', False)
+                })
         
         # Get recommended DAOs (most active ones)
         recommended_daos = sorted(
@@ -189,39 +256,95 @@ async def get_delegations(address: str, request: DelegationRequest):
         logger.error(f"Error processing delegations: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def sort_updates(updates: List[DaoUpdate]) -> List[DaoUpdate]:
+    """Sort updates by priority and timestamp."""
+    return sorted(
+        updates,
+        key=lambda x: (
+            {'urgent': 0, 'important': 1, 'fyi': 2}[x.priority],
+            x.timestamp
+        ),
+        reverse=True
+    )
+
+async def get_updates_for_dao(agent: DaoUpdatesAgent, dao_slug: str,
+                              token_holdings: Optional[Dict[str, str]]) -> List[DaoUpdate]:
+    """Run one DAO's update pipeline under the global cap and per-DAO timeout.
+
+    A slow or failing DAO falls back to its last stored feed, or yields no
+    updates, instead of failing the request. Failures never overwrite the feed.
+    """
+    async with get_updates_semaphore():
+        try:
+            updates = await asyncio.wait_for(
+                agent.get_dao_updates(dao_slug=dao_slug, user_holdings=token_holdings),
+                timeout=UPDATES_DAO_TIMEOUT
+            )
+            if updates is not None:
+                logger.info(f"Got {len(updates)} updates for DAO {dao_slug}")
+                generated_at = get_feed_store().put(dao_slug, updates)
+                return with_feed_timestamp(updates, generated_at)
+            logger.error(f"Could not load updates for DAO {dao_slug}")
+        except asyncio.TimeoutError:
+            logger.error(f"Timed out after {UPDATES_DAO_TIMEOUT}s getting updates for DAO {dao_slug}")
+        except Exception as e:
+            logger.error(f"Error getting updates for DAO {dao_slug}: {str(e)}")
+    stale = get_feed_store().get(dao_slug, max_age=float('inf'))
+    return with_feed_timestamp(*stale) if stale is not None else []
+
+def with_feed_timestamp(updates: List[DaoUpdate], generated_at: str) -> List[DaoUpdate]:
+    """Mark each update with when its DAO feed was generated."""
+    for update in updates:
+        update.metadata['feed_generated_at'] = generated_at
+    return updates
+
 @app.post("/api/updates", response_model=List[DaoUpdate])
-async def get_dao_updates(request: UpdatesRequest):
-    """Get AI-curated updates for specified DAOs."""
+async def get_dao_updates(request: UpdatesRequest, response: Response):
+    """Get AI-curated updates for specified DAOs.
+
+    When the feed worker is enabled, DAOs with a fresh precomputed feed are
+    served from the feed store; only the rest run the update pipeline. The
+    X-Feed-Generated-At header holds the generation time of the oldest feed
+    in the response.
+    """
     try:
         logger.info(f"Processing updates request for DAOs: {request.dao_slugs}")
         
-        # Get DaoUpdatesAgent instance
-        agent = get_updates_agent()
-        logger.info("DAO Updates Agent initialized successfully")
-        
-        # Get updates for each DAO
-        all_updates = []
-        for dao_slug in request.dao_slugs:
-            try:
-                updates = await agent.get_dao_updates(
-                    dao_slug=dao_slug,
-                    user_holdings=request.token_holdings
-                )
-                logger.info(f"Got {len(updates)} updates for DAO {dao_slug}")
-                all_updates.extend(updates)
-            except Exception as e:
-                logger.error(f"Error getting updates for DAO {dao_slug}: {str(e)}")
-                continue
+        dao_slugs = list(dict.fromkeys(request.dao_slugs))
+        feed_store = get_feed_store()
+        feed_store.track(dao_slugs)
+
+        results: Dict[str, List[DaoUpdate]] = {}
+        generated: List[str] = []
+        # Without the worker nothing refreshes stored feeds, so every request recomputes
+        for dao_slug in dao_slugs if UPDATES_PRECOMPUTE_INTERVAL > 0 else []:
+            feed = feed_store.get(dao_slug, max_age=UPDATES_FEED_MAX_AGE)
+            if feed is not None:
+                results[dao_slug] = with_feed_timestamp(*feed)
+                generated.append(feed[1])
+
+        missing = [dao_slug for dao_slug in dao_slugs if dao_slug not in results]
+        logger.info(f"Serving {len(results)} DAOs from precomputed feeds, computing {len(missing)}")
+        if missing:
+            # Get DaoUpdatesAgent instance
+            agent = get_updates_agent()
+            logger.info("DAO Updates Agent initialized successfully")
+
+            # Get updates for the remaining DAOs concurrently
+            computed = await asyncio.gather(*(
+                get_updates_for_dao(agent, dao_slug, request.token_holdings)
+                for dao_slug in missing
+            ))
+            results.update(zip(missing, computed))
+            generated.extend(
+                updates[0].metadata['feed_generated_at'] for updates in computed if updates
+            )
+
+        all_updates = [update for dao_slug in dao_slugs for update in results[dao_slug]]
         
-        # Sort all updates by priority and timestamp
-        sorted_updates = sorted(
-            all_updates,
-            key=lambda x: (
-                {'urgent': 0, 'important': 1, 'fyi': 2}[x.priority],
-                x.timestamp
-            ),
-            reverse=True
-        )
+        sorted_updates = sort_updates(all_updates)
+        if generated:
+            response.headers["X-Feed-Generated-At"] = min(generated)
         
         logger.info(f"Returning {len(sorted_updates)} total updates")
         return sorted_updates
@@ -230,6 +353,121 @@ async def get_dao_updates(request: UpdatesRequest):
         logger.error(f"Error processing updates: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def stream_update_frames(agent: DaoUpdatesAgent, dao_slugs: List[str],
+                               token_holdings: Optional[Dict[str, str]]) -> AsyncIterator[Dict[str, Any]]:
+    """Yield an "update" frame per DaoUpdate as soon as it is ready, then one "summary" frame.
+
+    Every DAO streams concurrently under the same global cap and per-DAO
+    timeout as /api/updates; updates produced before a DAO times out are kept.
+    """
+    started = time.monotonic()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def produce(dao_slug: str) -> None:
+        count = 0
+        status = "ok"
+
+        async def run() -> None:
+            nonlocal count
+            async for update in agent.iter_dao_updates(dao_slug, user_holdings=token_holdings):
+                count += 1
+                await queue.put(("update", update))
+
+        async with get_updates_semaphore():
+            try:
+                await asyncio.wait_for(run(), timeout=UPDATES_DAO_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.error(f"Timed out after {UPDATES_DAO_TIMEOUT}s streaming updates for DAO {dao_slug}")
+                status = "timeout"
+            except Exception as e:
+                logger.error(f"Error streaming updates for DAO {dao_slug}: {str(e)}")
+                status = "error"
+        await queue.put(("done", dao_slug, status, count))
+
+    producers = [asyncio.ensure_future(produce(dao_slug)) for dao_slug in dao_slugs]
+    try:
+        remaining = len(producers)
+        total = 0
+        daos: Dict[str, Dict[str, Any]] = {}
+        while remaining:
+            item = await queue.get()
+            if item[0] == "update":
+                total += 1
+                yield {"type": "update", "data": item[1].dict()}
+            else:
+                remaining -= 1
+                daos[item[1]] = {"status": item[2], "updates": item[3]}
+
+        yield {
+            "type": "summary",
+            "data": {
+                "total_updates": total,
+                "daos": daos,
+                "elapsed_ms": round((time.monotonic() - started) * 1000)
+            }
+        }
+    finally:
+        # Stop remaining pipelines if the client disconnects mid-stream
+        for producer in producers:
+            producer.cancel()
+
+@app.post("/api/updates/stream")
+async def stream_dao_updates(request: UpdatesRequest, http_request: Request):
+    """Stream AI-curated updates as NDJSON, or as Server-Sent Events when requested.
+
+    Each update is sent as soon as its analysis finishes, followed by a final
+    summary frame. /api/updates remains available for clients that want the
+    complete sorted list.
+    """
+    logger.info(f"Streaming updates for DAOs: {request.dao_slugs}")
+    agent = get_updates_agent()
+
+    frames = stream_update_frames(agent, list(dict.fromkeys(request.dao_slugs)), request.token_holdings)
+    return stream_frames(frames, http_request)
+
+@app.get("/api/tally/stats")
+async def tally_stats():
+    """Expose Tally client counters for tuning cache TTLs."""
+    return {
+        "cache": get_response_cache().stats(),
+        "rate_limit": get_rate_limiter().stats(),
+        "coalescing": get_single_flight().stats(),
+        "catalog": get_organization_catalog().stats()
+    }
+
+@app.post("/api/notifications/subscribe")
+async def subscribe_notifications(request: SubscribeRequest):
+    """Subscribe a wallet to webhook notifications of new DAO updates.
+
+    The wallet must sign the "subscribe" ownership message, and the webhook
+    must be an https Discord URL since the server will POST to it.
+    """
+    problem = validate_webhook_url(request.preferences.discordWebhookUrl)
+    if problem is not None:
+        raise HTTPException(status_code=400, detail=problem)
+    if not verify_ownership("subscribe", request.address, request.timestamp, request.signature):
+        raise HTTPException(status_code=401, detail="Signature does not prove ownership of the address")
+    stored = get_notification_service().subscribe(Subscription(address=request.address, preferences=request.preferences))
+    logger.info(f"Subscribed {stored.address} to notifications")
+    return {"status": "subscribed", "address": stored.address}
+
+@app.post("/api/notifications/unsubscribe/{address}")
+async def unsubscribe_notifications(address: str, proof: OwnershipProof):
+    """Remove a wallet's notification subscription; succeeds even if there was none.
+
+    The wallet must sign the "unsubscribe" ownership message.
+    """
+    if not verify_ownership("unsubscribe", address, proof.timestamp, proof.signature):
+        raise HTTPException(status_code=401, detail="Signature does not prove ownership of the address")
+    removed = get_notification_service().unsubscribe(address)
+    logger.info(f"Unsubscribed {address} from notifications (removed={removed})")
+    return {"status": "unsubscribed", "address": address.lower(), "removed": removed}
+
+@app.get("/api/notifications/stats")
+async def notification_stats():
+    """Expose subscription index, webhook delivery and deadline scheduler counters."""
+    return {**get_notification_service().stats(), "deadlines": get_deadline_scheduler().stats()}
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -0,0 +1,24 @@
+# agent/src/api/streaming.py
+
+import json
+from typing import Any, AsyncIterator, Dict
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+
+def encode_frame(frame: Dict[str, Any], sse: bool) -> str:
+    """Encode a frame as an NDJSON line or a Server-Sent Event."""
+    payload = json.dumps(frame["data"] if sse else frame)
+    if sse:
+        return f"event: {frame['type']}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+
+def stream_frames(frames: AsyncIterator[Dict[str, Any]], http_request: Request) -> StreamingResponse:
+    """Stream {"type", "data"} frames as NDJSON, or as Server-Sent Events when the client asks for them."""
+    sse = "text/event-stream" in http_request.headers.get("accept", "")
+    return StreamingResponse(
+        (encode_frame(frame, sse) async for frame in frames),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,22 @@
+# agent/src/api/tests/test_import_cost.py
+
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+ROOT = Path(__file__).resolve().parents[4]
+DEFERRED = ("langchain_openai", "langgraph", "cdp", "cdp_langchain", "cdp_agentkit_core", "eth_utils", "eth_account")
+
+
+@pytest.mark.parametrize("module", ["main", "agent.src.api.delegation_api", "agent.src.api.chat_api"])
+def test_entry_points_defer_agent_stacks(module):
+    code = f"import sys, {module}; print(' '.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    loaded = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert not set(loaded.stdout.split()) & set(DEFERRED)
+
+
+def test_importing_a_submodule_does_not_build_the_app():
+    code = "import sys, agent.src.api.streaming; print('agent.src.api.delegation_api' in sys.modules)"
+    loaded = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert loaded.stdout.strip() == "False"
@@ -0,0 +1,105 @@
+# agent/src/api/tests/test_notifications_api.py
+
+import time
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from fastapi.testclient import TestClient
+from .. import delegation_api
+from ..delegation_api import app
+from ...ai.notifications import NotificationService, WebhookDispatcher, ownership_message
+from ...ai.update_feed import UpdateFeedStore
+from ...ai.tests.test_notifications import Sink, make_update, subscription
+
+WALLET = Account.create()
+WEBHOOK = "https://discord.com/api/webhooks/1/x"
+
+
+@pytest.fixture
+def sink():
+    sink = Sink()
+    yield sink
+    sink.server.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def service(monkeypatch):
+    service = NotificationService(dispatcher=WebhookDispatcher(backoff=0.01))
+    store = UpdateFeedStore()
+    monkeypatch.setattr(delegation_api, "get_notification_service", lambda: service)
+    monkeypatch.setattr(delegation_api, "get_feed_store", lambda: store)
+    return service
+
+
+def proof(action, address=WALLET.address, wallet=WALLET, timestamp=None):
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    signed = wallet.sign_message(encode_defunct(text=ownership_message(action, address, timestamp)))
+    return {"signature": signed.signature.hex(), "timestamp": timestamp}
+
+
+def subscribe_body(url, address=WALLET.address, **preferences):
+    return {"address": address, **proof("subscribe", address),
+            "preferences": {"discordWebhookUrl": url, "notifyOn": {"urgent": True, "important": True, "fyi": False}, **preferences}}
+
+
+def test_subscribe_and_unsubscribe(service):
+    client = TestClient(app)
+
+    response = client.post("/api/notifications/subscribe", json=subscribe_body(WEBHOOK))
+    assert response.status_code == 200
+    assert response.json() == {"status": "subscribed", "address": WALLET.address.lower()}
+    assert service.stats()["subscribers"] == 1
+
+    url = f"/api/notifications/unsubscribe/{WALLET.address.lower()}"
+    assert client.post(url, json=proof("unsubscribe")).json()["removed"] is True
+    assert client.post(url, json=proof("unsubscribe")).json()["removed"] is False
+    assert service.stats()["subscribers"] == 0
+
+
+@pytest.mark.parametrize("url", [
+    None,
+    "ftp://discord.com/api/webhooks/1/x",
+    "http://discord.com/api/webhooks/1/x",
+    "https://169.254.169.254/latest/meta-data",
+    "https://localhost/hook",
+    "https://discord.com.evil.example/api/webhooks/1/x",
+    "https://discord.com:8443/api/webhooks/1/x",
+])
+def test_subscribe_rejects_webhooks_off_discord(url):
+    client = TestClient(app)
+    assert client.post("/api/notifications/subscribe", json=subscribe_body(url)).status_code == 400
+
+
+def test_changes_require_the_owners_signature(service):
+    client = TestClient(app)
+    other = Account.create()
+
+    forged = {**subscribe_body(WEBHOOK), **proof("subscribe", WALLET.address, wallet=other)}
+    assert client.post("/api/notifications/subscribe", json=forged).status_code == 401
+    expired = {**subscribe_body(WEBHOOK), **proof("subscribe", timestamp=int(time.time()) - 3600)}
+    assert client.post("/api/notifications/subscribe", json=expired).status_code == 401
+    # A subscribe signature cannot be replayed to unsubscribe
+    service.subscribe(subscription(WALLET.address, WEBHOOK))
+    url = f"/api/notifications/unsubscribe/{WALLET.address}"
+    assert client.post(url, json=proof("subscribe")).status_code == 401
+    assert client.post(url, json=proof("unsubscribe", wallet=other)).status_code == 401
+    assert service.stats()["subscribers"] == 1
+
+
+def test_new_updates_are_delivered_to_subscribers(monkeypatch, service, sink):
+    feeds = [[make_update("1")], [make_update("1"), make_update("2"), make_update("3", priority="fyi")]]
+
+    class FakeUpdatesAgent:
+        async def get_dao_updates(self, dao_slug, user_holdings=None):
+            return feeds.pop(0)
+
+    monkeypatch.setattr(delegation_api, "get_updates_agent", FakeUpdatesAgent)
+
+    with TestClient(app) as client:
+        # Straight to the service: the endpoint only accepts Discord hosts
+        service.subscribe(subscription(WALLET.address, f"{sink.url}/hook", daos=["gloom"]))
+        client.post("/api/updates", json={"dao_slugs": ["gloom"]})
+        client.post("/api/updates", json={"dao_slugs": ["gloom"]})
+        client.portal.call(service.dispatcher.drain)
+
+    assert [[embed["title"] for embed in body["embeds"]] for _, body in sink.requests] == [["[URGENT] Gloom: Update 2"]]
@@ -0,0 +1,63 @@
+# agent/src/api/tests/test_readiness.py
+
+import importlib
+import time
+from types import SimpleNamespace
+import pytest
+from fastapi.testclient import TestClient
+import main
+from ...ai.lazy_agent import LazyAgent
+from ...tally.catalog import OrganizationCatalog
+from ...tally.session import get_session
+
+
+def test_health_is_served_before_the_agent_is_built(monkeypatch):
+    def build():
+        time.sleep(0.2)
+        return object()
+    monkeypatch.setattr(main, "agent", LazyAgent(build))
+
+    with TestClient(main.app) as client:
+        assert client.get("/health").json() == {"status": "healthy"}
+        assert not main.agent.ready
+
+        first = client.get("/ready")
+        assert first.status_code == 503 and first.json()["status"] == "starting"
+
+        deadline = time.monotonic() + 2
+        while client.get("/ready").status_code != 200 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert main.agent.ready
+
+
+def test_poke_keeps_a_thread_per_caller(monkeypatch):
+    addresses = []
+
+    class EchoAgent:
+        async def chat(self, message, address=None):
+            addresses.append(address)
+            return SimpleNamespace(message=message)
+
+    monkeypatch.setattr(main, "agent", LazyAgent(EchoAgent))
+
+    with TestClient(main.app) as client:
+        client.post("/poke", json={"text": "hi", "address": "0xA"})
+        client.post("/poke", json={"text": "hi"})
+
+    assert addresses == ["0xA", "client:testclient"]
+
+
+@pytest.mark.parametrize("module", ["agent.src.api.delegation_api", "agent.src.api.chat_api"])
+def test_shutdown_closes_the_pooled_tally_session(module, monkeypatch):
+    app = importlib.import_module(module).app
+    monkeypatch.setattr(OrganizationCatalog, "start", lambda self: None)
+
+    with TestClient(app) as client:
+        session = client.portal.call(_current_session)
+        assert not session.is_closed
+
+    assert session.is_closed
+
+
+async def _current_session():
+    return get_session()
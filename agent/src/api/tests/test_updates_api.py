@@ -0,0 +1,178 @@
+# agent/src/api/tests/test_updates_api.py
+
+import asyncio
+import json
+import time
+import pytest
+from fastapi.testclient import TestClient
+from .. import delegation_api
+from ..delegation_api import app
+from ...ai.dao_updates import DaoUpdate
+from ...ai.update_feed import UpdateFeedStore, UpdateFeedWorker
+
+client = TestClient(app)
+
+
+def make_update(dao_slug: str, priority: str = 'important') -> DaoUpdate:
+    return DaoUpdate(
+        id=f"prop_{dao_slug}",
+        dao_slug=dao_slug,
+        dao_name=dao_slug.title(),
+        title=f"Proposal for {dao_slug}",
+        description="Summary",
+        priority=priority,
+        category='proposal',
+        timestamp="2025-01-01T00:00:00+00:00"
+    )
+
+
+class FakeUpdatesAgent:
+    """Stands in for DaoUpdatesAgent with a fixed delay per DAO."""
+
+    def __init__(self, delays):
+        self.delays = delays
+
+    async def get_dao_updates(self, dao_slug, user_holdings=None):
+        delay = self.delays[dao_slug]
+        if delay is None:
+            raise RuntimeError("Tally unavailable")
+        await asyncio.sleep(delay)
+        return [make_update(dao_slug, 'urgent' if dao_slug == 'gloom' else 'important')]
+
+
+@pytest.fixture(autouse=True)
+def feed_store(monkeypatch):
+    store = UpdateFeedStore()
+    monkeypatch.setattr(delegation_api, "get_feed_store", lambda: store)
+    return store
+
+
+@pytest.fixture
+def fake_agent(monkeypatch):
+    def install(delays, timeout=5.0):
+        monkeypatch.setattr(delegation_api, "get_updates_agent", lambda: FakeUpdatesAgent(delays))
+        monkeypatch.setattr(delegation_api, "UPDATES_DAO_TIMEOUT", timeout)
+    return install
+
+
+def test_updates_fan_out_across_daos(fake_agent):
+    slugs = ['gloom', 'seamless-protocol', 'internet-token-dao', 'aave']
+    fake_agent({slug: 0.2 for slug in slugs})
+
+    start = time.monotonic()
+    response = client.post("/api/updates", json={"dao_slugs": slugs})
+    elapsed = time.monotonic() - start
+
+    assert response.status_code == 200
+    data = response.json()
+    assert {update["dao_slug"] for update in data} == set(slugs)
+    # Runs in parallel rather than 4 x 0.2s back to back
+    assert elapsed < 0.6
+
+
+def test_slow_and_failing_daos_do_not_block_others(fake_agent):
+    fake_agent({'gloom': 0.01, 'slow-dao': 5.0, 'broken-dao': None}, timeout=0.2)
+
+    response = client.post("/api/updates", json={"dao_slugs": ['gloom', 'slow-dao', 'broken-dao']})
+
+    assert response.status_code == 200
+    assert [update["dao_slug"] for update in response.json()] == ['gloom']
+
+
+def test_precomputed_feeds_are_served_without_running_the_pipeline(fake_agent, feed_store, monkeypatch):
+    monkeypatch.setattr(delegation_api, "UPDATES_PRECOMPUTE_INTERVAL", 300)
+    fake_agent({'gloom': 0.01, 'aave': 0.01})
+    worker = UpdateFeedWorker(lambda: FakeUpdatesAgent({'gloom': 0.01}), feed_store)
+
+    feed_store.track(['gloom'])
+    assert asyncio.run(worker.refresh_once()) == {'gloom': 'ok'}
+    generated_at = worker.last_cycle['finished_at']
+
+    fake_agent({'gloom': None, 'aave': 0.01})
+    response = client.post("/api/updates", json={"dao_slugs": ['gloom', 'aave']})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [update["dao_slug"] for update in data] == ['aave', 'gloom']
+    gloom = next(update for update in data if update["dao_slug"] == 'gloom')
+    assert gloom["metadata"]["feed_generated_at"] <= generated_at
+    assert response.headers["X-Feed-Generated-At"] == gloom["metadata"]["feed_generated_at"]
+    # The live result for aave is stored too, and both DAOs are now followed
+    assert feed_store.get('aave', max_age=60) is not None
+    assert set(feed_store.followed(window=60)) == {'gloom', 'aave'}
+
+
+def test_stale_feeds_are_recomputed(fake_agent, feed_store, monkeypatch):
+    monkeypatch.setattr(delegation_api, "UPDATES_PRECOMPUTE_INTERVAL", 300)
+    feed_store.put('gloom', [make_update('gloom')], generated_at=time.time() - 3600)
+    fake_agent({'gloom': 0.01})
+
+    response = client.post("/api/updates", json={"dao_slugs": ['gloom']})
+
+    assert response.status_code == 200
+    assert feed_store.get('gloom', max_age=60) is not None
+
+
+def test_feeds_are_recomputed_when_the_worker_is_disabled(fake_agent, feed_store):
+    feed_store.put('gloom', [make_update('gloom')], generated_at=time.time() - 1)
+    fake_agent({'gloom': 0.01})
+
+    response = client.post("/api/updates", json={"dao_slugs": ['gloom']})
+
+    assert response.status_code == 200
+    # Nothing would refresh the stored feed, so the pipeline ran and replaced it
+    assert feed_store.get('gloom', max_age=0.5) is not None
+
+
+class UnavailableAgent:
+    async def get_dao_updates(self, dao_slug, user_holdings=None):
+        return None
+
+
+def test_failed_refresh_keeps_the_last_feed(fake_agent, feed_store, monkeypatch):
+    feed_store.put('gloom', [make_update('gloom')], generated_at=time.time() - 3600)
+    monkeypatch.setattr(delegation_api, "get_updates_agent", lambda: UnavailableAgent())
+
+    response = client.post("/api/updates", json={"dao_slugs": ['gloom']})
+
+    assert response.status_code == 200
+    assert [update["dao_slug"] for update in response.json()] == ['gloom']
+    # Still the old feed, so the next request retries the pipeline
+    assert feed_store.get('gloom', max_age=60) is None
+
+    worker = UpdateFeedWorker(lambda: UnavailableAgent(), feed_store)
+    assert asyncio.run(worker.refresh_once()) == {'gloom': 'error'}
+    assert feed_store.get('gloom', max_age=float('inf')) is not None
+
+
+class FakeStreamingAgent(FakeUpdatesAgent):
+    async def iter_dao_updates(self, dao_slug, user_holdings=None):
+        for update in await self.get_dao_updates(dao_slug, user_holdings):
+            yield update
+
+
+def test_stream_sends_updates_then_summary(monkeypatch):
+    monkeypatch.setattr(delegation_api, "get_updates_agent",
+                        lambda: FakeStreamingAgent({'gloom': 0.01, 'broken-dao': None}))
+
+    with client.stream("POST", "/api/updates/stream", json={"dao_slugs": ['gloom', 'broken-dao']}) as response:
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        frames = [json.loads(line) for line in response.iter_lines() if line]
+
+    assert [frame["type"] for frame in frames] == ["update", "summary"]
+    assert frames[0]["data"]["dao_slug"] == "gloom"
+    assert frames[1]["data"]["daos"] == {
+        "gloom": {"status": "ok", "updates": 1},
+        "broken-dao": {"status": "error", "updates": 0}
+    }
+
+
+def test_stream_as_server_sent_events(monkeypatch):
+    monkeypatch.setattr(delegation_api, "get_updates_agent", lambda: FakeStreamingAgent({'gloom': 0}))
+
+    response = client.post("/api/updates/stream", json={"dao_slugs": ['gloom']},
+                           headers={"Accept": "text/event-stream"})
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.startswith("event: update\ndata: {")
+    assert "event: summary\n" in response.text
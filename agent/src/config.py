@@ -0,0 +1,35 @@
+# agent/src/config.py
+
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Project root directory (where .env is located)
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+
+_configured = False
+
+
+def configure() -> None:
+    """Loads the project .env file and sets up logging, once per process.
+
+    Called by entry points (the API apps and scripts) rather than at library
+    import time, so importing a module has no side effects on the environment.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    from dotenv import load_dotenv
+
+    logging.basicConfig(level=logging.INFO)
+    env_path = ROOT_DIR / '.env'
+    load_dotenv(dotenv_path=env_path)
+    logger.info(f"Loading environment variables from: {env_path}")
+
+    # Log environment variable status (without exposing values)
+    for var in ['TALLY_API_KEY', 'OPENAI_API_KEY']:
+        logger.info(f"{var} is {'set' if os.getenv(var) else 'not set'}")
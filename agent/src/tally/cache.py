@@ -0,0 +1,189 @@
+# agent/src/tally/cache.py
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds a response stays fresh, keyed by GraphQL operation name
+DEFAULT_TTLS = {
+    'Organizations': 300.0,
+    'GetDAOData': 300.0,
+    'GetTreasuryInfo': 300.0,
+    'GetDelegates': 120.0,
+    'GetProposals': 60.0,
+    'GetDelegate': 60.0,
+    'GetDelegateBatch': 60.0,
+}
+
+FRESH = 'fresh'
+STALE = 'stale'
+MISS = 'miss'
+
+_OPERATION_RE = re.compile(r'\b(query|mutation|subscription)\s+(\w+)')
+
+
+def operation_name(query: str) -> str:
+    """Extracts the GraphQL operation name, e.g. 'Organizations'."""
+    match = _OPERATION_RE.search(query)
+    return match.group(2) if match else 'anonymous'
+
+
+def is_mutation(query: str) -> bool:
+    match = _OPERATION_RE.search(query)
+    return bool(match) and match.group(1) != 'query'
+
+
+def make_key(query: str, variables: Optional[dict]) -> str:
+    """Builds a cache key from a whitespace-normalized query and sorted variables."""
+    normalized_query = ' '.join(query.split())
+    return f"{normalized_query}|{json.dumps(variables or {}, sort_keys=True, separators=(',', ':'))}"
+
+
+class CacheEntry:
+    __slots__ = ('value', 'operation', 'fetched_at', 'expires_at')
+
+    def __init__(self, value: Any, operation: str, fetched_at: float, expires_at: float):
+        self.value = value
+        self.operation = operation
+        self.fetched_at = fetched_at
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    """Thread-safe in-process LRU cache for Tally GraphQL responses.
+
+    Entries expire after a per-operation TTL. With a non-zero
+    `stale_while_revalidate` window, expired entries are still served for that
+    many seconds while the caller refreshes them in the background.
+
+    Cached responses are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 0.0,
+                 max_entries: int = 512, stale_while_revalidate: float = 0.0):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def ttl_for(self, query: str) -> float:
+        if is_mutation(query):
+            return 0.0
+        return self.ttls.get(operation_name(query), self.default_ttl)
+
+    def is_cacheable(self, query: str) -> bool:
+        return self.max_entries > 0 and self.ttl_for(query) > 0
+
+    def get(self, key: str, now: Optional[float] = None) -> Tuple[str, Any]:
+        """Looks up a key, returning (FRESH|STALE|MISS, value)."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS, None
+
+            if now < entry.expires_at:
+                self._entries.move_to_end(key)
+                self._counters[entry.operation]['hits'] += 1
+                return FRESH, entry.value
+
+            if now < entry.expires_at + self.stale_while_revalidate:
+                self._entries.move_to_end(key)
+                self._counters[entry.operation]['stale_hits'] += 1
+                return STALE, entry.value
+
+            del self._entries[key]
+            return MISS, None
+
+    def record(self, query: str, counter: str) -> None:
+        """Bumps a named counter (e.g. 'misses', 'store_hits') for the query's operation."""
+        with self._lock:
+            self._counters[operation_name(query)][counter] += 1
+
+    def record_miss(self, query: str) -> None:
+        self.record(query, 'misses')
+
+    def set(self, key: str, query: str, value: Any, now: Optional[float] = None, age: float = 0.0) -> None:
+        """Stores a response; `age` backdates values loaded from the persistent store."""
+        ttl = self.ttl_for(query)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        now = time.monotonic() if now is None else now
+        fetched_at = now - age
+        operation = operation_name(query)
+        with self._lock:
+            self._entries[key] = CacheEntry(value, operation, fetched_at, fetched_at + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._counters[evicted.operation]['evictions'] += 1
+
+    def begin_refresh(self, key: str) -> bool:
+        """Claims the background refresh of a stale key; False if one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str, query: str, succeeded: bool) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+            self._counters[operation_name(query)]['refreshes' if succeeded else 'refresh_failures'] += 1
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drops one key, or every entry when no key is given."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns hit/miss counters overall and per GraphQL operation."""
+        with self._lock:
+            operations = {op: dict(counts) for op, counts in self._counters.items()}
+            size = len(self._entries)
+        totals: Dict[str, int] = defaultdict(int)
+        for counts in operations.values():
+            for name, value in counts.items():
+                totals[name] += value
+        served = totals['hits'] + totals['stale_hits'] + totals['store_hits']
+        lookups = served + totals['misses']
+        return {
+            'size': size,
+            'max_entries': self.max_entries,
+            'hit_rate': served / lookups if lookups else 0.0,
+            **totals,
+            'operations': operations,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Returns the process-wide cache shared by every TallyClient."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache(
+                max_entries=int(os.getenv('TALLY_CACHE_MAX_ENTRIES', '512')),
+                stale_while_revalidate=float(os.getenv('TALLY_CACHE_SWR_SECONDS', '600')),
+            )
+        return _default_cache
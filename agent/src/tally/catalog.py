@@ -0,0 +1,163 @@
+# agent/src/tally/catalog.py
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from .client import AsyncTallyClient
+from .session import run_sync
+from .singleflight import get_single_flight
+from .token_index import TokenIndex, normalize_chain_id, parse_token_id
+
+logger = logging.getLogger(__name__)
+
+BASE_CHAIN_ID = "eip155:8453"
+
+
+class _CatalogIndex:
+    """One immutable generation of the catalog; refreshes swap in a new one."""
+
+    def __init__(self, organizations: List[Dict[str, Any]], loaded_at: Optional[float]):
+        self.organizations = organizations
+        self.loaded_at = loaded_at
+        self.by_slug = {org['slug']: org for org in organizations if org.get('slug')}
+        self.by_id = {str(org['id']): org for org in organizations if org.get('id') is not None}
+        self.by_chain: Dict[str, List[Dict[str, Any]]] = {}
+        for org in organizations:
+            for chain_id in org.get('chainIds') or []:
+                self.by_chain.setdefault(normalize_chain_id(chain_id), []).append(org)
+        self.tokens = TokenIndex(organizations)
+
+
+class OrganizationCatalog:
+    """Process-wide index of Tally organizations, refreshed in the background.
+
+    Readers get plain in-memory lookups; only refreshes talk to Tally, and
+    concurrent refreshes are coalesced into one paginated fetch. A failed
+    refresh keeps serving the previous generation.
+    """
+
+    def __init__(self, client_factory: Optional[Callable[[], AsyncTallyClient]] = None,
+                 chain_id: str = BASE_CHAIN_ID, refresh_interval: float = 900.0):
+        """Initialize the catalog.
+
+        Args:
+            client_factory: Builds the Tally client used for refreshes, defaults to AsyncTallyClient
+            chain_id: Chain whose organizations are loaded
+            refresh_interval: Seconds between background refreshes
+        """
+        self.client_factory = client_factory or AsyncTallyClient
+        self.chain_id = chain_id
+        self.refresh_interval = refresh_interval
+        self._index = _CatalogIndex([], None)
+        self._counters = {'refreshes': 0, 'failures': 0}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._index.loaded_at is not None
+
+    @property
+    def loaded_at(self) -> Optional[float]:
+        """When the current generation was loaded; changes on every successful refresh."""
+        return self._index.loaded_at
+
+    async def refresh(self) -> bool:
+        """Reloads every organization on the chain; returns False if Tally could not be read."""
+        return await get_single_flight().do(f"catalog:{id(self)}", self._load, label='OrganizationCatalog')
+
+    async def _load(self) -> bool:
+        try:
+            client = self.client_factory()
+            organizations = [org async for org in client.iter_organizations(self.chain_id)]
+        except Exception as e:
+            logger.error(f"Error refreshing organization catalog: {str(e)}")
+            with self._lock:
+                self._counters['failures'] += 1
+            return False
+
+        index = _CatalogIndex(organizations, time.time())
+        with self._lock:
+            self._index = index
+            self._counters['refreshes'] += 1
+        logger.info(f"Organization catalog loaded {len(organizations)} DAOs on {self.chain_id}")
+        return True
+
+    async def ensure_loaded(self) -> bool:
+        """Loads the catalog on first use; returns whether any generation is available."""
+        if not self.loaded:
+            await self.refresh()
+        return self.loaded
+
+    def ensure_loaded_sync(self) -> bool:
+        """Blocking counterpart of ensure_loaded for synchronous callers."""
+        return self.loaded or run_sync(self.ensure_loaded())
+
+    def organizations(self) -> List[Dict[str, Any]]:
+        return list(self._index.organizations)
+
+    def get_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        return self._index.by_slug.get(slug)
+
+    def get_by_id(self, organization_id: Any) -> Optional[Dict[str, Any]]:
+        return self._index.by_id.get(str(organization_id))
+
+    def by_chain(self, chain_id: Any) -> List[Dict[str, Any]]:
+        return list(self._index.by_chain.get(normalize_chain_id(chain_id), []))
+
+    def by_token(self, chain_id: Any, token_address: str) -> List[Dict[str, Any]]:
+        """Organizations governed by a token, matched exactly on chain and checksummed address."""
+        return self._index.tokens.lookup(chain_id, token_address)
+
+    def by_token_id(self, token_id: str) -> List[Dict[str, Any]]:
+        """Organizations governed by a CAIP-19 token id."""
+        key = parse_token_id(token_id)
+        return self.by_token(*key) if key is not None else []
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            logger.info(f"Starting organization catalog refresh (every {self.refresh_interval}s)")
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        index = self._index
+        with self._lock:
+            counters = dict(self._counters)
+        return {
+            'organizations': len(index.organizations),
+            'tokens': len(index.tokens),
+            'age_seconds': round(time.time() - index.loaded_at, 1) if index.loaded_at else None,
+            **counters,
+        }
+
+
+_default_catalog: Optional[OrganizationCatalog] = None
+_default_catalog_lock = threading.Lock()
+
+
+def get_organization_catalog() -> OrganizationCatalog:
+    """Returns the process-wide organization catalog."""
+    global _default_catalog
+    with _default_catalog_lock:
+        if _default_catalog is None:
+            _default_catalog = OrganizationCatalog(
+                refresh_interval=float(os.getenv('TALLY_CATALOG_REFRESH_SECONDS', '900'))
+            )
+        return _default_catalog
@@ -1,197 +1,356 @@
 # agent/src/tally/client.py
 
-from typing import Dict, List, Any
-import requests
-import json
+from typing import Dict, List, Any, Optional, AsyncIterator, Iterator, Tuple
+import copy
+import httpx
 from dotenv import load_dotenv
 import os
 import logging
-import time
+import asyncio
+from .session import get_session, run_sync, submit
+from .cache import ResponseCache, get_response_cache, make_key, operation_name, is_mutation, FRESH, STALE
+from .store import ResponseStore, get_response_store
+from .rate_limit import RateLimiter, get_rate_limiter, parse_retry_after
+from .singleflight import SingleFlight, get_single_flight
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class TallyClient:
-    def __init__(self):
+TALLY_ENDPOINT = "https://api.tally.xyz/query"
+
+# Largest page Tally serves for list queries
+DEFAULT_PAGE_SIZE = 20
+
+# Strong references to stale-while-revalidate refreshes until they finish
+_background_tasks = set()
+
+# Known significant Base DAOs
+MAJOR_DAOS = {
+    'seamless-protocol': {
+        'slug': 'seamless-protocol',
+        'token_id': 'eip155:8453/erc20:0x1C7a460413dD4e964f96D8dFC56E7223cE88CD85'
+    },
+    'internet-token-dao': {
+        'slug': 'internet-token-dao',
+        'token_id': 'eip155:8453/erc20:0x968D6A288d7B024D5012c0B25d67A889E4E3eC19'
+    },
+    'gloom': {
+        'slug': 'gloom',
+        'token_id': 'eip155:8453/erc20:0xbb5D04c40Fa063FAF213c4E0B8086655164269Ef'
+    }
+}
+
+ORGANIZATIONS_QUERY = """
+query Organizations($input: OrganizationsInput) {
+    organizations(input: $input) {
+        nodes {
+            ... on Organization {
+                id
+                slug
+                name
+                chainIds
+                tokenIds
+                governorIds
+                metadata {
+                    description
+                    icon
+                }
+                hasActiveProposals
+                proposalsCount
+                delegatesCount
+                delegatesVotesCount
+                tokenOwnersCount
+            }
+        }
+        pageInfo {
+            firstCursor
+            lastCursor
+            count
+        }
+    }
+}
+"""
+
+DELEGATE_FIELDS = """
+        delegatorsCount
+        votesCount
+        account {
+            address
+            name
+            ens
+        }
+        governor {
+            name
+            tokenId
+            type
+        }
+        organization {
+            name
+            proposalsCount
+        }
+        token {
+            symbol
+            name
+            supply
+        }
+"""
+
+DELEGATE_QUERY = """
+query GetDelegate($input: DelegateInput!) {
+    delegate(input: $input) {""" + DELEGATE_FIELDS + """    }
+}
+"""
+
+# Organizations looked up per aliased GetDelegateBatch document
+DELEGATE_BATCH_SIZE = 10
+
+ORGANIZATION_QUERY = """
+query GetDAOData($input: OrganizationInput!) {
+    organization(input: $input) {
+        id
+        name
+        chainIds 
+        proposalsCount
+        delegatesCount
+        tokenOwnersCount
+        hasActiveProposals
+        governorIds
+        tokenIds
+        metadata {
+            description
+            icon
+            color
+        }
+    }
+}
+"""
+
+PROPOSALS_QUERY = """
+query GetProposals($input: ProposalsInput!) {
+    proposals(input: $input) {
+        nodes {
+            ... on Proposal {
+                id
+                metadata {
+                    title
+                    description
+                }
+                status
+                start {
+                    ... on Block { timestamp }
+                    ... on BlocklessTimestamp { timestamp }
+                }
+                end {
+                    ... on Block { timestamp }
+                    ... on BlocklessTimestamp { timestamp }
+                }
+                voteStats {
+                    type
+                    votesCount
+                    votersCount
+                    percent
+                }
+            }
+        }
+        pageInfo {
+            firstCursor
+            lastCursor
+            count
+        }
+    }
+}
+"""
+
+DELEGATES_QUERY = """
+query GetDelegates($input: DelegatesInput!) {
+    delegates(input: $input) {
+        nodes {
+            ... on Delegate {
+                id
+                account {
+                    address
+                    name
+                    ens
+                }
+                votesCount
+                delegatorsCount
+                statement {
+                    statement
+                    isSeekingDelegation
+                }
+            }
+        }
+        pageInfo {
+            firstCursor
+            lastCursor
+            count
+        }
+    }
+}
+"""
+
+TREASURY_QUERY = """
+query GetTreasuryInfo($input: OrganizationInput!) {
+    organization(input: $input) {
+        id
+        name
+        tokenIds
+        tokenOwnersCount
+        delegatesVotesCount
+        metadata {
+            description
+        }
+        governors {
+            nodes {
+                ... on Governor {
+                    id
+                    type
+                    quorum
+                    token {
+                        id
+                        name
+                        symbol
+                        supply
+                        decimals
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+
+class AsyncTallyClient:
+    """Asyncio-native Tally client backed by the process-wide pooled HTTP session."""
+
+    def __init__(self, api_key: Optional[str] = None, session: Optional[httpx.AsyncClient] = None,
+                 cache: Optional[ResponseCache] = None, store: Optional[ResponseStore] = None,
+                 rate_limiter: Optional[RateLimiter] = None, single_flight: Optional[SingleFlight] = None):
+        """Initialize the client.
+
+        Args:
+            api_key: Tally API key, defaults to TALLY_API_KEY from the environment
+            session: Optional pre-configured httpx session for testing
+            cache: Optional response cache, defaults to the process-wide one
+            store: Optional persistent store, defaults to the one at TALLY_STORE_PATH if set
+            rate_limiter: Optional token bucket, defaults to the process-wide one
+            single_flight: Optional request coalescer, defaults to the process-wide one
+        """
         # Load environment variables
         load_dotenv()
-        self.api_key = os.getenv('TALLY_API_KEY')
+        self.api_key = api_key or os.getenv('TALLY_API_KEY')
         if not self.api_key:
             raise ValueError("TALLY_API_KEY not found in environment variables")
-            
+
         logger.info(f"Initialized TallyClient with API key: {self.api_key[:6]}...")
-        
-        self.endpoint = "https://api.tally.xyz/query"
+
+        self.endpoint = TALLY_ENDPOINT
         self.headers = {
             'Api-Key': self.api_key,
             'Content-Type': 'application/json',
         }
-        
-        # Known significant Base DAOs
-        self.major_daos = {
-            'seamless-protocol': {
-                'slug': 'seamless-protocol',
-                'token_id': 'eip155:8453/erc20:0x1C7a460413dD4e964f96D8dFC56E7223cE88CD85'
-            },
-            'internet-token-dao': {
-                'slug': 'internet-token-dao',
-                'token_id': 'eip155:8453/erc20:0x968D6A288d7B024D5012c0B25d67A889E4E3eC19'
-            },
-            'gloom': {
-                'slug': 'gloom',
-                'token_id': 'eip155:8453/erc20:0xbb5D04c40Fa063FAF213c4E0B8086655164269Ef'
-            }
-        }
+        self.major_daos = MAJOR_DAOS
+        self.cache = cache if cache is not None else get_response_cache()
+        self.store = store if store is not None else get_response_store()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_rate_limiter()
+        self.single_flight = single_flight if single_flight is not None else get_single_flight()
+        self._session = session
 
-    def get_organizations(self) -> Dict[str, Any]:
+    async def get_organizations(self) -> Dict[str, Any]:
         """Gets list of Base organizations."""
         logger.info("Fetching Base DAOs...")
-        
-        query = """
-        query Organizations($input: OrganizationsInput) {
-            organizations(input: $input) {
-                nodes {
-                    ... on Organization {
-                        id
-                        slug
-                        name
-                        chainIds
-                        tokenIds
-                        governorIds
-                        metadata {
-                            description
-                            icon
-                        }
-                        hasActiveProposals
-                        proposalsCount
-                        delegatesCount
-                        delegatesVotesCount
-                        tokenOwnersCount
-                    }
-                }
-            }
-        }
-        """
-        
+
         # Get Base mainnet DAOs
-        result = self._execute_query(query, {
+        result = await self._execute_query(ORGANIZATIONS_QUERY, {
             "input": {
                 "filters": {
                     "chainId": "eip155:8453"  # Base mainnet
                 }
             }
         })
-        
+
         if not result or 'data' not in result:
             logger.error("Failed to fetch Base DAOs")
             return {"data": {"organizations": {"nodes": []}}}
-        
-        # Add token IDs for major DAOs if missing
-        for node in result['data']['organizations']['nodes']:
-            if node.get('slug') in self.major_daos:
-                if not node.get('tokenIds'):
-                    node['tokenIds'] = [self.major_daos[node['slug']]['token_id']]
-        
+
         logger.info(f"Found {len(result['data']['organizations']['nodes'])} Base DAOs")
         return result
 
-    def get_delegate_info(self, address: str, organization_id: str) -> Dict[str, Any]:
+    def _backfill_token_ids(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """Add token IDs for major DAOs if missing."""
+        if node.get('slug') in self.major_daos:
+            if not node.get('tokenIds'):
+                node['tokenIds'] = [self.major_daos[node['slug']]['token_id']]
+        return node
+
+    def _prepare(self, query: str, result: dict) -> dict:
+        """Completes a freshly loaded response before it is cached and shared read-only."""
+        if operation_name(query) == operation_name(ORGANIZATIONS_QUERY):
+            for node in ((result.get('data') or {}).get('organizations') or {}).get('nodes') or []:
+                self._backfill_token_ids(node)
+        return result
+
+    async def get_delegate_info(self, address: str, organization_id: str) -> Dict[str, Any]:
         """Gets delegation information for an address in a DAO."""
-        query = """
-        query GetDelegate($input: DelegateInput!) {
-            delegate(input: $input) {
-                delegatorsCount
-                votesCount
-                account {
-                    address
-                    name
-                    ens
-                }
-                governor {
-                    name
-                    tokenId
-                    type
-                }
-                organization {
-                    name
-                    proposalsCount
-                }
-                token {
-                    symbol
-                    name
-                    supply
-                }
-            }
-        }
-        """
-        
         variables = {
             "input": {
                 "address": address,
                 "organizationId": organization_id
             }
         }
-        
-        result = self._execute_query(query, variables)
+
+        result = await self._execute_query(DELEGATE_QUERY, variables)
         if result and 'data' in result and 'delegate' in result['data']:
             return result['data']['delegate']
         return None
 
-    def get_organization(self, organization_id: str) -> Dict[str, Any]:
-        """Gets comprehensive DAO information."""
-        query = """
-        query GetDAOData($input: OrganizationInput!) {
-            organization(input: $input) {
-                id
-                name
-                chainIds 
-                proposalsCount
-                delegatesCount
-                tokenOwnersCount
-                hasActiveProposals
-                governorIds
-                tokenIds
-                metadata {
-                    description
-                    icon
-                    color
-                }
-            }
-        }
+    async def get_delegate_info_many(self, address: str, organization_ids: List[Any],
+                                     batch_size: int = DELEGATE_BATCH_SIZE) -> Dict[Any, Optional[Dict[str, Any]]]:
+        """Gets delegation information for an address across many DAOs.
+
+        Lookups are packed into aliased GraphQL documents of at most
+        `batch_size` organizations each, and the documents run concurrently.
+
+        Returns:
+            Dict mapping each organization ID to its delegate info, or None
+            where the address is not a delegate or the lookup failed
         """
-        
+        chunks = [organization_ids[i:i + batch_size] for i in range(0, len(organization_ids), batch_size)]
+        results = await asyncio.gather(*(self._get_delegate_batch(address, chunk) for chunk in chunks))
+
+        delegates: Dict[Any, Optional[Dict[str, Any]]] = {}
+        for chunk_result in results:
+            delegates.update(chunk_result)
+        return delegates
+
+    async def _get_delegate_batch(self, address: str, organization_ids: List[Any]) -> Dict[Any, Optional[Dict[str, Any]]]:
+        """Looks up one chunk of organizations with a single aliased query."""
+        arguments = ", ".join(f"$input{i}: DelegateInput!" for i in range(len(organization_ids)))
+        selections = "".join(
+            f"    d{i}: delegate(input: $input{i}) {{{DELEGATE_FIELDS}    }}\n" for i in range(len(organization_ids))
+        )
+        query = f"query GetDelegateBatch({arguments}) {{\n{selections}}}\n"
+        variables = {
+            f"input{i}": {"address": address, "organizationId": org_id}
+            for i, org_id in enumerate(organization_ids)
+        }
+
+        # Unknown delegates come back as per-alias errors next to the found ones
+        result = await self._execute_query(query, variables, allow_partial=True)
+        data = (result or {}).get('data') or {}
+        return {org_id: data.get(f"d{i}") for i, org_id in enumerate(organization_ids)}
+
+    async def get_organization(self, organization_id: str) -> Dict[str, Any]:
+        """Gets comprehensive DAO information."""
         variables = {
             "input": {
                 "slug": organization_id
             }
         }
-        return self._execute_query(query, variables)
+        return await self._execute_query(ORGANIZATION_QUERY, variables)
 
-    def get_proposals(self, organization_id: str, include_active: bool = True) -> Dict[str, Any]:
+    async def get_proposals(self, organization_id: str, include_active: bool = True) -> Dict[str, Any]:
         """Gets all or active proposals for a DAO."""
-        query = """
-        query GetProposals($input: ProposalsInput!) {
-            proposals(input: $input) {
-                nodes {
-                    ... on Proposal {
-                        id
-                        metadata {
-                            title
-                            description
-                        }
-                        status
-                        voteStats {
-                            type
-                            votesCount
-                            votersCount
-                            percent
-                        }
-                    }
-                }
-            }
-        }
-        """
-        
         variables = {
             "input": {
                 "filters": {
@@ -199,66 +358,14 @@ class TallyClient:
                 }
             }
         }
-        
+
         if include_active:
             variables["input"]["filters"]["status"] = "active"
-            
-        return self._execute_query(query, variables)
-
-    def _execute_query(self, query: str, variables: dict, retries: int = 5, delay: float = 2.0) -> dict:
-        """Helper function to execute GraphQL queries with rate limit handling."""
-        for attempt in range(retries):
-            try:
-                response = requests.post(
-                    self.endpoint,
-                    json={'query': query, 'variables': variables},
-                    headers=self.headers,
-                    timeout=10
-                )
-
-                if response.status_code == 429:  # Rate limit exceeded
-                    wait_time = delay * (2 ** attempt)  # Exponential backoff
-                    logging.warning(f"Rate limit hit. Retrying in {wait_time:.2f} seconds...")
-                    time.sleep(wait_time)
-                    continue
-
-                data = response.json()
-                if 'errors' in data:
-                    logging.error(f"GraphQL Errors: {data['errors']}")
-                    return None
-                return data
 
-            except requests.exceptions.RequestException as e:
-                logging.error(f"Request error: {str(e)}")
-                return None
+        return await self._execute_query(PROPOSALS_QUERY, variables)
 
-        logging.error("Max retries reached. Failed to fetch data.")
-        return None
-    def get_delegates(self, organization_id: str) -> Dict[str, Any]:
+    async def get_delegates(self, organization_id: str) -> Dict[str, Any]:
         """Gets all delegates for a DAO."""
-        query = """
-        query GetDelegates($input: DelegatesInput!) {
-            delegates(input: $input) {
-                nodes {
-                    ... on Delegate {
-                        id
-                        account {
-                            address
-                            name
-                            ens
-                        }
-                        votesCount
-                        delegatorsCount
-                        statement {
-                            statement
-                            isSeekingDelegation
-                        }
-                    }
-                }
-            }
-        }
-        """
-        
         variables = {
             "input": {
                 "filters": {
@@ -266,76 +373,296 @@ class TallyClient:
                 }
             }
         }
-        
-        return self._execute_query(query, variables)
 
-    def get_treasury_info(self, organization_id: str) -> Dict[str, Any]:
+        return await self._execute_query(DELEGATES_QUERY, variables)
+
+    async def get_treasury_info(self, organization_id: str) -> Dict[str, Any]:
         """Gets treasury information for a DAO."""
-        query = """
-        query GetTreasuryInfo($input: OrganizationInput!) {
-            organization(input: $input) {
-                id
-                name
-                tokenIds
-                tokenOwnersCount
-                delegatesVotesCount
-                metadata {
-                    description
-                }
-                governors {
-                    nodes {
-                        ... on Governor {
-                            id
-                            type
-                            quorum
-                            token {
-                                id
-                                name
-                                symbol
-                                supply
-                                decimals
-                            }
-                        }
-                    }
-                }
-            }
-        }
-        """
-        
         variables = {
             "input": {
                 "id": organization_id
             }
         }
-        
-        return self._execute_query(query, variables)
 
-    def _execute_query(self, query: str, variables: dict, retries: int = 5, delay: float = 2.0) -> dict:
-        """Helper function to execute GraphQL queries with rate limit handling."""
+        return await self._execute_query(TREASURY_QUERY, variables)
+
+    async def iter_organizations(self, chain_id: str = "eip155:8453",
+                                 page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[Dict[str, Any]]:
+        """Streams every organization on a chain, following pageInfo cursors."""
+        variables = {"input": {"filters": {"chainId": chain_id}}}
+        async for node in self._paginate(ORGANIZATIONS_QUERY, variables, 'organizations', page_size):
+            yield node
+
+    async def iter_proposals(self, organization_id: str, include_active: bool = True,
+                             page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[Dict[str, Any]]:
+        """Streams every (or every active) proposal for a DAO, following pageInfo cursors."""
+        variables = {"input": {"filters": {"organizationId": organization_id}}}
+        if include_active:
+            variables["input"]["filters"]["status"] = "active"
+        async for node in self._paginate(PROPOSALS_QUERY, variables, 'proposals', page_size):
+            yield node
+
+    async def iter_delegates(self, organization_id: str,
+                             page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[Dict[str, Any]]:
+        """Streams every delegate for a DAO, following pageInfo cursors."""
+        variables = {"input": {"filters": {"organizationId": organization_id}}}
+        async for node in self._paginate(DELEGATES_QUERY, variables, 'delegates', page_size):
+            yield node
+
+    async def _fetch_page(self, query: str, variables: dict, field: str, page_size: int,
+                          cursor: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetches one page of a list query.
+
+        Returns the page's nodes and the cursor of the next page, or None when
+        this was the last one. Raises RuntimeError when the page cannot be
+        fetched so that callers never mistake a failure for the end of the list.
+        """
+        page_variables = copy.deepcopy(variables)
+        page_variables["input"]["page"] = {"limit": page_size}
+        if cursor:
+            page_variables["input"]["page"]["afterCursor"] = cursor
+
+        result = await self._execute_query(query, page_variables)
+        if not result or 'data' not in result or not result['data'].get(field):
+            raise RuntimeError(f"Failed to fetch {field} page after cursor {cursor!r}")
+
+        connection = result['data'][field]
+        nodes = connection.get('nodes') or []
+        next_cursor = (connection.get('pageInfo') or {}).get('lastCursor')
+        if len(nodes) < page_size:
+            next_cursor = None
+        return nodes, next_cursor
+
+    async def _paginate(self, query: str, variables: dict, field: str,
+                        page_size: int) -> AsyncIterator[Dict[str, Any]]:
+        """Yields nodes page by page while the next page is prefetched.
+
+        At most the current page and the one being prefetched are held in memory.
+        """
+        nodes, cursor = await self._fetch_page(query, variables, field, page_size, None)
+        while nodes:
+            next_page = None
+            if cursor:
+                next_page = asyncio.ensure_future(self._fetch_page(query, variables, field, page_size, cursor))
+            try:
+                for node in nodes:
+                    yield node
+            except BaseException:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+            if next_page is None:
+                return
+            nodes, cursor = await next_page
+
+    async def _execute_query(self, query: str, variables: dict, retries: int = 5, delay: float = 2.0,
+                             allow_partial: bool = False) -> dict:
+        """Executes a GraphQL query, serving it from the response cache when possible.
+
+        Stale entries inside the stale-while-revalidate window are returned
+        immediately and refreshed in the background. On an in-memory miss the
+        persistent store is consulted before Tally, and its last known response
+        is served as a fallback when Tally cannot be reached. With
+        `allow_partial`, responses carrying both data and errors are kept.
+        """
+        key = make_key(query, variables)
+        if not self.cache.is_cacheable(query):
+            return await self._load(key, query, variables, retries, delay, allow_partial, remember=False)
+
+        state, value = self.cache.get(key)
+        if state == FRESH:
+            return value
+        if state == STALE:
+            self._schedule_refresh(key, query, variables, allow_partial)
+            return value
+
+        stored = self.store.get(key) if self.store is not None else None
+        if stored is not None:
+            value, age = stored
+            ttl = self.cache.ttl_for(query)
+            if age < ttl + self.cache.stale_while_revalidate:
+                self.cache.record(query, 'store_hits')
+                value = self._prepare(query, value)
+                self.cache.set(key, query, value, age=age)
+                if age >= ttl:
+                    self._schedule_refresh(key, query, variables, allow_partial)
+                return value
+
+        self.cache.record_miss(query)
+        result = await self._load(key, query, variables, retries, delay, allow_partial)
+        if result is None and stored is not None and stored[1] <= self.store.max_stale:
+            logger.warning(f"Serving {operation_name(query)} from store ({stored[1]:.0f}s old) after failed fetch")
+            self.cache.record(query, 'fallbacks')
+            return self._prepare(query, stored[0])
+        return result
+
+    async def _load(self, key: str, query: str, variables: dict, retries: int = 5, delay: float = 2.0,
+                    allow_partial: bool = False, remember: bool = True) -> dict:
+        """Fetches a response from Tally and records it in the cache and store.
+
+        Concurrent identical queries share one upstream request and one parsed
+        result, whether or not the response is cacheable. Mutations always run.
+        """
+        async def load() -> dict:
+            result = await self._fetch(query, variables, retries, delay, allow_partial)
+            if result is not None:
+                result = self._prepare(query, result)
+                if remember:
+                    self._remember(key, query, result)
+            return result
+
+        if is_mutation(query):
+            return await load()
+        return await self.single_flight.do(f"{allow_partial}|{key}", load, label=operation_name(query))
+
+    def _remember(self, key: str, query: str, result: dict) -> None:
+        self.cache.set(key, query, result)
+        if self.store is not None:
+            self.store.put(key, operation_name(query), result)
+
+    def _schedule_refresh(self, key: str, query: str, variables: dict, allow_partial: bool = False) -> None:
+        if self.cache.begin_refresh(key):
+            task = asyncio.ensure_future(self._refresh(key, query, variables, allow_partial))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+
+    async def _refresh(self, key: str, query: str, variables: dict, allow_partial: bool = False) -> None:
+        """Re-fetches a stale cache entry in the background."""
+        result = None
+        try:
+            result = await self._load(key, query, variables, allow_partial=allow_partial)
+        finally:
+            self.cache.end_refresh(key, query, result is not None)
+
+    async def _fetch(self, query: str, variables: dict, retries: int = 5, delay: float = 2.0,
+                     allow_partial: bool = False) -> dict:
+        """Helper function to execute GraphQL queries with rate limit handling.
+
+        Every attempt waits for a token from the shared limiter. A 429 pauses
+        the limiter for the server's Retry-After (or an exponential backoff
+        when absent), so concurrent callers back off together.
+        """
+        session = self._session or get_session()
         for attempt in range(retries):
             try:
-                response = requests.post(
+                await self.rate_limiter.acquire()
+                response = await session.post(
                     self.endpoint,
                     json={'query': query, 'variables': variables},
                     headers=self.headers,
-                    timeout=10
                 )
+                self.rate_limiter.observe(response.headers)
 
                 if response.status_code == 429:  # Rate limit exceeded
-                    wait_time = delay * (2 ** attempt)  # Exponential backoff
-                    logging.warning(f"Rate limit hit. Retrying in {wait_time:.2f} seconds...")
-                    time.sleep(wait_time)
+                    wait_time = parse_retry_after(response.headers.get('retry-after'))
+                    if wait_time is None:
+                        wait_time = delay * (2 ** attempt)  # Exponential backoff
+                    logger.warning(f"Rate limit hit. Retrying in {wait_time:.2f} seconds...")
+                    self.rate_limiter.throttle(wait_time)
                     continue
 
                 data = response.json()
                 if 'errors' in data:
-                    logging.error(f"GraphQL Errors: {data['errors']}")
+                    if allow_partial and data.get('data'):
+                        logger.warning(f"GraphQL partial errors: {data['errors']}")
+                        return data
+                    logger.error(f"GraphQL Errors: {data['errors']}")
                     return None
                 return data
 
-            except requests.exceptions.RequestException as e:
-                logging.error(f"Request error: {str(e)}")
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"Request error: {str(e)}")
                 return None
 
-        logging.error("Max retries reached. Failed to fetch data.")
-        return None
\ No newline at end of file
+        logger.error("Max retries reached. Failed to fetch data.")
+        return None
+
+
+class TallyClient:
+    """Blocking facade over AsyncTallyClient for synchronous callers.
+
+    Every method is a thin wrapper that runs the async implementation on the
+    shared session loop, so all Tally traffic goes through one connection pool.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, session: Optional[httpx.AsyncClient] = None,
+                 cache: Optional[ResponseCache] = None, store: Optional[ResponseStore] = None,
+                 rate_limiter: Optional[RateLimiter] = None, single_flight: Optional[SingleFlight] = None):
+        self.aio = AsyncTallyClient(api_key=api_key, session=session, cache=cache, store=store,
+                                    rate_limiter=rate_limiter, single_flight=single_flight)
+        self.api_key = self.aio.api_key
+        self.endpoint = self.aio.endpoint
+        self.headers = self.aio.headers
+        self.major_daos = self.aio.major_daos
+        self.cache = self.aio.cache
+        self.store = self.aio.store
+        self.rate_limiter = self.aio.rate_limiter
+        self.single_flight = self.aio.single_flight
+
+    def get_organizations(self) -> Dict[str, Any]:
+        """Gets list of Base organizations."""
+        return run_sync(self.aio.get_organizations())
+
+    def get_delegate_info(self, address: str, organization_id: str) -> Dict[str, Any]:
+        """Gets delegation information for an address in a DAO."""
+        return run_sync(self.aio.get_delegate_info(address, organization_id))
+
+    def get_delegate_info_many(self, address: str, organization_ids: List[Any],
+                               batch_size: int = DELEGATE_BATCH_SIZE) -> Dict[Any, Optional[Dict[str, Any]]]:
+        """Gets delegation information for an address across many DAOs."""
+        return run_sync(self.aio.get_delegate_info_many(address, organization_ids, batch_size))
+
+    def get_organization(self, organization_id: str) -> Dict[str, Any]:
+        """Gets comprehensive DAO information."""
+        return run_sync(self.aio.get_organization(organization_id))
+
+    def get_proposals(self, organization_id: str, include_active: bool = True) -> Dict[str, Any]:
+        """Gets all or active proposals for a DAO."""
+        return run_sync(self.aio.get_proposals(organization_id, include_active))
+
+    def get_delegates(self, organization_id: str) -> Dict[str, Any]:
+        """Gets all delegates for a DAO."""
+        return run_sync(self.aio.get_delegates(organization_id))
+
+    def get_treasury_info(self, organization_id: str) -> Dict[str, Any]:
+        """Gets treasury information for a DAO."""
+        return run_sync(self.aio.get_treasury_info(organization_id))
+
+    def iter_organizations(self, chain_id: str = "eip155:8453",
+                           page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """Streams every organization on a chain, following pageInfo cursors."""
+        variables = {"input": {"filters": {"chainId": chain_id}}}
+        yield from self._paginate(ORGANIZATIONS_QUERY, variables, 'organizations', page_size)
+
+    def iter_proposals(self, organization_id: str, include_active: bool = True,
+                       page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """Streams every (or every active) proposal for a DAO, following pageInfo cursors."""
+        variables = {"input": {"filters": {"organizationId": organization_id}}}
+        if include_active:
+            variables["input"]["filters"]["status"] = "active"
+        return self._paginate(PROPOSALS_QUERY, variables, 'proposals', page_size)
+
+    def iter_delegates(self, organization_id: str,
+                       page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """Streams every delegate for a DAO, following pageInfo cursors."""
+        variables = {"input": {"filters": {"organizationId": organization_id}}}
+        return self._paginate(DELEGATES_QUERY, variables, 'delegates', page_size)
+
+    def _paginate(self, query: str, variables: dict, field: str, page_size: int) -> Iterator[Dict[str, Any]]:
+        """Blocking counterpart of AsyncTallyClient._paginate with the same prefetching."""
+        nodes, cursor = run_sync(self.aio._fetch_page(query, variables, field, page_size, None))
+        while nodes:
+            next_page = submit(self.aio._fetch_page(query, variables, field, page_size, cursor)) if cursor else None
+            try:
+                yield from nodes
+            except BaseException:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+            if next_page is None:
+                return
+            nodes, cursor = next_page.result()
+
+    def _execute_query(self, query: str, variables: dict, retries: int = 5, delay: float = 2.0) -> dict:
+        """Helper function to execute GraphQL queries with rate limit handling."""
+        return run_sync(self.aio._execute_query(query, variables, retries, delay))
@@ -0,0 +1,27 @@
+# agent/src/tally/conftest.py
+
+import httpx
+import pytest
+from agent.src.tally.cache import ResponseCache
+from agent.src.tally.client import AsyncTallyClient
+from agent.src.tally.rate_limit import RateLimiter
+
+
+@pytest.fixture
+def tally_client():
+    """Builds Tally clients whose requests are answered by a handler instead of the network.
+
+    Rate limiting and caching are off unless a rate_limiter or cache is passed.
+
+    Args:
+        handler: httpx.MockTransport handler, sync or async
+        client_class: AsyncTallyClient (default) or TallyClient
+        **kwargs: any other client argument, e.g. cache, store, single_flight or session
+    """
+    def build(handler=None, client_class=AsyncTallyClient, **kwargs):
+        kwargs.setdefault("rate_limiter", RateLimiter(rate=0))
+        kwargs.setdefault("cache", ResponseCache(max_entries=0))
+        if "session" not in kwargs:
+            kwargs["session"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client_class(api_key="test-key", **kwargs)
+    return build
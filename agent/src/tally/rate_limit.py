@@ -0,0 +1,156 @@
+# agent/src/tally/rate_limit.py
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """Non-blocking token bucket shared by all Tally traffic in the process.
+
+    Callers reserve a token and `await` until it is theirs, so waiting never
+    blocks a thread. A 429 or an exhausted budget header pauses the whole
+    bucket until the server says it is safe, instead of letting every caller
+    retry on its own schedule. The bucket is safe to share between event loops.
+    """
+
+    def __init__(self, rate: float = 1.0, capacity: float = 5.0, jitter: float = 0.25):
+        """Initialize the limiter.
+
+        Args:
+            rate: Requests per second the bucket refills at; 0 disables limiting
+            capacity: Largest burst allowed after an idle period
+            jitter: Upper bound in seconds of random delay added to each wait
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.jitter = jitter
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._remaining: Optional[int] = None
+        self._lock = threading.Lock()
+        self._counters = {'acquired': 0, 'waited': 0, 'throttled': 0}
+        self._wait_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Waits until this caller may send one request."""
+        if self.rate <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            ready_at = now + (-self._tokens / self.rate if self._tokens < 0 else 0.0)
+            self._counters['acquired'] += 1
+
+        waited = False
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = max(ready_at, self._blocked_until) - now
+            if wait <= 0:
+                break
+            waited = True
+            wait += random.uniform(0, self.jitter)
+            with self._lock:
+                self._wait_seconds += wait
+            await asyncio.sleep(wait)
+
+        if waited:
+            with self._lock:
+                self._counters['waited'] += 1
+
+    def throttle(self, seconds: float) -> None:
+        """Pauses every caller for `seconds`, e.g. after a 429."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._tokens = min(self._tokens, 0.0)
+            self._counters['throttled'] += 1
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Tracks the remaining budget advertised by rate-limit response headers."""
+        remaining = headers.get('x-ratelimit-remaining') or headers.get('ratelimit-remaining')
+        if remaining is None:
+            return
+        try:
+            remaining_count = int(float(remaining))
+        except ValueError:
+            return
+        with self._lock:
+            self._remaining = remaining_count
+
+        if remaining_count <= 0:
+            reset = headers.get('x-ratelimit-reset') or headers.get('ratelimit-reset')
+            try:
+                reset_seconds = float(reset) if reset is not None else 1.0
+            except ValueError:
+                reset_seconds = 1.0
+            # Some servers send an epoch timestamp rather than a delta
+            if reset_seconds > 1e9:
+                reset_seconds = max(0.0, reset_seconds - time.time())
+            logger.warning(f"Tally rate budget exhausted, pausing for {reset_seconds:.1f}s")
+            self.throttle(reset_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the current budget and how often callers had to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                'rate': self.rate,
+                'capacity': self.capacity,
+                'tokens': round(self._tokens, 3),
+                'remaining_budget': self._remaining,
+                'blocked_for': round(max(0.0, self._blocked_until - now), 3),
+                'wait_seconds': round(self._wait_seconds, 3),
+                **self._counters,
+            }
+
+
+_default_limiter: Optional[RateLimiter] = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Returns the process-wide limiter shared by every TallyClient."""
+    global _default_limiter
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter(
+                rate=float(os.getenv('TALLY_RATE_LIMIT_PER_SEC', '1')),
+                capacity=float(os.getenv('TALLY_RATE_LIMIT_BURST', '5')),
+            )
+        return _default_limiter
@@ -0,0 +1,126 @@
+# agent/src/tally/session.py
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Coroutine, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Pool settings shared by every Tally session in the process: setting -> (environment variable, type, default)
+_ENV_SETTINGS: Dict[str, Any] = {
+    'max_connections': ('TALLY_MAX_CONNECTIONS', int, 20),
+    'max_keepalive_connections': ('TALLY_MAX_KEEPALIVE', int, 10),
+    'keepalive_expiry': ('TALLY_KEEPALIVE_EXPIRY', float, 30.0),
+    'timeout': ('TALLY_TIMEOUT', float, 10.0),
+}
+# configure_session() overrides, applied on top of the environment
+_overrides: Dict[str, Any] = {}
+
+# One AsyncClient per event loop: httpx connections cannot be shared across loops
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_sessions_lock = threading.Lock()
+
+# Background loop that sync callers use to reach the pooled async session
+_bridge_loop: Optional[asyncio.AbstractEventLoop] = None
+_bridge_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    """Checks whether httpx can negotiate HTTP/2 (requires the h2 package)."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def configure_session(**settings: Any) -> None:
+    """Overrides pool settings for sessions created after this call.
+
+    Accepts max_connections, max_keepalive_connections, keepalive_expiry,
+    timeout and http2.
+    """
+    unknown = set(settings) - set(_ENV_SETTINGS) - {'http2'}
+    if unknown:
+        raise ValueError(f"Unknown session settings: {sorted(unknown)}")
+    _overrides.update(settings)
+
+
+def _session_settings() -> Dict[str, Any]:
+    """Pool settings read from the environment when a session is created, so values
+    loaded from .env after this module was imported still apply."""
+    settings: Dict[str, Any] = {
+        name: cast(os.getenv(variable, default)) for name, (variable, cast, default) in _ENV_SETTINGS.items()
+    }
+    settings['http2'] = None  # None means "use HTTP/2 if the h2 package is installed"
+    settings.update(_overrides)
+    return settings
+
+
+def _create_session() -> httpx.AsyncClient:
+    settings = _session_settings()
+    http2 = settings['http2']
+    if http2 is None:
+        http2 = _http2_available()
+
+    limits = httpx.Limits(
+        max_connections=settings['max_connections'],
+        max_keepalive_connections=settings['max_keepalive_connections'],
+        keepalive_expiry=settings['keepalive_expiry'],
+    )
+    logger.info(
+        f"Creating Tally HTTP session (pool={settings['max_connections']}, "
+        f"keepalive={settings['max_keepalive_connections']}, http2={http2})"
+    )
+    return httpx.AsyncClient(limits=limits, timeout=settings['timeout'], http2=http2)
+
+
+def get_session() -> httpx.AsyncClient:
+    """Returns the pooled keep-alive session for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _sessions_lock:
+        session = _sessions.get(loop)
+        if session is None or session.is_closed:
+            session = _create_session()
+            _sessions[loop] = session
+        return session
+
+
+async def aclose_session() -> None:
+    """Closes the running loop's session, e.g. from a FastAPI shutdown hook."""
+    loop = asyncio.get_running_loop()
+    with _sessions_lock:
+        session = _sessions.pop(loop, None)
+    if session is not None:
+        await session.aclose()
+
+
+def _get_bridge_loop() -> asyncio.AbstractEventLoop:
+    global _bridge_loop
+    with _bridge_lock:
+        if _bridge_loop is None or _bridge_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="tally-session", daemon=True)
+            thread.start()
+            _bridge_loop = loop
+        return _bridge_loop
+
+
+def submit(coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+    """Schedules a coroutine on the shared background loop without waiting."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_bridge_loop())
+
+
+def run_sync(coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+    """Runs a coroutine on the shared background loop and blocks for its result.
+
+    Works from plain threads and from inside a running event loop alike, so
+    the synchronous TallyClient wrappers keep working in `async def` handlers.
+    """
+    return submit(coro).result(timeout)
@@ -0,0 +1,89 @@
+# agent/src/tally/singleflight.py
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls into one in-flight execution.
+
+    The first caller for a key runs the work; everyone arriving before it
+    finishes awaits the same result object. Results are handed over through a
+    thread-safe future, so callers on different event loops (the FastAPI loop
+    and the sync bridge loop) are coalesced too.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]], label: str = 'default') -> Any:
+        """Runs `fn` unless an identical call is in flight, then shares its result.
+
+        The work runs in its own task, so a caller that is cancelled (the
+        first one included) stops waiting without cancelling it for the rest.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+            self._counters[label]['executed' if leader else 'coalesced'] += 1
+
+        if leader:
+            task = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._settle(key, future, done))
+        # Shield so a cancelled caller does not cancel the shared future
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def _settle(self, key: str, future: concurrent.futures.Future, task: asyncio.Task) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        if task.cancelled():
+            # Only loop shutdown cancels the task; callers see an error, not a cancellation of their own
+            future.set_exception(RuntimeError(f"Shared call {key} was cancelled"))
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._inflight)
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns how many calls ran upstream and how many were deduplicated."""
+        with self._lock:
+            operations = {label: dict(counts) for label, counts in self._counters.items()}
+            in_flight = len(self._inflight)
+        executed = sum(counts.get('executed', 0) for counts in operations.values())
+        coalesced = sum(counts.get('coalesced', 0) for counts in operations.values())
+        total = executed + coalesced
+        return {
+            'executed': executed,
+            'coalesced': coalesced,
+            'dedup_rate': coalesced / total if total else 0.0,
+            'in_flight': in_flight,
+            'operations': operations,
+        }
+
+
+_default_single_flight: Optional[SingleFlight] = None
+_default_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """Returns the process-wide coalescer shared by every TallyClient."""
+    global _default_single_flight
+    with _default_single_flight_lock:
+        if _default_single_flight is None:
+            _default_single_flight = SingleFlight()
+        return _default_single_flight
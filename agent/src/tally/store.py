@@ -0,0 +1,144 @@
+# agent/src/tally/store.py
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    operation TEXT NOT NULL,
+    response TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+class ResponseStore:
+    """On-disk store of Tally responses shared by every worker process.
+
+    Uses SQLite in WAL mode so that any number of processes can read while one
+    writes. Each thread keeps its own connection. Rows carry the wall-clock
+    time they were fetched at, so freshness survives restarts.
+    """
+
+    def __init__(self, path: str, max_stale: float = 86400.0, busy_timeout_ms: int = 5000):
+        """Initialize the store.
+
+        Args:
+            path: SQLite database file, created if missing
+            max_stale: Oldest response age in seconds served as a fallback when Tally is down
+            busy_timeout_ms: How long a writer waits for another process's write lock
+        """
+        self.path = path
+        self.max_stale = max_stale
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute(_SCHEMA)
+        conn.commit()
+        logger.info(f"Using Tally response store at {path}")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Returns (response, age in seconds) for a key, or None if absent or unreadable."""
+        try:
+            row = self._connection().execute(
+                "SELECT response, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Response store read error: {str(e)}")
+            return None
+        if row is None:
+            return None
+        return json.loads(row[0]), max(0.0, time.time() - row[1])
+
+    def put(self, key: str, operation: str, response: Any, fetched_at: Optional[float] = None) -> None:
+        """Stores a response, keeping whichever copy was fetched most recently."""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        conn = self._connection()
+        try:
+            conn.execute(
+                """
+                INSERT INTO responses (key, operation, response, fetched_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    operation = excluded.operation,
+                    response = excluded.response,
+                    fetched_at = excluded.fetched_at
+                WHERE excluded.fetched_at >= responses.fetched_at
+                """,
+                (key, operation, json.dumps(response, separators=(',', ':')), fetched_at)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error(f"Response store write error: {str(e)}")
+
+    def scan(self, prefix: str) -> List[Tuple[str, Any]]:
+        """Returns (key, response) for every key starting with prefix."""
+        try:
+            rows = self._connection().execute(
+                "SELECT key, response FROM responses WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Response store read error: {str(e)}")
+            return []
+        return [(key, json.loads(response)) for key, response in rows]
+
+    def delete(self, key: str) -> None:
+        conn = self._connection()
+        try:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error(f"Response store write error: {str(e)}")
+
+    def prune(self, max_age: Optional[float] = None) -> int:
+        """Deletes responses older than max_age (defaults to max_stale); returns the count."""
+        cutoff = time.time() - (self.max_stale if max_age is None else max_age)
+        conn = self._connection()
+        cursor = conn.execute("DELETE FROM responses WHERE fetched_at < ?", (cutoff,))
+        conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Closes the calling thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_default_store: Optional[ResponseStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_response_store() -> Optional[ResponseStore]:
+    """Returns the process-wide store if TALLY_STORE_PATH is set, else None."""
+    global _default_store
+    path = os.getenv('TALLY_STORE_PATH')
+    if not path:
+        return None
+    with _default_store_lock:
+        if _default_store is None or _default_store.path != path:
+            _default_store = ResponseStore(path, max_stale=float(os.getenv('TALLY_STORE_MAX_STALE', '86400')))
+        return _default_store
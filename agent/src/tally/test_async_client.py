@@ -0,0 +1,101 @@
+# test_async_client.py
+
+import json
+import httpx
+import pytest
+from agent.src.tally.client import TallyClient
+from agent.src.tally import session as tally_session
+
+
+def make_handler(calls: list, status_code: int = 200):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        calls.append(body)
+        if 'organization(' in body['query']:
+            return httpx.Response(status_code, json={"data": {"organization": {"id": "1", "name": "Gloom"}}})
+        return httpx.Response(status_code, json={"data": {"organizations": {"nodes": [
+            {"id": "1", "slug": "gloom", "name": "Gloom", "chainIds": ["eip155:8453"], "tokenIds": []}
+        ]}}})
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_async_client_reuses_session(tally_client):
+    calls = []
+    session = httpx.AsyncClient(transport=httpx.MockTransport(make_handler(calls)))
+    client = tally_client(session=session)
+
+    orgs = await client.get_organizations()
+    org = await client.get_organization("gloom")
+
+    assert len(calls) == 2
+    assert org["data"]["organization"]["name"] == "Gloom"
+    # Major DAO token ids are still backfilled
+    assert orgs["data"]["organizations"]["nodes"][0]["tokenIds"] == [client.major_daos["gloom"]["token_id"]]
+    assert not session.is_closed
+    await session.aclose()
+
+
+def test_sync_wrapper_from_plain_thread(tally_client):
+    calls = []
+    client = tally_client(make_handler(calls), TallyClient)
+
+    result = client.get_organization("gloom")
+
+    assert result["data"]["organization"]["id"] == "1"
+    assert calls[0]["variables"] == {"input": {"slug": "gloom"}}
+
+
+@pytest.mark.asyncio
+async def test_sync_wrapper_inside_running_loop(tally_client):
+    client = tally_client(make_handler([]), TallyClient)
+
+    assert client.get_organization("gloom")["data"]["organization"]["name"] == "Gloom"
+
+
+@pytest.mark.asyncio
+async def test_graphql_errors_return_none(tally_client):
+    def handler(request):
+        return httpx.Response(200, json={"errors": [{"message": "bad"}]})
+
+    client = tally_client(handler)
+    assert await client.get_organization("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_delegate_lookups_are_batched_by_alias(tally_client):
+    calls = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        calls.append(body)
+        data = {}
+        for alias, variables in body['variables'].items():
+            org_id = variables['organizationId']
+            # Odd organizations have no delegate record for the address
+            data[alias.replace('input', 'd')] = None if org_id % 2 else {"delegatorsCount": org_id, "votesCount": "1"}
+        return httpx.Response(200, json={"data": data, "errors": [{"message": "delegate not found"}]})
+
+    client = tally_client(handler)
+    result = await client.get_delegate_info_many("0xabc", list(range(1, 26)), batch_size=10)
+
+    assert len(calls) == 3
+    assert all('GetDelegateBatch' in call['query'] for call in calls)
+    assert set(result) == set(range(1, 26))
+    assert result[4] == {"delegatorsCount": 4, "votesCount": "1"}
+    assert result[5] is None
+
+
+@pytest.mark.asyncio
+async def test_session_settings_are_read_when_the_session_is_created(monkeypatch):
+    # As if .env were loaded after the module was imported
+    monkeypatch.setenv("TALLY_MAX_CONNECTIONS", "3")
+    monkeypatch.setenv("TALLY_TIMEOUT", "2.5")
+    monkeypatch.setattr(tally_session, "_overrides", {"max_keepalive_connections": 1})
+
+    session = tally_session._create_session()
+
+    pool = session._transport._pool
+    assert (pool._max_connections, pool._max_keepalive_connections) == (3, 1)
+    assert session.timeout.connect == 2.5
+    await session.aclose()
@@ -0,0 +1,90 @@
+# test_cache.py
+
+import asyncio
+import json
+import httpx
+import pytest
+from agent.src.tally.cache import ResponseCache, make_key, FRESH, STALE, MISS
+from agent.src.tally.client import MAJOR_DAOS, ORGANIZATION_QUERY, ORGANIZATIONS_QUERY
+from agent.src.tally.store import ResponseStore
+
+
+def counting_handler(calls: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(json.loads(request.content))
+        return httpx.Response(200, json={"data": {"organization": {"id": "1", "name": f"Gloom v{len(calls)}"}}})
+    return handler
+
+
+def test_key_ignores_whitespace_and_variable_order():
+    assert make_key("query A {\n  x\n}", {"b": 1, "a": 2}) == make_key("query A { x }", {"a": 2, "b": 1})
+
+
+def test_ttl_expiry_and_lru_eviction():
+    cache = ResponseCache(ttls={"GetDAOData": 10}, max_entries=2)
+    cache.set("a", ORGANIZATION_QUERY, 1, now=0)
+    cache.set("b", ORGANIZATION_QUERY, 2, now=0)
+    assert cache.get("a", now=5) == (FRESH, 1)  # "a" becomes most recently used
+    cache.set("c", ORGANIZATION_QUERY, 3, now=5)
+
+    assert cache.get("b", now=5) == (MISS, None)
+    assert cache.get("a", now=11) == (MISS, None)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_stale_window():
+    cache = ResponseCache(ttls={"GetDAOData": 10}, stale_while_revalidate=30)
+    cache.set("a", ORGANIZATION_QUERY, 1, now=0)
+    assert cache.get("a", now=20) == (STALE, 1)
+    assert cache.get("a", now=41) == (MISS, None)
+
+
+@pytest.mark.asyncio
+async def test_client_serves_repeat_queries_from_cache(tally_client):
+    calls = []
+    cache = ResponseCache()
+    client = tally_client(counting_handler(calls), cache=cache)
+
+    first = await client.get_organization("gloom")
+    second = await client.get_organization("gloom")
+
+    assert first is second
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["operations"]["GetDAOData"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_value_is_served_and_refreshed_in_background(tally_client):
+    calls = []
+    cache = ResponseCache(ttls={"GetDAOData": 0.01}, stale_while_revalidate=60)
+    client = tally_client(counting_handler(calls), cache=cache)
+
+    await client.get_organization("gloom")
+    await asyncio.sleep(0.02)
+    stale = await client.get_organization("gloom")
+    assert stale["data"]["organization"]["name"] == "Gloom v1"
+
+    await asyncio.sleep(0.01)
+    assert len(calls) == 2
+    assert cache.stats()["refreshes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_organizations_are_backfilled_before_caching(tally_client, tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        nodes = [{"id": "1", "slug": "seamless-protocol", "tokenIds": []}, {"id": "2", "slug": "small-dao", "tokenIds": []}]
+        return httpx.Response(200, json={"data": {"organizations": {"nodes": nodes}}})
+
+    store = ResponseStore(str(tmp_path / "tally.db"))
+    client = tally_client(handler, cache=ResponseCache(), store=store)
+    await client.get_organizations()
+
+    variables = {"input": {"filters": {"chainId": "eip155:8453"}}}
+    state, cached = client.cache.get(make_key(ORGANIZATIONS_QUERY, variables))
+    assert state == FRESH
+    assert cached["data"]["organizations"]["nodes"][0]["tokenIds"] == [MAJOR_DAOS["seamless-protocol"]["token_id"]]
+    assert cached["data"]["organizations"]["nodes"][1]["tokenIds"] == []
+    # The persisted copy carries the backfill too, so a restarted process serves it unchanged
+    assert store.get(make_key(ORGANIZATIONS_QUERY, variables))[0] == cached
@@ -0,0 +1,55 @@
+# test_catalog.py
+
+import pytest
+from agent.src.tally.catalog import OrganizationCatalog
+from agent.src.tally.client import MAJOR_DAOS
+
+GLOOM = {"id": "1", "slug": "gloom", "name": "Gloom", "chainIds": ["eip155:8453"],
+         "tokenIds": [MAJOR_DAOS["gloom"]["token_id"]]}
+AAVE = {"id": "2", "slug": "aave", "name": "Aave", "chainIds": ["eip155:8453", "eip155:1"], "tokenIds": []}
+
+
+class FakeClient:
+    def __init__(self, pages, fail=False):
+        self.pages = pages
+        self.fail = fail
+        self.calls = 0
+
+    async def iter_organizations(self, chain_id):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("Tally unavailable")
+        for org in self.pages:
+            yield org
+
+
+@pytest.mark.asyncio
+async def test_lookups_after_load():
+    client = FakeClient([GLOOM, AAVE])
+    catalog = OrganizationCatalog(client_factory=lambda: client)
+
+    assert catalog.get_by_slug("gloom") is None
+    assert await catalog.ensure_loaded()
+    assert await catalog.ensure_loaded()
+
+    assert client.calls == 1
+    assert catalog.get_by_slug("gloom") is GLOOM
+    assert catalog.get_by_id(2) is AAVE
+    assert catalog.by_chain("1") == [AAVE]
+    assert catalog.by_chain("eip155:8453") == [GLOOM, AAVE]
+    assert catalog.by_token("8453", MAJOR_DAOS["gloom"]["token_id"].split(":")[-1].lower()) == [GLOOM]
+    assert catalog.by_token_id(MAJOR_DAOS["gloom"]["token_id"]) == [GLOOM]
+    assert catalog.stats()["organizations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_previous_generation():
+    client = FakeClient([GLOOM])
+    catalog = OrganizationCatalog(client_factory=lambda: client)
+    await catalog.refresh()
+
+    client.fail = True
+    assert not await catalog.refresh()
+
+    assert catalog.get_by_slug("gloom") is GLOOM
+    assert catalog.stats()["failures"] == 1
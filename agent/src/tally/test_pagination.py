@@ -0,0 +1,65 @@
+# test_pagination.py
+
+import json
+import httpx
+import pytest
+from agent.src.tally.client import TallyClient
+
+
+def paged_handler(total: int, requests_seen: list):
+    """Serves `total` delegates in pages, honoring afterCursor/limit like Tally."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        page = body['variables']['input']['page']
+        requests_seen.append(page)
+        start = int(page.get('afterCursor', 0))
+        end = min(start + page['limit'], total)
+        nodes = [{"id": str(i)} for i in range(start, end)]
+        page_info = {"firstCursor": str(start), "lastCursor": str(end) if nodes else None, "count": len(nodes)}
+        return httpx.Response(200, json={"data": {"delegates": {"nodes": nodes, "pageInfo": page_info}}})
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_async_iterator_follows_cursors(tally_client):
+    seen = []
+    client = tally_client(paged_handler(45, seen))
+
+    ids = [node["id"] async for node in client.iter_delegates("1", page_size=20)]
+
+    assert ids == [str(i) for i in range(45)]
+    assert seen == [{"limit": 20}, {"limit": 20, "afterCursor": "20"}, {"limit": 20, "afterCursor": "40"}]
+
+
+def test_sync_iterator_follows_cursors(tally_client):
+    seen = []
+    client = tally_client(paged_handler(40, seen), TallyClient)
+
+    ids = [node["id"] for node in client.iter_delegates("1", page_size=20)]
+
+    assert ids == [str(i) for i in range(40)]
+    # Exactly-full last page needs one extra empty request to detect the end
+    assert len(seen) == 3
+
+
+def test_sync_iterator_stops_early_without_draining(tally_client):
+    seen = []
+    client = tally_client(paged_handler(1000, seen), TallyClient)
+
+    iterator = client.iter_delegates("1", page_size=10)
+    first = [next(iterator) for _ in range(5)]
+    iterator.close()
+
+    assert [node["id"] for node in first] == ["0", "1", "2", "3", "4"]
+    # Only the current page and one prefetched page were requested
+    assert len(seen) <= 2
+
+
+@pytest.mark.asyncio
+async def test_failed_page_raises_instead_of_truncating(tally_client):
+    def handler(request):
+        return httpx.Response(200, json={"errors": [{"message": "boom"}]})
+
+    client = tally_client(handler)
+    with pytest.raises(RuntimeError):
+        [node async for node in client.iter_proposals("1")]
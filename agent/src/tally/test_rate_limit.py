@@ -0,0 +1,62 @@
+# test_rate_limit.py
+
+import asyncio
+import time
+import httpx
+import pytest
+from agent.src.tally.rate_limit import RateLimiter, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+@pytest.mark.asyncio
+async def test_bucket_paces_requests_after_burst():
+    limiter = RateLimiter(rate=50, capacity=2, jitter=0)
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+    elapsed = time.monotonic() - start
+
+    # Two burst tokens, then four more at 50/s
+    assert 0.07 <= elapsed < 0.5
+    assert limiter.stats()["acquired"] == 6
+
+
+@pytest.mark.asyncio
+async def test_throttle_pauses_all_callers():
+    limiter = RateLimiter(rate=1000, capacity=10, jitter=0)
+    limiter.throttle(0.1)
+    start = time.monotonic()
+    await limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_exhausted_budget_header_throttles():
+    limiter = RateLimiter(rate=1, capacity=1)
+    limiter.observe({"x-ratelimit-remaining": "0", "x-ratelimit-reset": "2"})
+    stats = limiter.stats()
+    assert stats["remaining_budget"] == 0
+    assert stats["blocked_for"] > 1.5
+
+
+@pytest.mark.asyncio
+async def test_client_honors_retry_after(tally_client):
+    responses = [httpx.Response(429, headers={"Retry-After": "0.05"}),
+                 httpx.Response(200, json={"data": {"organization": {"id": "1"}}})]
+
+    def handler(request):
+        return responses.pop(0)
+
+    limiter = RateLimiter(rate=1000, capacity=10, jitter=0)
+    client = tally_client(handler, rate_limiter=limiter)
+    start = time.monotonic()
+    result = await client.get_organization("gloom")
+
+    assert result == {"data": {"organization": {"id": "1"}}}
+    assert time.monotonic() - start >= 0.04
+    assert limiter.stats()["throttled"] == 1
@@ -0,0 +1,89 @@
+# test_singleflight.py
+
+import asyncio
+import json
+import httpx
+import pytest
+from agent.src.tally.client import TallyClient
+from agent.src.tally.singleflight import SingleFlight
+
+
+def slow_handler(calls: list):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(json.loads(request.content))
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"data": {"organization": {"id": "1", "name": "Gloom"}}})
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_identical_queries_share_one_request_without_cache(tally_client):
+    calls = []
+    flight = SingleFlight()
+    client = tally_client(slow_handler(calls), single_flight=flight)
+
+    results = await asyncio.gather(*(client.get_organization("gloom") for _ in range(20)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    stats = flight.stats()
+    assert stats["executed"] == 1 and stats["coalesced"] == 19
+    assert stats["operations"]["GetDAOData"]["coalesced"] == 19
+    assert flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_different_variables_are_not_coalesced(tally_client):
+    calls = []
+    client = tally_client(slow_handler(calls), single_flight=SingleFlight())
+
+    await asyncio.gather(client.get_organization("gloom"), client.get_organization("seamless-protocol"))
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_followers_on_another_loop_share_result(tally_client):
+    calls = []
+    flight = SingleFlight()
+    async_client = tally_client(slow_handler(calls), single_flight=flight)
+    sync_client = tally_client(slow_handler(calls), TallyClient, single_flight=flight)
+
+    leader = asyncio.ensure_future(async_client.get_organization("gloom"))
+    await asyncio.sleep(0.01)
+    follower = await asyncio.to_thread(sync_client.get_organization, "gloom")
+
+    assert follower is await leader
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_caller():
+    flight = SingleFlight()
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(*(flight.do("k", boom) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_leader_timeout_does_not_cancel_followers():
+    flight = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    leader = asyncio.ensure_future(asyncio.wait_for(flight.do("k", slow), timeout=0.01))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do("k", slow))
+    results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+    assert isinstance(results[0], asyncio.TimeoutError)
+    assert results[1] == "ok"
+    assert flight.in_flight() == 0
@@ -0,0 +1,77 @@
+# test_store.py
+
+import json
+import time
+import httpx
+import pytest
+from agent.src.tally.cache import ResponseCache, make_key
+from agent.src.tally.client import ORGANIZATION_QUERY
+from agent.src.tally.store import ResponseStore
+
+
+def org_handler(calls: list, fail: bool = False):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(json.loads(request.content))
+        if fail:
+            return httpx.Response(503, text="unavailable")
+        return httpx.Response(200, json={"data": {"organization": {"id": "1", "name": "Gloom"}}})
+    return handler
+
+
+def test_store_round_trip_and_wal(tmp_path):
+    store = ResponseStore(str(tmp_path / "tally.db"))
+    store.put("k", "GetDAOData", {"data": {"x": 1}})
+
+    response, age = ResponseStore(str(tmp_path / "tally.db")).get("k")
+    assert response == {"data": {"x": 1}}
+    assert 0 <= age < 5
+    assert store._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_older_write_does_not_overwrite_newer(tmp_path):
+    store = ResponseStore(str(tmp_path / "tally.db"))
+    store.put("k", "GetDAOData", "new", fetched_at=time.time())
+    store.put("k", "GetDAOData", "old", fetched_at=time.time() - 100)
+    assert store.get("k")[0] == "new"
+
+
+def test_scan_by_prefix_and_delete(tmp_path):
+    store = ResponseStore(str(tmp_path / "tally.db"))
+    store.put("sub:a", "Subscription", {"n": 1})
+    store.put("sub:b", "Subscription", {"n": 2})
+    store.put("sub_c", "Subscription", {"n": 3})
+
+    assert sorted(store.scan("sub:")) == [("sub:a", {"n": 1}), ("sub:b", {"n": 2})]
+    store.delete("sub:a")
+    assert store.get("sub:a") is None
+    assert store.scan("sub:") == [("sub:b", {"n": 2})]
+
+
+@pytest.mark.asyncio
+async def test_new_process_starts_hot(tally_client, tmp_path):
+    path = str(tmp_path / "tally.db")
+    first_calls, second_calls = [], []
+    first = tally_client(org_handler(first_calls), cache=ResponseCache(), store=ResponseStore(path))
+    await first.get_organization("gloom")
+
+    # A fresh cache stands in for a new worker process
+    second = tally_client(org_handler(second_calls), cache=ResponseCache(), store=ResponseStore(path))
+    result = await second.get_organization("gloom")
+
+    assert result["data"]["organization"]["name"] == "Gloom"
+    assert second_calls == []
+    assert second.cache.stats()["store_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_fallback_when_tally_is_down(tally_client, tmp_path):
+    store = ResponseStore(str(tmp_path / "tally.db"))
+    client = tally_client(org_handler([], fail=True), cache=ResponseCache(), store=store)
+    # Seed an entry far older than the TTL and stale window
+    store.put(make_key(ORGANIZATION_QUERY, {"input": {"slug": "gloom"}}), "GetDAOData",
+              {"data": {"organization": {"name": "Old Gloom"}}}, fetched_at=time.time() - 3600)
+
+    result = await client.get_organization("gloom")
+
+    assert result["data"]["organization"]["name"] == "Old Gloom"
+    assert client.cache.stats()["fallbacks"] == 1
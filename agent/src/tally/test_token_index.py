@@ -0,0 +1,26 @@
+# test_token_index.py
+
+from agent.src.tally.client import MAJOR_DAOS
+from agent.src.tally.token_index import TokenIndex, parse_token_id
+
+GLOOM = {"slug": "gloom", "tokenIds": [MAJOR_DAOS["gloom"]["token_id"]]}
+SEAMLESS = {"slug": "seamless-protocol", "tokenIds": [MAJOR_DAOS["seamless-protocol"]["token_id"], "not-a-token"]}
+
+
+def test_parse_token_id_checksums_the_address():
+    assert parse_token_id("eip155:8453/erc20:0xbb5d04c40fa063faf213c4e0b8086655164269ef") == (
+        "eip155:8453", "0xbb5D04c40Fa063FAF213c4E0B8086655164269Ef"
+    )
+    assert parse_token_id("eip155:8453/erc20:0x123") is None
+
+
+def test_lookup_is_exact_and_case_insensitive():
+    index = TokenIndex([GLOOM, SEAMLESS])
+
+    assert index.lookup("eip155:8453", "0xBB5D04C40FA063FAF213C4E0B8086655164269EF") == [GLOOM]
+    assert index.lookup("8453", "0x1c7a460413dd4e964f96d8dfc56e7223ce88cd85") == [SEAMLESS]
+    # Same token on another chain, a prefix of a real address and garbage all miss
+    assert index.lookup("eip155:1", "0xbb5D04c40Fa063FAF213c4E0B8086655164269Ef") == []
+    assert index.lookup("eip155:8453", "0xbb5D04c40Fa063FAF213c4E0B808665516") == []
+    assert index.lookup("eip155:8453", "native") == []
+    assert len(index) == 2
@@ -0,0 +1,59 @@
+# agent/src/tally/token_index.py
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TokenKey = Tuple[str, str]
+
+
+def normalize_chain_id(chain_id: Any) -> str:
+    """Returns a CAIP-2 chain id, accepting bare EVM chain numbers like "8453"."""
+    chain_id = str(chain_id).strip().lower()
+    return chain_id if ':' in chain_id else f"eip155:{chain_id}"
+
+
+def normalize_address(address: str) -> Optional[str]:
+    """Returns the EIP-55 checksummed form of an address, or None if it is not one."""
+    # eth_utils takes ~0.2s to import; defer it until the first address is checked
+    from eth_utils import to_checksum_address
+    try:
+        return to_checksum_address(address.strip())
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def parse_token_id(token_id: str) -> Optional[TokenKey]:
+    """Splits a CAIP-19 token id such as "eip155:8453/erc20:0xabc..." into (chain id, address)."""
+    if not token_id or '/' not in token_id:
+        return None
+    chain_id, asset = token_id.split('/', 1)
+    address = normalize_address(asset.rsplit(':', 1)[-1])
+    if address is None:
+        return None
+    return normalize_chain_id(chain_id), address
+
+
+class TokenIndex:
+    """Maps (chain id, checksummed token address) to the organizations governed by that token."""
+
+    def __init__(self, organizations: Iterable[Dict[str, Any]] = ()):
+        self._orgs: Dict[TokenKey, List[Dict[str, Any]]] = {}
+        for org in organizations:
+            for token_id in org.get('tokenIds') or []:
+                key = parse_token_id(token_id)
+                if key is None:
+                    logger.warning(f"Skipping unparseable token id {token_id} for DAO {org.get('slug')}")
+                    continue
+                self._orgs.setdefault(key, []).append(org)
+
+    def lookup(self, chain_id: Any, token_address: str) -> List[Dict[str, Any]]:
+        """Returns the organizations for a held token, or [] if none match exactly."""
+        address = normalize_address(token_address)
+        if address is None:
+            return []
+        return self._orgs.get((normalize_chain_id(chain_id), address), [])
+
+    def __len__(self) -> int:
+        return len(self._orgs)
@@ -0,0 +1,80 @@
+# benchmarks/import_time.py
+"""Tracks `python -X importtime` cost of each entry point against a budget.
+
+Run from the repository root:
+
+    python benchmarks/import_time.py             # every entry point, 5 runs each
+    python benchmarks/import_time.py --top 15 main
+
+Reports the median cumulative import time of each module, and fails when it
+exceeds the module's budget or when a heavy dependency that should only load
+on demand (the LLM, agent and CDP stacks) is imported eagerly.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Entry point -> budget in seconds for its cumulative import time
+BUDGETS = {
+    "main": 0.6,
+    "agent.src.api.delegation_api": 0.6,
+    "agent.src.api.chat_api": 0.6,
+}
+# Packages that must only be imported when an agent or analysis is built
+DEFERRED = ("langchain_openai", "langgraph", "cdp", "cdp_langchain", "cdp_agentkit_core", "eth_utils", "eth_account")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_profile(module: str) -> List[Tuple[str, int]]:
+    """Imports the module in a fresh interpreter; returns (module, cumulative microseconds) rows."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(cumulative)))
+    return rows
+
+
+def measure(module: str, runs: int) -> Tuple[float, Dict[str, int]]:
+    """Median seconds to import the module, and the slowest imports of the last run."""
+    timings = []
+    for _ in range(runs):
+        rows = import_profile(module)
+        timings.append(dict(rows)[module] / 1e6)
+    return statistics.median(timings), dict(rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=list(BUDGETS))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=0, help="also list the N slowest imports of each module")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        median, profile = measure(module, args.runs)
+        budget = BUDGETS.get(module)
+        eager = sorted({name.split(".")[0] for name in profile} & set(DEFERRED))
+        ok = (budget is None or median <= budget) and not eager
+        failed |= not ok
+        budget_text = f"budget {budget:.2f}s" if budget is not None else "no budget"
+        print(f"{module:32s} median {median:.3f}s  {budget_text}  {'ok' if ok else 'FAIL'}")
+        if eager:
+            print(f"  eagerly imports: {', '.join(eager)}")
+        for name, cumulative in sorted(profile.items(), key=lambda item: -item[1])[1:args.top + 1]:
+            print(f"  {cumulative / 1e6:7.3f}s  {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
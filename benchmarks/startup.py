@@ -0,0 +1,84 @@
+# benchmarks/startup.py
+"""Measures cold start: seconds from spawning uvicorn until /health answers 200.
+
+Run from the repository root:
+
+    python benchmarks/startup.py            # every app, 3 runs each
+    python benchmarks/startup.py --runs 5 --budget 1.0 main:app
+
+Exits non-zero when the median time to /health exceeds the budget.
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import httpx
+
+APPS = [
+    "main:app",
+    "agent.src.api.chat_api:app",
+    "agent.src.api.delegation_api:app",
+]
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(url: str, deadline: float) -> bool:
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url, timeout=0.5).status_code == 200:
+                return True
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.01)
+    return False
+
+
+def time_to_health(app: str, timeout: float) -> float:
+    """Starts one uvicorn process for the app and returns seconds until /health is 200."""
+    port = free_port()
+    started = time.monotonic()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        if not wait_for(f"http://127.0.0.1:{port}/health", started + timeout):
+            raise RuntimeError(f"{app} did not serve /health within {timeout}s")
+        return time.monotonic() - started
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("apps", nargs="*", default=APPS)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=1.0, help="seconds allowed for the median start")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    over_budget = False
+    for app in args.apps:
+        timings = [time_to_health(app, args.timeout) for _ in range(args.runs)]
+        median = statistics.median(timings)
+        verdict = "ok" if median <= args.budget else "OVER BUDGET"
+        over_budget |= median > args.budget
+        print(f"{app:40s} median {median:.3f}s  min {min(timings):.3f}s  max {max(timings):.3f}s  {verdict}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
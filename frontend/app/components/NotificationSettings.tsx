@@ -1,4 +1,5 @@
 import { useState } from 'react';
+import { useSignMessage } from 'wagmi';
 import { Bell, BellOff, Settings } from 'lucide-react';
 import { NotificationPreferences } from '../types/notifications';
 import { subscribeToNotifications, unsubscribeFromNotifications } from '../services/notifications';
@@ -8,6 +9,8 @@ interface NotificationSettingsProps {
 }
 
 export function NotificationSettings({ address }: NotificationSettingsProps) {
+    const { signMessageAsync } = useSignMessage();
+    const signMessage = (message: string) => signMessageAsync({ message });
     const [isSubscribed, setIsSubscribed] = useState(false);
     const [webhookUrl, setWebhookUrl] = useState('');
     const [showForm, setShowForm] = useState(false);
@@ -29,7 +32,7 @@ export function NotificationSettings({ address }: NotificationSettingsProps) {
             await subscribeToNotifications(address, {
                 ...preferences,
                 discordWebhookUrl: webhookUrl
-            });
+            }, signMessage);
 
             setIsSubscribed(true);
             setShowForm(false);
@@ -41,7 +44,7 @@ export function NotificationSettings({ address }: NotificationSettingsProps) {
 
     const handleUnsubscribe = async () => {
         try {
-            await unsubscribeFromNotifications(address);
+            await unsubscribeFromNotifications(address, signMessage);
             setIsSubscribed(false);
             setWebhookUrl('');
         } catch (error) {
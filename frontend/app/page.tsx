@@ -18,7 +18,7 @@ import {
 import { useAccount } from 'wagmi';
 import { getTokenHoldings } from './services/tokens';
 import { getDelegations } from './services/delegations';
-import { getDaoUpdates } from './services/updates';
+import { getDaoUpdates, streamDaoUpdates } from './services/updates';
 import { UpdateCard } from './components/UpdateCard';
 import { NotificationSettings } from './components/NotificationSettings';
 import type { DelegationResponse, DelegationsData, DaoUpdate } from './types/delegations';
@@ -46,6 +46,7 @@ export default function App() {
         const holdings = await getTokenHoldings(address);
         const data = await getDelegations(address, holdings);
         setDelegationsData(data);
+        setLoading(false);
 
         const daoSlugs = [
           ...data.active_delegations.map(d => d.dao_slug),
@@ -53,8 +54,15 @@ export default function App() {
         ];
 
         if (daoSlugs.length > 0) {
-          const updatesData = await getDaoUpdates(daoSlugs, holdings);
-          setUpdates(updatesData);
+          // Show each DAO's updates as soon as the server has them
+          setUpdates([]);
+          try {
+            await streamDaoUpdates(daoSlugs, update => setUpdates(prev => [...prev, update]), holdings);
+          } catch (streamError) {
+            console.error('Streaming updates failed, fetching them at once:', streamError);
+            const updatesData = await getDaoUpdates(daoSlugs, holdings);
+            setUpdates(updatesData);
+          }
         }
       } catch (err) {
         console.error('Error fetching data:', err);
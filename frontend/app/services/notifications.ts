@@ -1,10 +1,22 @@
 import { NotificationPreferences } from '../types/notifications';
 
+// Signs a message with the connected wallet (EIP-191 personal_sign)
+export type SignMessage = (message: string) => Promise<string>;
+
+// Must match ownership_message() in agent/src/ai/notifications.py
+async function ownershipProof(action: 'subscribe' | 'unsubscribe', address: string, signMessage: SignMessage) {
+    const timestamp = Math.floor(Date.now() / 1000);
+    const signature = await signMessage(`Tabula notifications: ${action} ${address.toLowerCase()} at ${timestamp}`);
+    return { signature, timestamp };
+}
+
 export async function subscribeToNotifications(
     address: string,
-    preferences: NotificationPreferences
+    preferences: NotificationPreferences,
+    signMessage: SignMessage
 ): Promise<boolean> {
     try {
+        const proof = await ownershipProof('subscribe', address, signMessage);
         const response = await fetch('http://localhost:8000/api/notifications/subscribe', {
             method: 'POST',
             headers: {
@@ -13,6 +25,7 @@ export async function subscribeToNotifications(
             body: JSON.stringify({
                 address,
                 preferences,
+                ...proof,
             }),
         });
 
@@ -27,10 +40,15 @@ export async function subscribeToNotifications(
     }
 }
 
-export async function unsubscribeFromNotifications(address: string): Promise<boolean> {
+export async function unsubscribeFromNotifications(address: string, signMessage: SignMessage): Promise<boolean> {
     try {
+        const proof = await ownershipProof('unsubscribe', address, signMessage);
         const response = await fetch(`http://localhost:8000/api/notifications/unsubscribe/${address}`, {
             method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(proof),
         });
 
         if (!response.ok) {
@@ -42,4 +60,4 @@ export async function unsubscribeFromNotifications(address: string): Promise<boo
         console.error('Error unsubscribing from notifications:', error);
         throw error;
     }
-}
\ No newline at end of file
+}
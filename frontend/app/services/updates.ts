@@ -38,4 +38,63 @@ export async function getDaoUpdates(daoSlugs: string[], tokenHoldings?: TokenHol
         console.error('Error fetching DAO updates:', error);
         throw error;
     }
-}
\ No newline at end of file
+}
+
+export interface UpdatesStreamSummary {
+    total_updates: number;
+    daos: Record<string, { status: 'ok' | 'timeout' | 'error'; updates: number }>;
+    elapsed_ms: number;
+}
+
+export async function streamDaoUpdates(
+    daoSlugs: string[],
+    onUpdate: (update: DaoUpdate) => void,
+    tokenHoldings?: TokenHolding[]
+): Promise<UpdatesStreamSummary | null> {
+    const formattedHoldings = tokenHoldings?.reduce((acc, holding) => {
+        acc[holding.token_address] = holding.balance;
+        return acc;
+    }, {} as Record<string, string>);
+
+    const response = await fetch('http://localhost:8000/api/updates/stream', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'Accept': 'application/x-ndjson',
+        },
+        body: JSON.stringify({
+            dao_slugs: daoSlugs,
+            token_holdings: formattedHoldings || {}
+        })
+    });
+
+    if (!response.ok || !response.body) {
+        throw new Error(`API error: ${response.status}`);
+    }
+
+    // Each line is one frame: {"type": "update" | "summary", "data": ...}
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let summary: UpdatesStreamSummary | null = null;
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        const lines = buffer.split('\n');
+        buffer = lines.pop() ?? '';
+        for (const line of lines) {
+            if (!line.trim()) continue;
+            const frame = JSON.parse(line);
+            if (frame.type === 'update') {
+                onUpdate(frame.data as DaoUpdate);
+            } else if (frame.type === 'summary') {
+                summary = frame.data as UpdatesStreamSummary;
+            }
+        }
+    }
+
+    return summary;
+}
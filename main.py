@@ -1,14 +1,35 @@
 # main.py
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from typing import Optional
 import uvicorn
 import os
 
-# Import your existing agent
-from agent.src.ai.governance_chatbot import DAOAgent
+from agent.src.ai.lazy_agent import LazyAgent
+from agent.src.api.streaming import stream_frames
+from agent.src.config import configure
 
-app = FastAPI()
+configure()
+
+def create_agent():
+    # Imported here so the app can serve /health before langchain and CDP load
+    from agent.src.ai.chatbot_agent import DAOAgent
+    return DAOAgent()
+
+# Your existing agent, built on first use
+agent = LazyAgent(create_agent, name="DAO Agent")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Optionally build the agent in the background right after startup
+    if os.getenv("AGENT_WARMUP", "").lower() in ("1", "true", "yes"):
+        agent.warmup()
+    yield
+
+app = FastAPI(lifespan=lifespan)
 
 # CORS middleware
 app.add_middleware(
@@ -19,27 +40,50 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize agent
-agent = DAOAgent()
-
 class ChatRequest(BaseModel):
     text: str
+    address: Optional[str] = None  # Wallet address selecting the conversation thread
+
+def conversation_key(request: ChatRequest, http_request: Request) -> str:
+    """The caller's conversation thread: their wallet address, else their client address."""
+    if request.address:
+        return request.address
+    client = http_request.client
+    return f"client:{client.host if client else 'unknown'}"
 
 class ChatResponse(BaseModel):
     text: str
 
 @app.post("/poke")
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, http_request: Request):
     try:
-        response = await agent.chat(request.text)
-        return ChatResponse(text=response)
+        response = await (await agent.aget()).chat(request.text, address=conversation_key(request, http_request))
+        return ChatResponse(text=response.message)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/poke/stream")
+async def chat_stream(request: ChatRequest, http_request: Request):
+    """Stream the reply token by token as NDJSON, or as Server-Sent Events when requested."""
+    try:
+        dao_agent = await agent.aget()
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return stream_frames(dao_agent.astream_chat(request.text, address=conversation_key(request, http_request)),
+                         http_request)
+
 @app.get("/health")
 def health_check():
+    """Liveness: the process is up, whether or not the agent is built yet."""
     return {"status": "healthy"}
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: 200 once the agent can serve chats; starts building it if nothing has."""
+    if agent.status()["status"] in ("idle", "error"):
+        agent.warmup()
+    return JSONResponse(agent.status(), status_code=200 if agent.ready else 503)
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", "3000"))
     uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
@@ -12,5 +12,8 @@ setup(
         "langchain-openai>=0.0.1",
         "python-dotenv>=1.0.0",
         "requests>=2.31.0",
+        "httpx>=0.25.0",
+        "eth-utils>=2.0.0",
+        "eth-account>=0.10.0",
     ],
 )
\ No newline at end of file